@@ -0,0 +1,89 @@
+"""Compare peak memory of `get_mods(page_size="max")` and the streaming `iter_mods`
+on a large synthetic catalog served from a local HTTP server.
+
+Usage: python -m benchmarks.bench_catalog_stream [mods_count]
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import sys
+import threading
+import time
+import tracemalloc
+
+from f_manager_core.factorio import api
+from f_manager_core.factorio.client import PortalClient, set_default_client
+
+COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 30000
+
+
+def synthetic_result(i: int) -> dict:
+    return {
+        "downloads_count": i * 7,
+        "name": f"synthetic-mod-{i}",
+        "owner": f"author{i % 500}",
+        "summary": "A synthetic mod used to measure how much memory parsing takes. " * 3,
+        "title": f"Synthetic mod #{i}",
+        "category": "content",
+        "thumbnail": f"/assets/{i:040x}.thumb.png",
+        "latest_release": {
+            "download_url": f"/download/synthetic-mod-{i}/{i:024x}",
+            "file_name": f"synthetic-mod-{i}_1.1.{i % 100}.zip",
+            "info_json": {"factorio_version": "1.1"},
+            "released_at": "2023-03-01T12:34:56.789000Z",
+            "version": f"1.1.{i % 100}",
+            "sha1": f"{i:040x}",
+        },
+    }
+
+
+PAYLOAD = json.dumps(
+    {"pagination": None, "results": [synthetic_result(i) for i in range(COUNT)]}
+).encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, *args):
+        pass
+
+
+def load_all() -> int:
+    return len(api.get_mods("1.1", page_size="max").results)
+
+
+def stream() -> int:
+    return sum(1 for _ in api.iter_mods("1.1", page_size="max"))
+
+
+def measure(name, func):
+    tracemalloc.start()
+    started = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<10} {count} mods  peak {peak / 1024 / 1024:8.1f} MiB  ({elapsed:.2f}s)")
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api.MOD_PORTAL_BASE_URL = f"http://127.0.0.1:{server.server_port}"
+    set_default_client(PortalClient())
+
+    print(f"payload {len(PAYLOAD) / 1024 / 1024:.1f} MiB")
+    measure("get_mods", load_all)
+    measure("iter_mods", stream)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
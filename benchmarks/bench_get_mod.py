@@ -0,0 +1,82 @@
+"""Compare download throughput of the old 512-byte `iter_content` loop (plus a
+separate sha1 pass) with the buffered single-pass path used by `api.get_mod`.
+
+Usage: python -m benchmarks.bench_get_mod [size_in_MiB]
+"""
+
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+from pathlib import Path
+import sys
+import tempfile
+import threading
+import time
+
+import requests
+
+from f_manager_core.factorio import api
+
+SIZE = int(sys.argv[1]) * 1024 * 1024 if len(sys.argv) > 1 else 64 * 1024 * 1024
+PAYLOAD = os.urandom(SIZE)
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, *args):
+        pass
+
+
+def old_get_mod(base_url: str, filename: Path) -> str:
+    response = requests.get(f"{base_url}/download/mod", stream=True)
+    response.raise_for_status()
+    with filename.open("wb") as file:
+        for chunk in response.iter_content(chunk_size=512):
+            if chunk:
+                file.write(chunk)
+
+    hasher = hashlib.sha1()
+    with filename.open("rb") as file:
+        while chunk := file.read(1024 * 1024):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def new_get_mod(base_url: str, filename: Path, preallocate: bool = False) -> str:
+    api.MOD_PORTAL_BASE_URL = base_url
+    return api.get_mod("user", "token", "/download/mod", filename, preallocate=preallocate)
+
+
+def measure(name, func, *args, **kwargs):
+    started = time.perf_counter()
+    digest = func(*args, **kwargs)
+    elapsed = time.perf_counter() - started
+    print(f"{name:<28} {SIZE / elapsed / 1024 / 1024:10.1f} MiB/s  ({elapsed:.3f}s)")
+    return digest
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    expected = hashlib.sha1(PAYLOAD).hexdigest()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        target = Path(tmp).joinpath("mod.zip")
+        digests = [
+            measure("iter_content(512) + sha1", old_get_mod, base_url, target),
+            measure("readinto(1 MiB)", new_get_mod, base_url, target),
+            measure("readinto(1 MiB) preallocate", new_get_mod, base_url, target, True),
+        ]
+
+    server.shutdown()
+    assert all(digest == expected for digest in digests)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Compare memory and time of building `ModListResponse` and `LazyModListResponse`
+over a synthetic full-catalog response, reading only `name` and `title` of every mod.
+
+Usage: python -m benchmarks.bench_lazy_types [mods_count]
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+
+from f_manager_core.factorio.json_object_types import LazyModListResponse, ModListResponse
+
+COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 30000
+
+
+def release(i: int, n: int) -> dict:
+    return {
+        "download_url": f"/download/synthetic-mod-{i}/{n:024x}",
+        "file_name": f"synthetic-mod-{i}_1.1.{n}.zip",
+        "info_json": {"factorio_version": "1.1", "dependencies": ["base >= 1.1"]},
+        "released_at": f"2023-03-{n % 28 + 1:02d}T12:34:56.789000+00:00",
+        "version": f"1.1.{n}",
+        "sha1": f"{i * 100 + n:040x}",
+    }
+
+
+def synthetic_result(i: int) -> dict:
+    return {
+        "downloads_count": i * 7,
+        "name": f"synthetic-mod-{i}",
+        "owner": f"author{i % 500}",
+        "summary": "A synthetic mod used to measure parsing.",
+        "title": f"Synthetic mod #{i}",
+        "category": "content",
+        "created_at": "2021-01-01T00:00:00.000000+00:00",
+        "latest_release": release(i, 5),
+        "releases": [release(i, n) for n in range(6)],
+        "tag": [{"id": 1, "name": "logistics", "title": "Logistics", "description": "", "type": "t"}],
+    }
+
+
+PAYLOAD = json.dumps({"pagination": None, "results": [synthetic_result(i) for i in range(COUNT)]})
+
+
+def measure(name, response_type):
+    # both types keep the decoded JSON, so only memory allocated by the objects is measured
+    data = json.loads(PAYLOAD)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    response = response_type(data)
+    titles = [(result.name, result.title) for result in response.results]
+    elapsed = time.perf_counter() - started
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<20} {len(titles)} mods  {size / 1024 / 1024:8.1f} MiB  ({elapsed:.3f}s)")
+
+
+def main():
+    measure("ModListResponse", ModListResponse)
+    measure("LazyModListResponse", LazyModListResponse)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Compare memory kept by `info.json` of installed mods as plain dicts (like
+`Mod.update_from_json` stores them), as dicts with dependencies parsed per mod and as
+`ModInfo` records.
+
+Usage: python -m benchmarks.bench_mod_info [mods_count]
+"""
+
+import json
+import sys
+import tracemalloc
+
+from f_manager_core.helpers import parse_dependencies
+from f_manager_core.mod_info import ModInfo
+
+COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+
+def synthetic_info(i: int) -> str:
+    return json.dumps(
+        {
+            "name": f"synthetic-mod-{i}",
+            "version": f"1.{i % 7}.{i % 13}",
+            "title": f"Synthetic mod #{i}",
+            "author": f"author{i % 100}",
+            "factorio_version": "1.1",
+            "contact": "",
+            "homepage": "https://mods.factorio.com",
+            "description": "A synthetic mod used to measure memory.",
+            "dependencies": ["base >= 1.1.0", "flib >= 0.12.0", f"? synthetic-mod-{i % 50}", "! Yuoki"],
+        }
+    )
+
+
+def measure(name, build):
+    # every mod is decoded separately, like info.json read from separate zips
+    documents = [synthetic_info(i) for i in range(COUNT)]
+
+    tracemalloc.start()
+    mods = [build(json.loads(document)) for document in documents]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<22} {len(mods)} mods  {size / 1024 / 1024:6.2f} MiB  ({size / len(mods):.0f} B/mod)")
+
+
+def main():
+    measure("dict", lambda info: info)
+    measure("dict + parsed deps", lambda info: (info, parse_dependencies(info["dependencies"])))
+    measure("ModInfo", ModInfo.from_json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Compare reading `info.json` of a synthetic mods directory sequentially, on a thread pool,
+on a process pool and from a warm `InfoCache`.
+
+Usage: python -m benchmarks.bench_scan_mods [mods_count]
+"""
+
+import json
+from pathlib import Path
+import sys
+import tempfile
+import time
+import zipfile
+
+from f_manager_core.info_cache import InfoCache
+from f_manager_core.mod import read_mod_info_json
+from f_manager_core.mod_index import get_mods_index
+from f_manager_core.mod_scanner import scan_mods
+
+COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+
+
+def write_mod(mods_dir: Path, i: int) -> None:
+    name, version = f"synthetic-mod-{i}", f"1.0.{i % 10}"
+    info = {
+        "name": name,
+        "version": version,
+        "title": f"Synthetic mod #{i}",
+        "author": f"author{i % 50}",
+        "factorio_version": "1.1",
+        "dependencies": ["base >= 1.1", f"? synthetic-mod-{i + 1}"],
+        "description": "A synthetic mod used to measure scanning. " * 10,
+    }
+    with zipfile.ZipFile(mods_dir.joinpath(f"{name}_{version}.zip"), "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(f"{name}_{version}/info.json", json.dumps(info))
+        for n in range(20):
+            archive.writestr(f"{name}_{version}/graphics/{n}.png", bytes(512))
+        archive.writestr(f"{name}_{version}/data.lua", "-- data\n" * 100)
+
+
+def measure(name, scan):
+    started = time.perf_counter()
+    count = scan()
+    print(f"{name:<12} {count} mods  {time.perf_counter() - started:.3f}s")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        mods_dir = Path(tmp).joinpath("mods")
+        mods_dir.mkdir()
+        for i in range(COUNT):
+            write_mod(mods_dir, i)
+        index = get_mods_index(mods_dir)
+
+        measure("sequential", lambda: len([read_mod_info_json(index.path(name)) for name in index]))
+        measure("threads", lambda: len(scan_mods(mods_dir, use_cache=False).mods))
+        measure("processes", lambda: len(scan_mods(mods_dir, processes=True, use_cache=False).mods))
+
+        cache = InfoCache(path=Path(tmp).joinpath("mod_info.sqlite3"))
+        measure("cold cache", lambda: len(scan_mods(mods_dir, cache=cache).mods))
+        cache.close()
+        cache = InfoCache(path=Path(tmp).joinpath("mod_info.sqlite3"))
+        measure("warm cache", lambda: len(scan_mods(mods_dir, cache=cache).mods))
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
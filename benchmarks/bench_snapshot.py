@@ -0,0 +1,65 @@
+"""Compare loading a synthetic catalog from JSON into `Result` objects against loading
+the same objects from a binary snapshot.
+
+Usage: python -m benchmarks.bench_snapshot [mods_count]
+"""
+
+import json
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+from f_manager_core.factorio.json_object_types import Result
+from f_manager_core.factorio.snapshot import read_snapshot, write_snapshot
+
+COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 30000
+
+
+def release(i: int, n: int) -> dict:
+    return {
+        "download_url": f"/download/synthetic-mod-{i}/{n:024x}",
+        "file_name": f"synthetic-mod-{i}_1.1.{n}.zip",
+        "info_json": {"factorio_version": "1.1", "dependencies": ["base >= 1.1"]},
+        "released_at": f"2023-03-{n % 28 + 1:02d}T12:34:56.789000+00:00",
+        "version": f"1.1.{n}",
+        "sha1": f"{i * 100 + n:040x}",
+    }
+
+
+def synthetic_result(i: int) -> dict:
+    return {
+        "downloads_count": i * 7,
+        "name": f"synthetic-mod-{i}",
+        "owner": f"author{i % 500}",
+        "summary": "A synthetic mod used to measure loading.",
+        "title": f"Synthetic mod #{i}",
+        "category": "content",
+        "created_at": "2021-01-01T00:00:00.000000+00:00",
+        "latest_release": release(i, 5),
+        "releases": [release(i, n) for n in range(6)],
+    }
+
+
+def main():
+    payload = json.dumps([synthetic_result(i) for i in range(COUNT)])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp).joinpath("catalog.snapshot")
+
+        started = time.perf_counter()
+        results = [Result(data) for data in json.loads(payload)]
+        json_elapsed = time.perf_counter() - started
+
+        write_snapshot(path, results)
+
+        started = time.perf_counter()
+        loaded = read_snapshot(path)
+        snapshot_elapsed = time.perf_counter() - started
+
+    print(f"JSON      {len(results)} mods  {json_elapsed:.3f}s  ({len(payload) / 1024 / 1024:.1f} MiB)")
+    print(f"snapshot  {len(loaded)} mods  {snapshot_elapsed:.3f}s  ({json_elapsed / snapshot_elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
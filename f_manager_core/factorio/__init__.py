@@ -1,3 +1,4 @@
+from f_manager_core.factorio import aio  # noqa: F401
 from f_manager_core.factorio.api import (  # noqa: F401
     get_bookmarks,
     get_categories,
@@ -5,16 +6,37 @@ from f_manager_core.factorio.api import (  # noqa: F401
     get_mods,
     get_mods_full,
     get_mods_short,
+    iter_mods,
     post_bookmarks_toggle,
     post_token,
 )
+from f_manager_core.factorio.batch import get_mods_by_names  # noqa: F401
+from f_manager_core.factorio.cache import ResponseCache  # noqa: F401
+from f_manager_core.factorio.catalog import iter_catalog  # noqa: F401
+from f_manager_core.factorio.client import (  # noqa: F401
+    PortalClient,
+    get_default_client,
+    set_default_client,
+)
+from f_manager_core.factorio.download import (  # noqa: F401
+    DownloadManager,
+    DownloadReport,
+    DownloadResult,
+)
 from f_manager_core.factorio.exceptions import (  # noqa: F401, E501
+    ChecksumMismatch,
     EmailAuthenticationRequired,
     LoginFailed,
 )
 from f_manager_core.factorio.json_object_types import (  # noqa: F401
     BookmarkToggleStatus,
     Category,
+    LazyLicense,
+    LazyModInfoShort,
+    LazyModListResponse,
+    LazyRelease,
+    LazyResult,
+    LazyTag,
     License,
     Links,
     ModInfoShort,
@@ -24,3 +46,10 @@ from f_manager_core.factorio.json_object_types import (  # noqa: F401
     Result,
     Tag,
 )
+from f_manager_core.factorio.mirror import CatalogMirror  # noqa: F401
+from f_manager_core.factorio.ratelimit import (  # noqa: F401
+    AdaptiveRateLimiter,
+    TokenBucket,
+    get_default_limiter,
+)
+from f_manager_core.factorio.store import BlobStore  # noqa: F401
@@ -0,0 +1,138 @@
+"""Asyncio counterparts of the functions from ``f_manager_core.factorio.api``.
+
+Every coroutine runs the blocking call in a shared thread pool, so the number of
+requests in flight is limited globally no matter how many tasks are awaiting.
+Results are the same objects the synchronous API returns.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Callable, List, Literal, Optional, TypeVar
+
+from f_manager_core.factorio import api
+from f_manager_core.factorio.client import DEFAULT_POOL_SIZE
+from f_manager_core.factorio.json_object_types import (
+    BookmarkToggleStatus,
+    Category,
+    ModListResponse,
+    Result,
+)
+from f_manager_core.factorio.streaming import DEFAULT_BUFFER_SIZE
+
+T = TypeVar("T")
+
+DEFAULT_CONCURRENCY = DEFAULT_POOL_SIZE
+
+_executor: Optional[ThreadPoolExecutor] = None
+_concurrency = DEFAULT_CONCURRENCY
+
+
+def set_concurrency(limit: int) -> None:
+    """Set the maximum number of portal requests running at the same time.
+
+    Waits for requests already running or queued with the previous limit to finish,
+    so the new limit is never exceeded by requests started before the change.
+
+    Args:
+        limit (int): New concurrency limit.
+    """
+    global _executor, _concurrency
+    if limit < 1:
+        raise ValueError("Concurrency limit should be at least 1")
+
+    _concurrency = limit
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+
+def get_concurrency() -> int:
+    """Return the current concurrency limit."""
+    return _concurrency
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=_concurrency, thread_name_prefix="f_manager_aio"
+        )
+    return _executor
+
+
+async def _run(func: Callable[..., T], *args, **kwargs) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), partial(func, *args, **kwargs))
+
+
+async def get_categories(cached: bool = True) -> List[Category]:
+    """Coroutine version of ``api.get_categories``."""
+    return await _run(api.get_categories, cached=cached)
+
+
+async def get_mods(
+    version: Literal["0.13", "0.14", "0.15", "0.16", "0.17", "0.18", "1.0", "1.1"],
+    hide_deprecated: bool = True,
+    page: int = 1,
+    page_size: int | Literal["max"] = 25,
+    sort: Literal["name", "created_at", "updated_at"] = "name",
+    sort_order: Literal["asc", "desc"] = "desc",
+    namelist: Optional[List[str]] = None,
+    cached: bool = True,
+) -> ModListResponse:
+    """Coroutine version of ``api.get_mods``."""
+    return await _run(
+        api.get_mods,
+        version,
+        hide_deprecated=hide_deprecated,
+        page=page,
+        page_size=page_size,
+        sort=sort,
+        sort_order=sort_order,
+        namelist=namelist,
+        cached=cached,
+    )
+
+
+async def get_mods_short(mod_name: str, cached: bool = True) -> Result:
+    """Coroutine version of ``api.get_mods_short``."""
+    return await _run(api.get_mods_short, mod_name, cached=cached)
+
+
+async def get_mods_full(mod_name: str, cached: bool = True) -> Result:
+    """Coroutine version of ``api.get_mods_full``."""
+    return await _run(api.get_mods_full, mod_name, cached=cached)
+
+
+async def get_mod(
+    username: str,
+    token: str,
+    download_url: str,
+    filename: str | Path,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    preallocate: bool = False,
+) -> str:
+    """Coroutine version of ``api.get_mod``."""
+    return await _run(
+        api.get_mod,
+        username,
+        token,
+        download_url,
+        filename,
+        buffer_size=buffer_size,
+        preallocate=preallocate,
+    )
+
+
+async def get_bookmarks(username: str, token: str) -> List[str]:
+    """Coroutine version of ``api.get_bookmarks``."""
+    return await _run(api.get_bookmarks, username, token)
+
+
+async def post_bookmarks_toggle(
+    username: str, token: str, mod: str, state: Literal["on", "off"]
+) -> BookmarkToggleStatus:
+    """Coroutine version of ``api.post_bookmarks_toggle``."""
+    return await _run(api.post_bookmarks_toggle, username, token, mod, state)
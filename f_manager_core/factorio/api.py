@@ -1,21 +1,32 @@
+import hashlib
 from pathlib import Path
-from typing import List, Literal, Optional
+from typing import Iterator, List, Literal, Optional
 
-import requests
+from f_manager_core.factorio.client import get_default_client
 from f_manager_core.factorio.const import LOGIN_BASE_URL, MOD_PORTAL_BASE_URL
+from f_manager_core.factorio.decoder import decode
 from f_manager_core.factorio.exceptions import EmailAuthenticationRequired, LoginFailed
 
 from f_manager_core.factorio.json_object_types import (
     BookmarkToggleStatus,
     Category,
+    LazyResult,
     ModListResponse,
     Result,
 )
+from f_manager_core.factorio.streaming import (
+    DEFAULT_BUFFER_SIZE,
+    copy_response,
+    iter_json_array,
+)
 
 
-def get_categories() -> List[Category]:
+def get_categories(cached: bool = True) -> List[Category]:
     """Retrieve a list of categories from the API.
 
+    Args:
+        cached (bool, optional): Allow answering from the response cache. Defaults to True.
+
     Raises:
         ValueError: If got an invalid category
 
@@ -23,10 +34,10 @@ def get_categories() -> List[Category]:
         List[Category]: A list of categories, where each category is represented as a list of strings.
     """
     url = f"{MOD_PORTAL_BASE_URL}/api/categories"
-    response = requests.get(url)
+    response = get_default_client().get_cached(url, "categories", cached=cached)
     response.raise_for_status()
 
-    data = response.json()
+    data = decode(response.content)
     if not isinstance(data, list):
         raise ValueError("Could not parse category")
 
@@ -41,6 +52,7 @@ def get_mods(
     sort: Literal["name", "created_at", "updated_at"] = "name",
     sort_order: Literal["asc", "desc"] = "desc",
     namelist: Optional[List[str]] = None,
+    cached: bool = True,
 ) -> ModListResponse:
     """Retrieves a list of mods from the Factorio mod portal using the HTTP GET method.
 
@@ -52,6 +64,7 @@ def get_mods(
         sort (Literal[`name`, `created_at`, `updated_at`], optional): Sort results by this property. Defaults to name when not defined. Ignored for `page_size=max` queries. Defaults to "name".
         sort_order (Literal[`asc`, `desc`], optional): Sort results ascending or descending. Defaults to descending when not defined. Ignored for `page_size=max` queries. Defaults to "desc".
         namelist (Optional[List[str]], optional): Return only mods that match the given names. Response will include releases instead of latest_release. Defaults to None.
+        cached (bool, optional): Allow answering from the response cache (up to 10 minutes old). Defaults to True.
 
     Returns:
         ModListResponse
@@ -66,42 +79,85 @@ def get_mods(
         "namelist": namelist,
         "version": version,
     }
-    response = requests.get(url, params=params)
+    response = get_default_client().get_cached(url, "mods", params=params, cached=cached)
     response.raise_for_status()
 
-    return ModListResponse(response.json())
+    return ModListResponse(decode(response.content))
+
+
+def iter_mods(
+    version: Literal["0.13", "0.14", "0.15", "0.16", "0.17", "0.18", "1.0", "1.1"],
+    hide_deprecated: bool = True,
+    page: int = 1,
+    page_size: int | Literal["max"] = "max",
+    sort: Literal["name", "created_at", "updated_at"] = "name",
+    sort_order: Literal["asc", "desc"] = "desc",
+    namelist: Optional[List[str]] = None,
+    chunk_size: int = 64 * 1024,
+    lazy: bool = False,
+) -> Iterator[Result | LazyResult]:
+    """Streaming version of `get_mods`: parses the response while it is downloaded and yields mods one by one.
+
+    Memory usage doesn't depend on the size of the response, which makes it suitable for `page_size="max"` queries
+    returning the whole catalog. Arguments are the same as for `get_mods`.
+
+    Args:
+        chunk_size (int, optional): Size of the chunks read from the network. Defaults to 64 KiB.
+        lazy (bool, optional): Yield compact `LazyResult` objects instead of `Result`. Defaults to False.
+
+    Yields:
+        Result | LazyResult: Mods from the response
+    """  # noqa: E501
+    url = f"{MOD_PORTAL_BASE_URL}/api/mods"
+    params = {
+        "hide_deprecated": hide_deprecated,
+        "page": page,
+        "page_size": page_size,
+        "sort": sort,
+        "sort_order": sort_order,
+        "namelist": namelist,
+        "version": version,
+    }
+    with get_default_client().get(url, params=params, stream=True) as response:
+        response.raise_for_status()
+
+        result_type = LazyResult if lazy else Result
+        for result in iter_json_array(response.iter_content(chunk_size=chunk_size)):
+            yield result_type(result)
 
 
-def get_mods_short(mod_name: str) -> Result:
+def get_mods_short(mod_name: str, cached: bool = True) -> Result:
     """Return short information of a specific mod.
 
     Args:
         mod_name (str): The name of the mod to retrieve
+        cached (bool, optional): Allow answering from the response cache. Defaults to True.
 
     Returns:
         Result: Short information of a specific mod
     """
     url = f"{MOD_PORTAL_BASE_URL}/api/mods/{mod_name}"
-    response = requests.get(url)
+    response = get_default_client().get_cached(url, "mod", cached=cached)
     response.raise_for_status()
 
-    return Result(response.json())
+    return Result(decode(response.content))
 
 
-def get_mods_full(mod_name: str) -> Result:
+def get_mods_full(mod_name: str, cached: bool = True) -> Result:
     """Returns more information of a mod.
 
     Args:
         mod_name (str): The name of the mod to retrieve
+        cached (bool, optional): Allow answering from the response cache. Defaults to True.
 
     Returns:
         Result: Full information of a specific mod
     """
     url = f"{MOD_PORTAL_BASE_URL}/api/mods/{mod_name}/full"
-    response = requests.get(url)
+    response = get_default_client().get_cached(url, "mod_full", cached=cached)
     response.raise_for_status()
 
-    return Result(response.json())
+    return Result(decode(response.content))
 
 
 def post_token(
@@ -137,11 +193,11 @@ def post_token(
         "require_game_ownership": require_game_ownership,
         "email_authentication_code": email_authentication_code,
     }
-    response = requests.post(url, params=params)
+    response = get_default_client().post(url, params=params)
     try:
         response.raise_for_status()
     except Exception as e:
-        json_data = response.json()
+        json_data = decode(response.content)
         if not isinstance(json_data, dict):
             raise ValueError(f"Invalid JSON data: {json_data}") from e
 
@@ -156,10 +212,17 @@ def post_token(
             case "email-authentication-required":
                 raise EmailAuthenticationRequired from e
 
-    return response.json()[0]
+    return decode(response.content)[0]
 
 
-def get_mod(username: str, token: str, download_url: str, filename: str | Path):
+def get_mod(
+    username: str,
+    token: str,
+    download_url: str,
+    filename: str | Path,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    preallocate: bool = False,
+) -> str:
     """Downloads a file from the specified URL using the provided authentication token and saves it to a file.
 
     Args:
@@ -167,16 +230,27 @@ def get_mod(username: str, token: str, download_url: str, filename: str | Path):
         token (str): The authentication token of the account.
         download_url (str): The URL of the file to download from `Release` objects.
         filename (str | Path): The local file path where the downloaded content will be saved.
+        buffer_size (int, optional): Size of the buffer the content is read into. Defaults to 1 MiB.
+        preallocate (bool, optional): Reserve space for the file from `Content-Length` before writing. Defaults to False.
+
+    Returns:
+        str: sha1 hex digest of the downloaded file, computed while streaming (compare it with `Release.sha1`)
     """
-    url = f"https://mods.factorio.com{download_url}?username={username}&token={token}"
-    response = requests.get(url, stream=True)
-    response.raise_for_status()
+    url = f"{MOD_PORTAL_BASE_URL}{download_url}?username={username}&token={token}"
+    hasher = hashlib.sha1()
+    with get_default_client().get(url, kind="download", stream=True) as response:
+        response.raise_for_status()
+
+        with Path(filename).open("wb") as file:
+            copy_response(
+                response,
+                file,
+                hasher=hasher,
+                buffer_size=buffer_size,
+                preallocate_file=preallocate,
+            )
 
-    filename = Path(filename)
-    with filename.open("wb") as file:
-        for chunk in response.iter_content(chunk_size=512):
-            if chunk:
-                file.write(chunk)
+    return hasher.hexdigest()
 
 
 def get_bookmarks(username: str, token: str) -> List[str]:
@@ -194,10 +268,10 @@ def get_bookmarks(username: str, token: str) -> List[str]:
     """
     url = f"{MOD_PORTAL_BASE_URL}/api/bookmarks"
     params = {"username": username, "token": token}
-    response = requests.get(url, params=params)
+    response = get_default_client().get(url, params=params)
     response.raise_for_status()
 
-    data = response.json()
+    data = decode(response.content)
     if not isinstance(data, list):
         raise ValueError("Could not get bookmarks")
 
@@ -220,7 +294,7 @@ def post_bookmarks_toggle(
     """
     url = f"{MOD_PORTAL_BASE_URL}/api/bookmarks/toggle"
     params = {"username": username, "token": token, "mod": mod, "state": state}
-    response = requests.post(url, params=params)
+    response = get_default_client().post(url, params=params)
     response.raise_for_status()
 
-    return BookmarkToggleStatus(response.json())
+    return BookmarkToggleStatus(decode(response.content))
@@ -0,0 +1,103 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Literal, Optional
+from urllib.parse import quote
+
+from f_manager_core.factorio.api import get_mods, get_mods_full
+from f_manager_core.factorio.json_object_types import Result
+
+MAX_NAMES_PER_REQUEST = 100
+MAX_QUERY_LENGTH = 2000
+DEFAULT_WORKERS = 4
+
+_NAMELIST_PARAM = "&namelist="
+
+
+def chunk_names(
+    names: Iterable[str],
+    max_names: int = MAX_NAMES_PER_REQUEST,
+    max_length: int = MAX_QUERY_LENGTH,
+) -> List[List[str]]:
+    """Split mod names into chunks which fit into one `namelist` query.
+
+    Args:
+        names (Iterable[str]): Mod names. Duplicates are dropped.
+        max_names (int, optional): Maximum amount of names in one chunk. Defaults to 100.
+        max_length (int, optional): Maximum length of the url-encoded `namelist` part of a query. Defaults to 2000.
+
+    Returns:
+        List[List[str]]: Chunks of names
+    """  # noqa: E501
+    chunks: List[List[str]] = []
+    chunk: List[str] = []
+    length = 0
+
+    for name in dict.fromkeys(names):
+        name_length = len(_NAMELIST_PARAM) + len(quote(name, safe=""))
+        if chunk and (len(chunk) >= max_names or length + name_length > max_length):
+            chunks.append(chunk)
+            chunk = []
+            length = 0
+        chunk.append(name)
+        length += name_length
+
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def get_mods_by_names(
+    names: Iterable[str],
+    version: Optional[
+        Literal["0.13", "0.14", "0.15", "0.16", "0.17", "0.18", "1.0", "1.1"]
+    ] = None,
+    full_fields: Iterable[str] = (),
+    workers: int = DEFAULT_WORKERS,
+) -> Dict[str, Result]:
+    """Resolve many mods at once using `namelist` queries of `get_mods` instead of one request per mod.
+
+    Results of the list endpoint include all `releases` of a mod but lack some fields of the `/full`
+    endpoint (like `changelog` or `description`). If any of `full_fields` is missing for a mod it is
+    requested with `get_mods_full` and copied into the result.
+
+    Args:
+        names (Iterable[str]): Names of mods to resolve.
+        version (Optional[Literal[`0.13`, `0.14`, `0.15`, `0.16`, `0.17`, `0.18`, `1.0`, `1.1`]], optional): Only return mods compatible with this Factorio version. Defaults to None.
+        full_fields (Iterable[str], optional): Fields that should be completed from the `/full` endpoint. Defaults to ().
+        workers (int, optional): Maximum number of requests at the same time. Defaults to 4.
+
+    Returns:
+        Dict[str, Result]: Found mods by their names. Mods unknown to the portal are missing.
+    """  # noqa: E501
+    full_fields = tuple(full_fields)
+    chunks = chunk_names(names)
+
+    def fetch(chunk: List[str]) -> List[Result]:
+        return get_mods(
+            version,  # type: ignore
+            hide_deprecated=False,
+            page_size=len(chunk),
+            namelist=chunk,
+        ).results
+
+    def complete(result: Result) -> None:
+        full = get_mods_full(result.name)
+        for field in full_fields:
+            setattr(result, field, getattr(full, field, None))
+
+    results: Dict[str, Result] = {}
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="f_manager_batch"
+    ) as executor:
+        for chunk_results in executor.map(fetch, chunks):
+            for result in chunk_results:
+                results[result.name] = result
+
+        if full_fields:
+            incomplete = [
+                result
+                for result in results.values()
+                if any(getattr(result, field, None) is None for field in full_fields)
+            ]
+            list(executor.map(complete, incomplete))
+
+    return results
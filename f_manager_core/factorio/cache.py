@@ -0,0 +1,206 @@
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from f_manager_core.configuration import config
+
+DEFAULT_TTLS = {
+    "categories": 24 * 60 * 60,
+    "mods": 10 * 60,
+    "mod": 60 * 60,
+    "mod_full": 60 * 60,
+}
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+CACHE_FILE_NAME = "http_cache.sqlite3"
+
+
+class CacheEntry:
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_type: Optional[str]
+    stored_at: float
+
+    def __init__(
+        self,
+        body: bytes,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        content_type: Optional[str],
+        stored_at: float,
+    ):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_type = content_type
+        self.stored_at = stored_at
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.stored_at < ttl
+
+    def validators(self) -> Dict[str, str]:
+        """Return headers for a conditional request revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, url: str) -> requests.Response:
+        """Build a response object as if the entry was just received from the server."""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = self.body
+        response.encoding = "utf-8"
+        response.headers = CaseInsensitiveDict(
+            {"Content-Type": self.content_type or "application/json"}
+        )
+        return response
+
+    def __repr__(self) -> str:
+        return f"CacheEntry(size='{len(self.body)}', etag='{self.etag}', last_modified='{self.last_modified}', stored_at='{self.stored_at}')"  # noqa: E501
+
+
+class ResponseCache:
+    """Persistent cache of portal responses stored in SQLite.
+
+    Entries are keyed by URL and query parameters. Every endpoint has its own time to live,
+    after which the entry is revalidated with `If-None-Match` / `If-Modified-Since`. When the
+    total size of bodies exceeds `max_size` the least recently used entries are dropped.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttls: Optional[Dict[str, float]] = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        """
+        Args:
+            path (Optional[Path], optional): Database file. Defaults to a file in `config.data.storage`.
+            ttls (Optional[Dict[str, float]], optional): Time to live in seconds by endpoint, merged with `DEFAULT_TTLS`. Defaults to None.
+            max_size (int, optional): Maximum total size of cached bodies in bytes. Defaults to 256 MiB.
+        """  # noqa: E501
+        self._path = path
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def path(self) -> Path:
+        return Path(self._path or config.data.storage.joinpath(CACHE_FILE_NAME))
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None
+            )
+            self._connection.executescript(
+                """
+                PRAGMA journal_mode=WAL;
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    endpoint TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    content_type TEXT,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+                """
+            )
+        return self._connection
+
+    @staticmethod
+    def key(url: str, params: Optional[dict] = None) -> str:
+        """Return the cache key of a request."""
+        if not params:
+            return url
+        items = sorted((k, v) for k, v in params.items() if v is not None)
+        return f"{url}?{urlencode(items, doseq=True)}"
+
+    def ttl(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, 0)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT body, etag, last_modified, content_type, stored_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self.connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+        return CacheEntry(*row)
+
+    def put(self, key: str, endpoint: str, response: requests.Response) -> None:
+        body = response.content
+        now = time.time()
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    endpoint,
+                    body,
+                    len(body),
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    response.headers.get("Content-Type"),
+                    now,
+                    now,
+                ),
+            )
+            self._evict()
+
+    def refresh(self, key: str) -> None:
+        """Mark an entry as fresh after the server confirmed it didn't change."""
+        now = time.time()
+        with self._lock:
+            self.connection.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, key),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self.connection.execute("DELETE FROM responses")
+
+    def _evict(self) -> None:
+        (total,) = self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_size:
+            return
+
+        rows = self.connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_size:
+                break
+            evicted.append((key,))
+            total -= size
+        self.connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -0,0 +1,70 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Iterator, Literal
+
+from f_manager_core.factorio.api import get_mods
+from f_manager_core.factorio.json_object_types import Result
+
+DEFAULT_WINDOW = 4
+DEFAULT_PAGE_SIZE = 100
+
+
+def iter_catalog(
+    version: Literal["0.13", "0.14", "0.15", "0.16", "0.17", "0.18", "1.0", "1.1"],
+    hide_deprecated: bool = True,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    sort: Literal["name", "created_at", "updated_at"] = "name",
+    sort_order: Literal["asc", "desc"] = "desc",
+    window: int = DEFAULT_WINDOW,
+) -> Iterator[Result]:
+    """Iterate over every mod of the portal.
+
+    The first page is fetched to learn `Pagination.page_count`, the rest are fetched concurrently
+    keeping at most `window` pages in flight. Results are yielded in page order as soon as their
+    page arrives, so processing can start before the last page is downloaded.
+
+    Args:
+        version (Literal[`0.13`, `0.14`, `0.15`, `0.16`, `0.17`, `0.18`, `1.0`, `1.1`]): Only return mods compatible with this Factorio version
+        hide_deprecated (bool, optional): Only return non-deprecated mods. Defaults to True.
+        page_size (int, optional): Amount of results per page. Defaults to 100.
+        sort (Literal[`name`, `created_at`, `updated_at`], optional): Sort results by this property. Defaults to "name".
+        sort_order (Literal[`asc`, `desc`], optional): Sort results ascending or descending. Defaults to "desc".
+        window (int, optional): Maximum number of pages requested at the same time. Defaults to 4.
+
+    Yields:
+        Result: Mods of the catalog
+    """  # noqa: E501
+
+    def fetch(page: int):
+        return get_mods(
+            version,
+            hide_deprecated=hide_deprecated,
+            page=page,
+            page_size=page_size,
+            sort=sort,
+            sort_order=sort_order,
+        )
+
+    first = fetch(1)
+    yield from first.results
+
+    page_count = first.pagination.page_count if first.pagination else 1
+    if page_count <= 1:
+        return
+
+    pages = iter(range(2, page_count + 1))
+    with ThreadPoolExecutor(
+        max_workers=window, thread_name_prefix="f_manager_catalog"
+    ) as executor:
+        pending: Deque[Future] = deque(
+            executor.submit(fetch, page) for _, page in zip(range(window), pages)
+        )
+        try:
+            while pending:
+                response = pending.popleft().result()
+                if (page := next(pages, None)) is not None:
+                    pending.append(executor.submit(fetch, page))
+                yield from response.results
+        finally:
+            for future in pending:
+                future.cancel()
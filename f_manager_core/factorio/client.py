@@ -0,0 +1,208 @@
+from typing import Any, Collection, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from f_manager_core.factorio.cache import ResponseCache
+from f_manager_core.factorio.ratelimit import (
+    AdaptiveRateLimiter,
+    RequestKind,
+    get_default_limiter,
+    parse_retry_after,
+)
+from f_manager_core.logger import logger
+
+DEFAULT_POOL_SIZE = 16
+DEFAULT_TIMEOUT = (5.0, 30.0)
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class PortalClient:
+    """HTTP client shared by all Factorio web API calls.
+
+    Owns a single pooled ``requests.Session`` so that consecutive calls reuse
+    kept-alive connections instead of doing a new TCP+TLS handshake each time.
+    Idempotent requests are retried with exponential backoff on 429/5xx answers
+    (``Retry-After`` is respected).
+
+    With a rate limiter every request first takes a token from the budget of its kind,
+    and 429 answers to idempotent requests are retried by the client itself after slowing
+    the budget down.
+
+    Catalog requests made with ``get_cached`` go through an optional persistent
+    ``ResponseCache``. In offline mode cached entries are served without any
+    network access, and stale entries are served whenever the portal is unreachable.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float | Tuple[float, float] = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        retry_statuses: Collection[int] = DEFAULT_RETRY_STATUSES,
+        cache: Optional[ResponseCache] = None,
+        offline: bool = False,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+    ) -> None:
+        """
+        Args:
+            pool_size (int, optional): Maximum number of kept-alive connections per host. Defaults to 16.
+            timeout (float | Tuple[float, float], optional): Connect and read timeouts in seconds. Defaults to (5.0, 30.0).
+            retries (int, optional): How many times a failed request is retried. Defaults to 3.
+            backoff_factor (float, optional): Backoff factor between retries. Defaults to 0.5.
+            retry_statuses (Collection[int], optional): Status codes that trigger a retry. Defaults to 429 and 5xx.
+            cache (Optional[ResponseCache], optional): Cache for `get_cached` requests. Defaults to None.
+            offline (bool, optional): Serve cached responses without revalidating them. Defaults to False.
+            limiter (Optional[AdaptiveRateLimiter], optional): Rate limiter for all requests. Defaults to None.
+        """  # noqa: E501
+        self.timeout = timeout
+        self.cache = cache
+        self.offline = offline
+        self.limiter = limiter
+        self.retries = retries
+
+        if limiter is not None:
+            # 429 answers (and their Retry-After) are handled by the limiter
+            retry_statuses = [status for status in retry_statuses if status != 429]
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=tuple(retry_statuses),
+            respect_retry_after_header=limiter is None,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry,
+        )
+
+        self._retry_methods = retry.allowed_methods
+
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(
+        self, method: str, url: str, kind: RequestKind = "metadata", **kwargs: Any
+    ) -> requests.Response:
+        """Send a request through the pooled session.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Requested URL.
+            kind (RequestKind, optional): Budget of the rate limiter the request is counted in. Defaults to "metadata".
+            **kwargs: Passed to ``requests.Session.request``.
+
+        Returns:
+            requests.Response
+        """  # noqa: E501
+        kwargs.setdefault("timeout", self.timeout)
+        if self.limiter is None:
+            return self.session.request(method, url, **kwargs)
+
+        attempt = 0
+        while True:
+            self.limiter.acquire(kind)
+            response = self.session.request(method, url, **kwargs)
+            if response.status_code != 429:
+                self.limiter.on_success(kind)
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            self.limiter.on_throttled(kind, retry_after)
+            # like the adapter's retries, never resend a request that isn't idempotent
+            if attempt >= self.retries or method.upper() not in self._retry_methods:
+                return response
+
+            logger.debug(f"Portal is throttling {kind} requests, retrying {url}")
+            response.close()
+            attempt += 1
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def get_cached(
+        self, url: str, endpoint: str, params: Optional[dict] = None, cached: bool = True
+    ) -> requests.Response:
+        """Send a GET request answering from the cache when possible.
+
+        Args:
+            url (str): Requested URL.
+            endpoint (str): Name of the endpoint, selects the time to live of the cached response.
+            params (Optional[dict], optional): Query parameters. Defaults to None.
+            cached (bool, optional): Answer from the cache. If False the request is always sent and its answer replaces the cached one. Defaults to True.
+
+        Returns:
+            requests.Response
+        """  # noqa: E501
+        if self.cache is None:
+            return self.get(url, params=params)
+        if not cached:
+            response = self.get(url, params=params)
+            if response.status_code == 200:
+                self.cache.put(self.cache.key(url, params), endpoint, response)
+            return response
+
+        key = self.cache.key(url, params)
+        entry = self.cache.get(key)
+        if entry and (self.offline or entry.is_fresh(self.cache.ttl(endpoint))):
+            return entry.to_response(url)
+
+        try:
+            response = self.get(url, params=params, headers=entry.validators() if entry else None)
+        except (requests.ConnectionError, requests.Timeout):
+            if entry is None:
+                raise
+            logger.warning(f"Portal is unreachable, using cached response for {url}")
+            return entry.to_response(url)
+
+        if entry and response.status_code == 304:
+            self.cache.refresh(key)
+            return entry.to_response(url)
+        if entry and response.status_code >= 500:
+            logger.warning(f"Portal answered {response.status_code}, using cached response for {url}")
+            return entry.to_response(url)
+        if response.status_code == 200:
+            self.cache.put(key, endpoint, response)
+
+        return response
+
+    def close(self) -> None:
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    def __enter__(self) -> "PortalClient":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+_default_client: Optional[PortalClient] = None
+
+
+def get_default_client() -> PortalClient:
+    """Return the client used by module-level API functions, creating it on first use."""
+    global _default_client
+    if _default_client is None:
+        _default_client = PortalClient(cache=ResponseCache(), limiter=get_default_limiter())
+    return _default_client
+
+
+def set_default_client(client: PortalClient) -> None:
+    """Replace the client used by module-level API functions.
+
+    Args:
+        client (PortalClient): New default client.
+    """
+    global _default_client
+    _default_client = client
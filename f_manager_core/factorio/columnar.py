@@ -0,0 +1,195 @@
+"""Columnar view of the portal catalog for bulk analytics.
+
+Requires NumPy (``pip install f_manager_core[analytics]``).
+"""
+
+from datetime import datetime, timedelta, timezone
+import sys
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+from f_manager_core.factorio.json_object_types import (
+    LazyModListResponse,
+    LazyResult,
+    ModListResponse,
+    Result,
+)
+
+_NAT = np.iinfo(np.int64).min
+
+
+def _timestamp(date: Optional[datetime]) -> int:
+    if date is None:
+        return _NAT
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return int(date.timestamp())
+
+
+def _latest_release_date(result: Union[Result, LazyResult]) -> Optional[datetime]:
+    if result.latest_release is not None:
+        return result.latest_release.released_at
+    if result.releases:
+        return max(release.released_at for release in result.releases)
+    return None
+
+
+class CatalogColumns:
+    """Catalog stored column by column in NumPy arrays.
+
+    Numeric and date columns are NumPy arrays, categories are stored as small integer codes
+    and names/titles as object arrays of interned strings, so filtering and ranking thousands
+    of mods are vectorised operations instead of Python loops over `Result` objects.
+    """
+
+    names: np.ndarray
+    titles: np.ndarray
+    downloads_count: np.ndarray
+    created_at: np.ndarray
+    updated_at: np.ndarray
+    category_codes: np.ndarray
+    categories: List[str]
+
+    def __init__(
+        self,
+        names: np.ndarray,
+        titles: np.ndarray,
+        downloads_count: np.ndarray,
+        created_at: np.ndarray,
+        updated_at: np.ndarray,
+        category_codes: np.ndarray,
+        categories: List[str],
+    ):
+        self.names = names
+        self.titles = titles
+        self.downloads_count = downloads_count
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.category_codes = category_codes
+        self.categories = categories
+
+        self._category_index = {category: code for code, category in enumerate(categories)}
+        self._name_index: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def from_results(cls, results: Iterable[Union[Result, LazyResult]]) -> "CatalogColumns":
+        """Build columns from results (a list, a response or a catalog iterator).
+
+        Args:
+            results (Iterable[Union[Result, LazyResult]]): Mods of the catalog.
+
+        Returns:
+            CatalogColumns
+        """
+        names: List[str] = []
+        titles: List[str] = []
+        downloads: List[int] = []
+        created: List[int] = []
+        updated: List[int] = []
+        codes: List[int] = []
+        category_index: Dict[str, int] = {}
+
+        for result in results:
+            names.append(sys.intern(result.name))
+            titles.append(sys.intern(getattr(result, "title", None) or ""))
+            downloads.append(getattr(result, "downloads_count", 0) or 0)
+            created.append(_timestamp(result.created_at))
+            updated.append(_timestamp(_latest_release_date(result)))
+            category = getattr(result, "category", None) or ""
+            codes.append(category_index.setdefault(category, len(category_index)))
+
+        return cls(
+            names=np.array(names, dtype=object),
+            titles=np.array(titles, dtype=object),
+            downloads_count=np.array(downloads, dtype=np.int64),
+            created_at=np.array(created, dtype=np.int64).astype("datetime64[s]"),
+            updated_at=np.array(updated, dtype=np.int64).astype("datetime64[s]"),
+            category_codes=np.array(codes, dtype=np.int16),
+            categories=list(category_index),
+        )
+
+    @classmethod
+    def from_response(cls, response: Union[ModListResponse, LazyModListResponse]) -> "CatalogColumns":
+        return cls.from_results(response.results)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def index(self, name: str) -> int:
+        """Return the row of a mod."""
+        if self._name_index is None:
+            self._name_index = {name: row for row, name in enumerate(self.names)}
+        return self._name_index[name]
+
+    def mask(
+        self,
+        category: Optional[str] = None,
+        updated_within: Optional[timedelta] = None,
+        min_downloads: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> np.ndarray:
+        """Return a boolean mask of mods matching all given conditions.
+
+        Args:
+            category (Optional[str], optional): Mod category. Defaults to None.
+            updated_within (Optional[timedelta], optional): Latest release is not older than this. Defaults to None.
+            min_downloads (Optional[int], optional): Minimum downloads count. Defaults to None.
+            now (Optional[datetime], optional): Reference time for `updated_within`. Defaults to the current time.
+
+        Returns:
+            np.ndarray: Boolean mask over rows
+        """  # noqa: E501
+        mask = np.ones(len(self), dtype=bool)
+        if category is not None:
+            code = self._category_index.get(category)
+            if code is None:
+                return np.zeros(len(self), dtype=bool)
+            mask &= self.category_codes == code
+        if updated_within is not None:
+            since = _timestamp((now or datetime.now(timezone.utc)) - updated_within)
+            mask &= self.updated_at >= np.datetime64(since, "s")
+        if min_downloads is not None:
+            mask &= self.downloads_count >= min_downloads
+        return mask
+
+    def top(
+        self, n: int, by: str = "downloads_count", mask: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Return rows of the `n` largest values of a column, largest first.
+
+        Rows without a value in the column are left out.
+
+        Args:
+            n (int): Amount of rows.
+            by (str, optional): Column to rank by. Defaults to "downloads_count".
+            mask (Optional[np.ndarray], optional): Only rank rows of this mask. Defaults to None.
+
+        Returns:
+            np.ndarray: Row indices
+        """
+        column = getattr(self, by)
+        rows = np.flatnonzero(mask) if mask is not None else np.arange(len(self))
+        values = column[rows]
+        # rows without a value (NaT, NaN) aren't ranked, negated NaT would sort first
+        if values.dtype.kind in "Mf":
+            known = ~(np.isnat(values) if values.dtype.kind == "M" else np.isnan(values))
+            rows, values = rows[known], values[known]
+        if values.dtype.kind == "M":
+            values = values.astype(np.int64)
+        if n < len(rows):
+            part = np.argpartition(-values, n)[:n]
+        else:
+            part = np.arange(len(rows))
+        return rows[part[np.argsort(-values[part], kind="stable")]]
+
+    def top_names(
+        self,
+        n: int,
+        category: Optional[str] = None,
+        updated_within: Optional[timedelta] = None,
+        by: str = "downloads_count",
+    ) -> List[str]:
+        """Names of the top `n` mods, like "top 50 by downloads in category X, updated in the last 90 days"."""
+        rows = self.top(n, by, self.mask(category=category, updated_within=updated_within))
+        return self.names[rows].tolist()
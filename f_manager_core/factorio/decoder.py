@@ -0,0 +1,96 @@
+"""JSON decoding of API responses.
+
+Responses are passed to the decoder as raw bytes. With orjson installed
+(``pip install f_manager_core[fast]``) they are parsed straight from the bytes without making
+a text copy first. Otherwise the standard library decoder is used, which decodes the bytes to
+a `str` internally.
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+Decoder = Callable[[bytes], Any]
+
+
+def _stdlib_loads(data: bytes) -> Any:
+    if isinstance(data, (bytearray, memoryview)):
+        data = bytes(data)
+    # json.loads detects the encoding of bytes by itself, but parses a decoded str copy
+    return json.loads(data)
+
+
+def _orjson_loads() -> Decoder:
+    import orjson
+
+    return orjson.loads
+
+
+_BACKENDS: Dict[str, Callable[[], Decoder]] = {
+    "orjson": _orjson_loads,
+    "json": lambda: _stdlib_loads,
+}
+_PREFERENCE = ("orjson", "json")
+
+_backend: Optional[str] = None
+_loads: Optional[Decoder] = None
+
+
+def available_backends() -> List[str]:
+    """Return names of installed backends, fastest first."""
+    available = []
+    for name in _PREFERENCE:
+        try:
+            _BACKENDS[name]()
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+def set_backend(name: Optional[str] = None) -> str:
+    """Select the decoder backend.
+
+    Args:
+        name (Optional[str], optional): `orjson` or `json`. Defaults to the fastest installed one.
+
+    Raises:
+        ValueError: If the backend is unknown
+        ImportError: If the backend is not installed
+
+    Returns:
+        str: Name of the selected backend
+    """
+    global _backend, _loads
+
+    if name is None:
+        name = available_backends()[0]
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown JSON backend '{name}'")
+
+    _loads = _BACKENDS[name]()
+    _backend = name
+    return name
+
+
+def get_backend() -> str:
+    """Return the name of the selected backend."""
+    if _backend is None:
+        set_backend()
+    return _backend  # type: ignore
+
+
+def decode(data: bytes) -> Any:
+    """Decode a JSON document.
+
+    Args:
+        data (bytes): Raw UTF-8 encoded document (like `Response.content`).
+
+    Raises:
+        ValueError: If the document is not valid JSON
+
+    Returns:
+        Any: Decoded data
+    """
+    if _loads is None:
+        set_backend()
+    return _loads(data)  # type: ignore
@@ -0,0 +1,242 @@
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import os
+from pathlib import Path
+import time
+from typing import Iterable, List, Optional
+
+import requests
+
+from f_manager_core.configuration import config
+from f_manager_core.factorio.client import PortalClient, get_default_client
+from f_manager_core.factorio.const import MOD_PORTAL_BASE_URL
+from f_manager_core.factorio.exceptions import ChecksumMismatch
+from f_manager_core.factorio.json_object_types import Release
+from f_manager_core.factorio.store import BlobStore
+from f_manager_core.factorio.streaming import DEFAULT_BUFFER_SIZE, copy_response
+from f_manager_core.logger import logger
+
+DEFAULT_WORKERS = 4
+PART_SUFFIX = ".part"
+
+
+class DownloadResult:
+    release: Release
+    path: Path
+    downloaded: int
+    resumed: bool
+    from_store: bool
+    error: Optional[Exception]
+
+    def __init__(
+        self,
+        release: Release,
+        path: Path,
+        downloaded: int = 0,
+        resumed: bool = False,
+        from_store: bool = False,
+        error: Optional[Exception] = None,
+    ):
+        self.release = release
+        self.path = path
+        self.downloaded = downloaded
+        self.resumed = resumed
+        self.from_store = from_store
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        return f"DownloadResult(file_name='{self.release.file_name}', path='{self.path}', downloaded='{self.downloaded}', resumed='{self.resumed}', from_store='{self.from_store}', error='{self.error}')"  # noqa: E501
+
+
+class DownloadReport:
+    results: List[DownloadResult]
+    elapsed: float
+
+    def __init__(self, results: List[DownloadResult], elapsed: float):
+        self.results = results
+        self.elapsed = elapsed
+
+    @property
+    def downloaded(self) -> int:
+        """Total amount of bytes received over the network."""
+        return sum(result.downloaded for result in self.results)
+
+    @property
+    def throughput(self) -> float:
+        """Aggregate download speed in bytes per second."""
+        return self.downloaded / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def failed(self) -> List[DownloadResult]:
+        return [result for result in self.results if not result.ok]
+
+    def __repr__(self) -> str:
+        return f"DownloadReport(files='{len(self.results)}', failed='{len(self.failed)}', downloaded='{self.downloaded}', elapsed='{self.elapsed:.2f}', throughput='{self.throughput:.0f}')"  # noqa: E501
+
+
+class DownloadManager:
+    """Downloads mod releases in parallel.
+
+    Every file is streamed into ``<file_name>.part`` next to its destination while
+    its sha1 is computed, then verified against ``Release.sha1`` and atomically
+    renamed into place. If a transfer is interrupted the ``.part`` file is kept
+    and the next attempt resumes it with an HTTP ``Range`` request.
+
+    With a ``BlobStore`` releases whose sha1 is already stored are materialized
+    without any download, and new downloads are added to the store.
+    """
+
+    def __init__(
+        self,
+        username: Optional[str] = None,
+        token: Optional[str] = None,
+        target_dir: Optional[Path] = None,
+        workers: int = DEFAULT_WORKERS,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        client: Optional[PortalClient] = None,
+        store: Optional[BlobStore] = None,
+    ) -> None:
+        """
+        Args:
+            username (Optional[str], optional): Account username. Defaults to the configured one.
+            token (Optional[str], optional): Account token. Defaults to the configured one.
+            target_dir (Optional[Path], optional): Where to put downloaded files. Defaults to `config.factorio.mods_dir`.
+            workers (int, optional): Maximum number of parallel downloads. Defaults to 4.
+            buffer_size (int, optional): Size of the buffer each download is read into. Defaults to 1 MiB.
+            client (Optional[PortalClient], optional): Client to use. Defaults to the default client.
+            store (Optional[BlobStore], optional): Content-addressed store shared between mods directories. Defaults to None.
+        """  # noqa: E501
+        self._username = username
+        self._token = token
+        self._target_dir = target_dir
+        self.workers = workers
+        self.buffer_size = buffer_size
+        self.client = client
+        self.store = store
+
+    @property
+    def username(self) -> Optional[str]:
+        return self._username or config.factorio.username
+
+    @property
+    def token(self) -> Optional[str]:
+        return self._token or config.factorio.token
+
+    @property
+    def target_dir(self) -> Path:
+        return Path(self._target_dir or config.factorio.mods_dir)
+
+    def download(self, releases: Iterable[Release]) -> DownloadReport:
+        """Download all given releases.
+
+        Errors are collected in the report instead of being raised.
+
+        Args:
+            releases (Iterable[Release]): Releases to download.
+
+        Returns:
+            DownloadReport
+        """
+        releases = list(releases)
+        self.target_dir.mkdir(parents=True, exist_ok=True)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="f_manager_download"
+        ) as executor:
+            results = list(executor.map(self._download_safe, releases))
+        report = DownloadReport(results, time.perf_counter() - started)
+
+        logger.info(
+            f"Downloaded {len(results) - len(report.failed)}/{len(results)} files, "
+            f"{report.downloaded} bytes at {report.throughput / 1024 / 1024:.2f} MiB/s"
+        )
+        return report
+
+    def _download_safe(self, release: Release) -> DownloadResult:
+        result = DownloadResult(release, self.target_dir.joinpath(release.file_name))
+        try:
+            self.download_release(release, result)
+        except (requests.RequestException, OSError, ChecksumMismatch) as e:
+            logger.error(f"Failed to download '{release.file_name}': {e}")
+            result.error = e
+        return result
+
+    def download_release(
+        self, release: Release, result: Optional[DownloadResult] = None
+    ) -> DownloadResult:
+        """Download a single release, resuming a previous partial download if there is one.
+
+        Args:
+            release (Release): Release to download.
+            result (Optional[DownloadResult], optional): Result object to fill in. Defaults to a new one.
+
+        Raises:
+            ChecksumMismatch: If the downloaded file doesn't match `Release.sha1`
+
+        Returns:
+            DownloadResult
+        """  # noqa: E501
+        path = self.target_dir.joinpath(release.file_name)
+        if result is None:
+            result = DownloadResult(release, path)
+
+        if self.store is not None and release.sha1 and release.sha1 in self.store:
+            self.store.materialize(release.sha1, path)
+            result.from_store = True
+            return result
+
+        part = path.with_name(path.name + PART_SUFFIX)
+
+        hasher = hashlib.sha1()
+        offset = 0
+        if part.exists():
+            with part.open("rb") as f:
+                while chunk := f.read(self.buffer_size):
+                    hasher.update(chunk)
+                    offset += len(chunk)
+
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        client = self.client or get_default_client()
+        response = client.get(
+            f"{MOD_PORTAL_BASE_URL}{release.download_url}",
+            params={"username": self.username, "token": self.token},
+            headers=headers,
+            kind="download",
+            stream=True,
+        )
+        with response:
+            # 416 to a range request means the part file already holds the whole content
+            if not (offset and response.status_code == 416):
+                response.raise_for_status()
+                if offset and response.status_code != 206:
+                    # server ignored the range, start over
+                    hasher = hashlib.sha1()
+                    offset = 0
+                result.resumed = bool(offset)
+
+                with part.open("ab" if offset else "wb") as f:
+                    # never preallocated: a part file cut short must end where its content ends,
+                    # the next attempt resumes from its size
+                    result.downloaded = copy_response(
+                        response,
+                        f,
+                        hasher=hasher,
+                        buffer_size=self.buffer_size,
+                    )
+
+        digest = hasher.hexdigest()
+        if release.sha1 and digest != release.sha1:
+            part.unlink(missing_ok=True)
+            raise ChecksumMismatch(release.file_name, release.sha1, digest)
+
+        if self.store is not None:
+            self.store.add(part, digest, release.file_name)
+            self.store.materialize(digest, path)
+        else:
+            os.replace(part, path)
+        return result
@@ -2,4 +2,12 @@ class LoginFailed(Exception):
     pass
 
 class EmailAuthenticationRequired(Exception):
-    pass
\ No newline at end of file
+    pass
+
+
+class ChecksumMismatch(Exception):
+    def __init__(self, filename: str, expected: str, actual: str) -> None:
+        super().__init__(f"Checksum mismatch for '{filename}': expected {expected}, got {actual}")
+        self.filename = filename
+        self.expected = expected
+        self.actual = actual
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 
 class Links:
@@ -173,3 +173,210 @@ class BookmarkToggleStatus:
 
     def __repr__(self) -> str:
         return f"BookmarkToggleStatus(mod='{self.mod}', state='{self.state}', success='{self.success}')"
+
+
+################################################################################
+
+
+class _LazyObject:
+    """Base of compact portal objects.
+
+    Instances only keep a reference to the decoded JSON and answer attribute access from it.
+    Nested objects and dates are built on first access and cached in slots.
+    """
+
+    __slots__ = ("_data",)
+    _defaults: Dict[str, Any] = {}
+
+    def __init__(self, json_data: dict):
+        self._data = json_data
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._data[name]
+        except KeyError:
+            if name in self._defaults:
+                return self._defaults[name]
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from None
+
+    def __getstate__(self):
+        return self._data
+
+    def __setstate__(self, state):
+        self._data = state
+
+
+class LazyModInfoShort(_LazyObject):
+    """Compact version of `ModInfoShort`."""
+
+    __slots__ = ()
+    _defaults = {"dependencies": None}
+
+    factorio_version: str
+    dependencies: Optional[List[str]]
+
+    def __repr__(self) -> str:
+        return f"LazyModInfoShort(factorio_version='{self.factorio_version}', dependencies='{self.dependencies}')"
+
+
+class LazyRelease(_LazyObject):
+    """Compact version of `Release`."""
+
+    __slots__ = ("_released_at", "_info_json")
+
+    download_url: str
+    file_name: str
+    version: str
+    sha1: str
+
+    @property
+    def released_at(self) -> datetime:
+        try:
+            return self._released_at
+        except AttributeError:
+            self._released_at = datetime.fromisoformat(self._data["released_at"])
+            return self._released_at
+
+    @property
+    def info_json(self) -> LazyModInfoShort:
+        try:
+            return self._info_json
+        except AttributeError:
+            self._info_json = LazyModInfoShort(self._data["info_json"])
+            return self._info_json
+
+    def __repr__(self) -> str:
+        return f"LazyRelease(download_url='{self.download_url}', file_name='{self.file_name}', info_json='{self.info_json}', released_at='{self.released_at}', version='{self.version}', sha1='{self.sha1}')"
+
+
+class LazyTag(_LazyObject):
+    """Compact version of `Tag`."""
+
+    __slots__ = ()
+
+    id: int
+    name: str
+    title: str
+    description: str
+    type: str
+
+    def __repr__(self) -> str:
+        return f"LazyTag(id='{self.id}', name='{self.name}', title='{self.title}', description='{self.description}', type='{self.type}')"
+
+
+class LazyLicense(_LazyObject):
+    """Compact version of `License`."""
+
+    __slots__ = ()
+
+    description: str
+    id: str
+    name: str
+    title: str
+    url: str
+
+    def __repr__(self) -> str:
+        return f"LazyLicense(description='{self.description}', id='{self.id}', name='{self.name}', title='{self.title}', url='{self.url}')"
+
+
+class LazyResult(_LazyObject):
+    """Compact version of `Result` parsing releases, tags, licences and dates on first access."""
+
+    __slots__ = ("_created_at", "_latest_release", "_releases", "_tag", "_licence")
+    _defaults = {
+        "thumbnail": None,
+        "changelog": None,
+        "description": None,
+        "source_url": None,
+        "github_path": None,
+        "homepage": None,
+    }
+
+    downloads_count: int
+    name: str
+    owner: str
+    summary: str
+    title: str
+    category: str
+    thumbnail: Optional[str]
+    changelog: Optional[str]
+    description: Optional[str]
+    source_url: Optional[str]
+    github_path: Optional[str]
+    homepage: Optional[str]
+
+    @property
+    def created_at(self) -> Optional[datetime]:
+        try:
+            return self._created_at
+        except AttributeError:
+            created_at = self._data.get("created_at")
+            self._created_at = datetime.fromisoformat(created_at) if created_at else None
+            return self._created_at
+
+    @property
+    def latest_release(self) -> Optional[LazyRelease]:
+        try:
+            return self._latest_release
+        except AttributeError:
+            latest_release = self._data.get("latest_release")
+            self._latest_release = LazyRelease(latest_release) if latest_release else None
+            return self._latest_release
+
+    @property
+    def releases(self) -> Optional[List[LazyRelease]]:
+        try:
+            return self._releases
+        except AttributeError:
+            releases = self._data.get("releases")
+            self._releases = [LazyRelease(r) for r in releases] if releases else None
+            return self._releases
+
+    @property
+    def tag(self) -> Optional[List[LazyTag]]:
+        try:
+            return self._tag
+        except AttributeError:
+            tag = self._data.get("tag")
+            self._tag = [LazyTag(t) for t in tag] if tag else None
+            return self._tag
+
+    @property
+    def licence(self) -> Optional[List[LazyLicense]]:
+        try:
+            return self._licence
+        except AttributeError:
+            licence = self._data.get("licence")
+            self._licence = [LazyLicense(lic) for lic in licence] if licence else None
+            return self._licence
+
+    def __repr__(self) -> str:
+        return f"LazyResult(downloads_count='{self.downloads_count}', latest_release='{self.latest_release}', name='{self.name}', owner='{self.owner}', releases='{self.releases}', summary='{self.summary}', title='{self.title}', category='{self.category}', thumbnail='{self.thumbnail}', changelog='{self.changelog}', created_at='{self.created_at}', description='{self.description}', source_url='{self.source_url}', github_path='{self.github_path}', homepage='{self.homepage}', tag='{self.tag}', licence='{self.licence}')"
+
+
+class LazyModListResponse:
+    """Compact version of `ModListResponse` wrapping results on first access."""
+
+    __slots__ = ("pagination", "_data", "_results")
+
+    pagination: Optional[Pagination]
+
+    def __init__(self, json_data: dict):
+        pagination = json_data.get("pagination")
+        self.pagination = Pagination(pagination) if pagination else None
+        self._data = json_data
+
+    @property
+    def results(self) -> List[LazyResult]:
+        try:
+            return self._results
+        except AttributeError:
+            self._results = [LazyResult(result) for result in self._data["results"]]
+            return self._results
+
+    def __repr__(self) -> str:
+        return f"LazyModListResponse(pagination='{self.pagination}', results='{self.results}')"
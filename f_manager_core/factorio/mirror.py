@@ -0,0 +1,347 @@
+from datetime import datetime
+import json
+from pathlib import Path
+import sqlite3
+from typing import Any, Iterable, List, Literal, Optional
+
+from f_manager_core.configuration import config
+from f_manager_core.factorio.api import get_categories, get_mods, iter_mods
+from f_manager_core.factorio.batch import get_mods_by_names
+from f_manager_core.factorio.json_object_types import Category, Release, Result
+from f_manager_core.factorio.snapshot import read_snapshot, write_snapshot
+from f_manager_core.logger import logger
+
+MIRROR_FILE_NAME = "catalog.sqlite3"
+SYNC_PAGE_SIZE = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mods (
+    name TEXT PRIMARY KEY,
+    title TEXT,
+    owner TEXT,
+    summary TEXT,
+    category TEXT,
+    downloads_count INTEGER,
+    updated_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS releases (
+    mod_name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    factorio_version TEXT,
+    released_at TEXT,
+    sha1 TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (mod_name, version)
+);
+CREATE TABLE IF NOT EXISTS tags (
+    mod_name TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (mod_name, tag)
+);
+CREATE TABLE IF NOT EXISTS categories (
+    name TEXT PRIMARY KEY,
+    title TEXT,
+    description TEXT
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS mods_name_nocase ON mods (name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS mods_owner ON mods (owner);
+CREATE INDEX IF NOT EXISTS mods_category ON mods (category);
+CREATE INDEX IF NOT EXISTS releases_factorio_version ON releases (factorio_version, mod_name);
+CREATE INDEX IF NOT EXISTS releases_sha1 ON releases (sha1);
+CREATE INDEX IF NOT EXISTS tags_tag ON tags (tag);
+"""
+
+
+def _as_json(obj: Any) -> Any:
+    """Turn parsed portal objects back into plain JSON data."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, list):
+        return [_as_json(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: _as_json(value) for key, value in obj.items()}
+    if hasattr(obj, "__dict__"):
+        return _as_json(vars(obj))
+    return obj
+
+
+def _updated_at(result: Result) -> Optional[str]:
+    releases = result.releases or ([result.latest_release] if result.latest_release else [])
+    if not releases:
+        return None
+    return max(release.released_at for release in releases).isoformat()
+
+
+class CatalogMirror:
+    """Local SQLite copy of the mod portal catalog.
+
+    The first `sync` loads the whole catalog, following ones only fetch mods updated since
+    the last seen release (pages sorted by `updated_at`), so lookups, searches and update
+    checks don't need the network.
+
+    List responses only carry `latest_release`, so the first load stores just the latest
+    release of every mod. All releases of mods updated since are fetched with `namelist`
+    queries, so `releases` fills up with older versions as mods get updated.
+    """
+
+    def __init__(
+        self,
+        version: Literal["0.13", "0.14", "0.15", "0.16", "0.17", "0.18", "1.0", "1.1"] = "1.1",
+        path: Optional[Path] = None,
+    ) -> None:
+        """
+        Args:
+            version (Literal[`0.13`, `0.14`, `0.15`, `0.16`, `0.17`, `0.18`, `1.0`, `1.1`], optional): Factorio version of mirrored mods. Defaults to "1.1".
+            path (Optional[Path], optional): Database file. Defaults to a file in `config.data.storage`.
+        """  # noqa: E501
+        self.version = version
+        self._path = path
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def path(self) -> Path:
+        return Path(self._path or config.data.storage.joinpath(MIRROR_FILE_NAME))
+
+    @property
+    def snapshot_path(self) -> Path:
+        """Binary snapshot of all mirrored mods, next to the database."""
+        return self.path.with_name(f"{self.path.stem}-{self.version}.snapshot")
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path)
+            self._connection.executescript(_SCHEMA)
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self) -> "CatalogMirror":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    ############################################################################
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self.connection.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+
+    @property
+    def last_updated_at(self) -> Optional[str]:
+        """Timestamp of the newest release seen by the last sync."""
+        return self._get_meta(f"last_updated_at:{self.version}")
+
+    def store(self, results: Iterable[Result]) -> Optional[str]:
+        """Insert or update mods.
+
+        Args:
+            results (Iterable[Result]): Mods to store.
+
+        Returns:
+            Optional[str]: Timestamp of the newest stored release
+        """
+        newest = None
+        with self.connection:
+            for result in results:
+                updated_at = _updated_at(result)
+                if updated_at and (newest is None or updated_at > newest):
+                    newest = updated_at
+
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO mods VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        result.name,
+                        getattr(result, "title", None),
+                        getattr(result, "owner", None),
+                        getattr(result, "summary", None),
+                        getattr(result, "category", None),
+                        getattr(result, "downloads_count", None),
+                        updated_at,
+                        json.dumps(_as_json(vars(result))),
+                    ),
+                )
+
+                releases = list(result.releases or [])
+                if result.latest_release:
+                    releases.append(result.latest_release)
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO releases VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            result.name,
+                            release.version,
+                            getattr(release.info_json, "factorio_version", None),
+                            release.released_at.isoformat(),
+                            release.sha1,
+                            json.dumps(_as_json(vars(release))),
+                        )
+                        for release in releases
+                    ],
+                )
+
+                self.connection.execute("DELETE FROM tags WHERE mod_name = ?", (result.name,))
+                self.connection.executemany(
+                    "INSERT OR IGNORE INTO tags VALUES (?, ?)",
+                    [(result.name, getattr(tag, "name", tag)) for tag in result.tag or []],
+                )
+        return newest
+
+    def sync(self) -> int:
+        """Bring the mirror up to date with the portal.
+
+        Returns:
+            int: Amount of stored (new or updated) mods
+        """
+        last_updated_at = self.last_updated_at
+        count = 0
+
+        def counted(results: Iterable[Result]) -> Iterable[Result]:
+            nonlocal count
+            for result in results:
+                count += 1
+                yield result
+
+        if last_updated_at is None:
+            logger.info("Loading the whole mod portal catalog")
+            newest = self.store(counted(iter_mods(self.version, page_size="max")))
+        else:
+            newest = last_updated_at
+            page = 1
+            while True:
+                response = get_mods(
+                    self.version,
+                    page=page,
+                    page_size=SYNC_PAGE_SIZE,
+                    sort="updated_at",
+                    sort_order="desc",
+                    # a cached page of a previous sync would hide updates made since
+                    cached=False,
+                )
+                updated = [
+                    result
+                    for result in response.results
+                    if (_updated_at(result) or "") > last_updated_at
+                ]
+                if stored_newest := self.store(counted(self._with_releases(updated))):
+                    newest = max(newest, stored_newest)
+
+                # the portal's updated_at of a mod may move without a new release, so a single
+                # older mod on a page doesn't mean the following pages are older too
+                page_count = response.pagination.page_count if response.pagination else 1
+                if (
+                    not response.results
+                    or (_updated_at(response.results[-1]) or "") <= last_updated_at
+                    or page >= page_count
+                ):
+                    break
+                page += 1
+
+        with self.connection:
+            self.connection.execute("DELETE FROM categories")
+            self.connection.executemany(
+                "INSERT INTO categories VALUES (?, ?, ?)",
+                [(c.name, c.title, c.desciption) for c in get_categories()],
+            )
+            if newest:
+                self._set_meta(f"last_updated_at:{self.version}", newest)
+
+        if count or not self.snapshot_path.exists():
+            self.write_snapshot()
+
+        logger.info(f"Catalog mirror synced, {count} mods stored")
+        return count
+
+    def _with_releases(self, results: List[Result]) -> List[Result]:
+        """Attach all releases to list results, which only carry `latest_release`."""
+        if not results:
+            return results
+        found = get_mods_by_names([result.name for result in results], version=self.version)
+        for result in results:
+            if (full := found.get(result.name)) is not None and full.releases:
+                result.releases = full.releases
+        return results
+
+    def write_snapshot(self) -> List[Result]:
+        """Write all mirrored mods to the binary snapshot."""
+        results = self._results("SELECT data FROM mods ORDER BY name")
+        write_snapshot(self.snapshot_path, results, tag=self.last_updated_at or "")
+        return results
+
+    def all(self) -> List[Result]:
+        """Return all mirrored mods ordered by name.
+
+        They are loaded from the binary snapshot, which is much faster than parsing stored JSON.
+        The snapshot is rebuilt if it is missing or doesn't match the last sync or object types.
+        """
+        results = read_snapshot(self.snapshot_path, tag=self.last_updated_at or "")
+        if results is None:
+            results = self.write_snapshot()
+        return results
+
+    ############################################################################
+
+    def _results(self, query: str, params: tuple = ()) -> List[Result]:
+        return [Result(json.loads(data)) for (data,) in self.connection.execute(query, params)]
+
+    def get(self, name: str) -> Optional[Result]:
+        results = self._results("SELECT data FROM mods WHERE name = ?", (name,))
+        return results[0] if results else None
+
+    def search(self, text: str, limit: int = 50) -> List[Result]:
+        """Find mods having `text` in their name, title or summary, most downloaded first."""
+        pattern = f"%{text}%"
+        return self._results(
+            "SELECT data FROM mods WHERE name LIKE ? OR title LIKE ? OR summary LIKE ? "
+            "ORDER BY downloads_count DESC LIMIT ?",
+            (pattern, pattern, pattern, limit),
+        )
+
+    def by_owner(self, owner: str) -> List[Result]:
+        return self._results("SELECT data FROM mods WHERE owner = ? ORDER BY name", (owner,))
+
+    def by_category(self, category: str) -> List[Result]:
+        return self._results("SELECT data FROM mods WHERE category = ? ORDER BY name", (category,))
+
+    def by_tag(self, tag: str) -> List[Result]:
+        return self._results(
+            "SELECT data FROM mods WHERE name IN (SELECT mod_name FROM tags WHERE tag = ?) ORDER BY name",
+            (tag,),
+        )
+
+    def by_factorio_version(self, factorio_version: str) -> List[Result]:
+        return self._results(
+            "SELECT data FROM mods WHERE name IN "
+            "(SELECT mod_name FROM releases WHERE factorio_version = ?) ORDER BY name",
+            (factorio_version,),
+        )
+
+    def releases(self, name: str) -> List[Release]:
+        """Return all known releases of a mod, oldest first."""
+        return [
+            Release(json.loads(data))
+            for (data,) in self.connection.execute(
+                "SELECT data FROM releases WHERE mod_name = ? ORDER BY released_at", (name,)
+            )
+        ]
+
+    def categories(self) -> List[Category]:
+        return [
+            Category(list(row))
+            for row in self.connection.execute("SELECT title, name, description FROM categories")
+        ]
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM mods").fetchone()[0]
@@ -0,0 +1,163 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import threading
+import time
+from typing import Dict, Literal, Optional
+
+RequestKind = Literal["metadata", "download"]
+
+DEFAULT_BUDGETS: Dict[str, Dict[str, float]] = {
+    "metadata": {"rate": 10.0, "max_rate": 20.0, "capacity": 20.0},
+    "download": {"rate": 4.0, "max_rate": 8.0, "capacity": 8.0},
+}
+DEFAULT_RETRY_AFTER = 1.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a `Retry-After` header value into seconds.
+
+    Args:
+        value (Optional[str]): Header value, either seconds or an HTTP date.
+
+    Returns:
+        Optional[float]: Seconds to wait or None if the value is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens can go below zero: a caller that takes a missing token reserves it and sleeps until
+    it would have been refilled, so waiting callers are served in order.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """
+        Args:
+            rate (float): Tokens added per second.
+            capacity (float): Maximum amount of stored tokens (burst size).
+        """
+        self.rate = rate
+        self.capacity = capacity
+
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Take one token, waiting for it if needed.
+
+        Returns:
+            float: Time spent waiting in seconds
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def set_rate(self, rate: float) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def pause(self, seconds: float) -> None:
+        """Don't hand out any token for the next `seconds` seconds."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class AdaptiveRateLimiter:
+    """Client-side rate limiter for portal requests.
+
+    Metadata and download requests have separate budgets. Every 429 answer halves the rate of
+    its budget and pauses it for `Retry-After` seconds, while successful requests raise the rate
+    back additively up to its maximum (AIMD), so bulk operations settle on the fastest rate the
+    portal accepts. Throttled answers of requests that were already in flight during the pause
+    don't decrease the rate again.
+    """
+
+    def __init__(
+        self,
+        budgets: Optional[Dict[str, Dict[str, float]]] = None,
+        min_rate: float = 0.5,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+    ) -> None:
+        """
+        Args:
+            budgets (Optional[Dict[str, Dict[str, float]]], optional): `rate`, `max_rate` and `capacity` by request kind. Defaults to `DEFAULT_BUDGETS`.
+            min_rate (float, optional): Rate never goes below this value. Defaults to 0.5.
+            increase (float, optional): Rate added after each successful request. Defaults to 0.1.
+            decrease (float, optional): Rate multiplier applied after each throttled request. Defaults to 0.5.
+        """  # noqa: E501
+        budgets = budgets or DEFAULT_BUDGETS
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+
+        self._max_rates = {kind: budget["max_rate"] for kind, budget in budgets.items()}
+        self._buckets = {
+            kind: TokenBucket(budget["rate"], budget["capacity"])
+            for kind, budget in budgets.items()
+        }
+        self._paused_until = {kind: 0.0 for kind in budgets}
+
+    def rate(self, kind: RequestKind) -> float:
+        return self._buckets[kind].rate
+
+    def acquire(self, kind: RequestKind) -> float:
+        """Wait until a request of the given kind may be sent.
+
+        Returns:
+            float: Time spent waiting in seconds
+        """
+        return self._buckets[kind].acquire()
+
+    def on_success(self, kind: RequestKind) -> None:
+        bucket = self._buckets[kind]
+        if bucket.rate < self._max_rates[kind]:
+            bucket.set_rate(min(self._max_rates[kind], bucket.rate + self.increase))
+
+    def on_throttled(self, kind: RequestKind, retry_after: Optional[float] = None) -> None:
+        if retry_after is None:
+            retry_after = DEFAULT_RETRY_AFTER
+
+        now = time.monotonic()
+        bucket = self._buckets[kind]
+        if now >= self._paused_until[kind]:
+            bucket.set_rate(max(self.min_rate, bucket.rate * self.decrease))
+        self._paused_until[kind] = max(self._paused_until[kind], now + retry_after)
+        bucket.pause(retry_after)
+
+
+_default_limiter: Optional[AdaptiveRateLimiter] = None
+
+
+def get_default_limiter() -> AdaptiveRateLimiter:
+    """Return the rate limiter shared by all portal clients, creating it on first use."""
+    global _default_limiter
+    if _default_limiter is None:
+        _default_limiter = AdaptiveRateLimiter()
+    return _default_limiter
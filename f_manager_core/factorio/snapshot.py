@@ -0,0 +1,97 @@
+"""Binary snapshots of parsed portal objects.
+
+A snapshot is a small header followed by a pickle (protocol 5) of the objects. Loading one
+skips JSON decoding and rebuilding `Result`/`Release` objects (with their dates), which is
+what makes a cold start slow. The header holds a hash of `json_object_types.py`, so any
+change to the object types invalidates old snapshots instead of unpickling stale objects.
+
+Snapshots are local cache files written by this package, never load ones from elsewhere.
+"""
+
+from functools import lru_cache
+import gc
+import hashlib
+import mmap
+import os
+from pathlib import Path
+import pickle
+import struct
+from typing import Any, Optional
+
+from f_manager_core.factorio import json_object_types
+from f_manager_core.logger import logger
+
+MAGIC = b"FMSNAP"
+FORMAT_VERSION = 1
+PICKLE_PROTOCOL = 5
+
+# magic, format version, schema hash, tag length
+_HEADER = struct.Struct("<6sH32sI")
+
+
+@lru_cache(maxsize=None)
+def schema_hash() -> bytes:
+    """Hash of the object types module, changes whenever the types do."""
+    source = Path(json_object_types.__file__).read_bytes()
+    return hashlib.sha256(source).digest()
+
+
+def _loads(payload: memoryview) -> Any:
+    # unpickling creates lots of objects and none of them is garbage, so the collector
+    # would only keep rescanning them
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(payload)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def write_snapshot(path: Path, data: Any, tag: str = "") -> None:
+    """Write a snapshot atomically.
+
+    Args:
+        path (Path): Snapshot file.
+        data (Any): Objects to store (usually a list of `Result`).
+        tag (str, optional): Marks the state of the source of `data`, like a sync timestamp. Defaults to "".
+    """  # noqa: E501
+    encoded_tag = tag.encode()
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, schema_hash(), len(encoded_tag)))
+        file.write(encoded_tag)
+        pickle.dump(data, file, protocol=PICKLE_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path: Path, tag: Optional[str] = None) -> Optional[Any]:
+    """Load a snapshot.
+
+    Args:
+        path (Path): Snapshot file.
+        tag (Optional[str], optional): Expected tag, a different one makes the snapshot stale. Defaults to any tag.
+
+    Returns:
+        Optional[Any]: Stored objects, `None` if the snapshot is missing, stale or unreadable
+    """  # noqa: E501
+    try:
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if len(mapped) < _HEADER.size:
+                return None
+            magic, version, schema, tag_length = _HEADER.unpack_from(mapped)
+            if magic != MAGIC or version != FORMAT_VERSION or schema != schema_hash():
+                logger.debug(f"Snapshot {path} was written by another version, ignoring it")
+                return None
+
+            start = _HEADER.size + tag_length
+            if tag is not None and mapped[_HEADER.size:start].decode() != tag:
+                return None
+
+            with memoryview(mapped) as view, view[start:] as payload:
+                return _loads(payload)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+        logger.warning(f"Can't read snapshot {path}: {e}")
+        return None
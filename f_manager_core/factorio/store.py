@@ -0,0 +1,234 @@
+import errno
+import os
+from pathlib import Path
+import shutil
+import sys
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
+
+from f_manager_core.configuration import config
+from f_manager_core.factorio.streaming import sha1_file
+from f_manager_core.info_cache import Sha1Cache
+from f_manager_core.logger import logger
+
+STORE_DIR_NAME = "blobs"
+DEFAULT_METHODS = ("reflink", "hardlink", "symlink", "copy")
+
+# ioctl request of Linux FICLONE (_IOW(0x94, 9, int))
+_FICLONE = 0x40049409
+
+
+def _reflink(source: Path, destination: Path) -> None:
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "Reflinks are only supported on Linux")
+
+    import fcntl
+
+    with source.open("rb") as src, destination.open("wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            destination.unlink(missing_ok=True)
+            raise
+
+
+def _link(source: Path, destination: Path, method: str) -> None:
+    match method:
+        case "reflink":
+            _reflink(source, destination)
+        case "hardlink":
+            os.link(source, destination)
+        case "symlink":
+            os.symlink(source, destination)
+        case "copy":
+            shutil.copyfile(source, destination)
+        case _:
+            raise ValueError(f"Unknown materialization method '{method}'")
+
+
+def _content_sha1(
+    files: Iterable[Tuple[Path, os.stat_result]], cache: Optional[Sha1Cache]
+) -> Set[str]:
+    """Return sha1 of the content of files, hashing only those missing from the cache."""
+    found = set()
+    hashed = []
+    for file, stat in files:
+        if cache is not None and (sha1 := cache.get(file, stat)) is not None:
+            found.add(sha1)
+            continue
+        try:
+            sha1 = sha1_file(file)
+        except OSError as e:
+            logger.warning(f"Can't read '{file}': {e}")
+            continue
+        found.add(sha1)
+        hashed.append((file, sha1, stat))
+
+    if cache is not None and hashed:
+        cache.put_many(hashed)
+    return found
+
+
+class BlobStore:
+    """Content-addressed store of mod files shared by all mods directories.
+
+    Files are kept once per sha1 (as ``<root>/<sha1[:2]>/<sha1>/<file_name>``) and materialized
+    into mods directories as reflinks, hardlinks or symlinks, falling back to a plain copy.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        """
+        Args:
+            path (Optional[Path], optional): Root of the store. Defaults to a directory in `config.data.storage`.
+        """  # noqa: E501
+        self._path = path
+
+    @property
+    def path(self) -> Path:
+        return Path(self._path or config.data.storage.joinpath(STORE_DIR_NAME))
+
+    def _blob_dir(self, sha1: str) -> Path:
+        return self.path.joinpath(sha1[:2], sha1)
+
+    def get(self, sha1: str) -> Optional[Path]:
+        """Return the stored file with the given sha1 if there is one."""
+        blob_dir = self._blob_dir(sha1)
+        if not blob_dir.is_dir():
+            return None
+        return next(blob_dir.iterdir(), None)
+
+    def __contains__(self, sha1: str) -> bool:
+        return self.get(sha1) is not None
+
+    def __iter__(self):
+        """Iterate over sha1 of all stored files."""
+        if not self.path.is_dir():
+            return
+        for prefix in self.path.iterdir():
+            for blob_dir in prefix.iterdir():
+                yield blob_dir.name
+
+    def add(self, file: Path, sha1: str, file_name: Optional[str] = None) -> Path:
+        """Move a verified file into the store.
+
+        Args:
+            file (Path): File to move. It is expected to match `sha1`.
+            sha1 (str): sha1 hex digest of the file.
+            file_name (Optional[str], optional): Name the file is materialized with. Defaults to the name of `file`.
+
+        Returns:
+            Path: Path of the stored file
+        """  # noqa: E501
+        blob_dir = self._blob_dir(sha1)
+        blob_dir.mkdir(parents=True, exist_ok=True)
+        blob = blob_dir.joinpath(file_name or file.name)
+        try:
+            os.replace(file, blob)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.copyfile(file, blob)
+            file.unlink()
+        return blob
+
+    def materialize(
+        self, sha1: str, destination: Path, methods: Sequence[str] = DEFAULT_METHODS
+    ) -> str:
+        """Make a stored file available at `destination`, replacing whatever is there.
+
+        Args:
+            sha1 (str): sha1 of the stored file.
+            destination (Path): Where the file should appear.
+            methods (Sequence[str], optional): Methods to try in order. Defaults to reflink, hardlink, symlink, copy.
+
+        Raises:
+            KeyError: If there is no file with that sha1 in the store
+
+        Returns:
+            str: Used method
+        """  # noqa: E501
+        blob = self.get(sha1)
+        if blob is None:
+            raise KeyError(sha1)
+
+        temporary = destination.with_name(destination.name + ".tmp")
+        temporary.unlink(missing_ok=True)
+        for method in methods:
+            try:
+                _link(blob, temporary, method)
+            except OSError as e:
+                logger.debug(f"Could not {method} '{blob}' to '{destination}': {e}")
+                continue
+            os.replace(temporary, destination)
+            return method
+
+        raise OSError(f"Could not materialize '{blob}' to '{destination}'")
+
+    def gc(
+        self,
+        mods_dirs: Iterable[Path],
+        cache: Optional[Sha1Cache] = None,
+        use_cache: bool = True,
+    ) -> List[str]:
+        """Remove stored files that are not used by any of the given mods directories.
+
+        A stored file is used if a mods directory contains a hardlink of it, a symlink (absolute
+        or relative) resolving to it, or a file with the same content. Reflinks and copies share
+        no inode with the stored file, so they are matched by their sha1.
+
+        Args:
+            mods_dirs (Iterable[Path]): All mods directories using the store.
+            cache (Optional[Sha1Cache], optional): Cache of sha1 of mods directory files. Defaults to one in `config.data.storage`.
+            use_cache (bool, optional): Read and update the cache. Defaults to True.
+
+        Returns:
+            List[str]: sha1 of removed files
+        """  # noqa: E501
+        if use_cache and cache is None:
+            cache = Sha1Cache()
+
+        inodes = set()
+        targets = set()
+        files: List[Tuple[Path, os.stat_result]] = []
+        for mods_dir in mods_dirs:
+            for file in Path(mods_dir).glob("*.zip"):
+                targets.add(os.path.realpath(file))
+                try:
+                    stat = os.stat(file)
+                except FileNotFoundError:  # dangling symlink
+                    continue
+                inodes.add((stat.st_dev, stat.st_ino))
+                if not file.is_symlink():
+                    files.append((file, stat))
+
+        stored = list(self)
+        unused = set()
+        blob_inodes = set()
+        for sha1 in stored:
+            blob = self.get(sha1)
+            if blob is not None:
+                stat = blob.stat()
+                blob_inodes.add((stat.st_dev, stat.st_ino))
+                if (stat.st_dev, stat.st_ino) in inodes or os.path.realpath(blob) in targets:
+                    continue
+            unused.add(sha1)
+
+        if unused:
+            # files sharing an inode with a stored file were matched above, only hash the others
+            others = [
+                (file, stat) for file, stat in files if (stat.st_dev, stat.st_ino) not in blob_inodes
+            ]
+            unused -= _content_sha1(others, cache)
+
+        removed = []
+        for sha1 in stored:
+            if sha1 not in unused:
+                continue
+            blob_dir = self._blob_dir(sha1)
+            shutil.rmtree(blob_dir)
+            if not any(blob_dir.parent.iterdir()):
+                blob_dir.parent.rmdir()
+            removed.append(sha1)
+
+        logger.info(f"Removed {len(removed)} unused files from the store")
+        return removed
@@ -0,0 +1,228 @@
+import codecs
+import hashlib
+import json
+import os
+from typing import Any, BinaryIO, Iterable, Iterator, Optional
+
+import requests
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError, SSLError
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+
+def preallocate(file: BinaryIO, size: int) -> None:
+    """Reserve `size` bytes for a file opened for writing, so the file system can lay it out in one piece.
+
+    Args:
+        file (BinaryIO): File opened for writing.
+        size (int): Expected size of the file.
+    """  # noqa: E501
+    if size <= 0:
+        return
+
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(file.fileno(), file.tell(), size)
+            return
+        except OSError:
+            # not supported by the file system
+            pass
+    file.truncate(file.tell() + size)
+
+
+def sha1_file(path: os.PathLike, buffer_size: int = DEFAULT_BUFFER_SIZE) -> str:
+    """Hash a file reading it into one reusable buffer.
+
+    `hashlib` releases the GIL while hashing large blocks, so files can be hashed on threads.
+
+    Args:
+        path (os.PathLike): File to hash.
+        buffer_size (int, optional): Size of read blocks. Defaults to 1 MiB.
+
+    Returns:
+        str: Hex digest of the sha1 of the file
+    """
+    hasher = hashlib.sha1()
+    buffer = memoryview(bytearray(buffer_size))
+    with open(path, "rb", buffering=0) as file:
+        while read := file.readinto(buffer):
+            hasher.update(buffer[:read])
+    return hasher.hexdigest()
+
+
+def copy_response(
+    response: requests.Response,
+    file: BinaryIO,
+    hasher=None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    preallocate_file: bool = False,
+) -> int:
+    """Copy the body of a streamed response into a file.
+
+    The body is read straight from the underlying connection into one reusable
+    buffer, which is written to the file and fed to `hasher` in the same pass.
+
+    Args:
+        response (requests.Response): Response requested with `stream=True`.
+        file (BinaryIO): File opened for writing.
+        hasher (optional): Object with an `update` method (like `hashlib.sha1()`). Defaults to None.
+        buffer_size (int, optional): Size of the read buffer. Defaults to 1 MiB.
+        preallocate_file (bool, optional): Reserve space for the file using `Content-Length`. Defaults to False.
+
+    Raises:
+        requests.RequestException: If the connection broke while reading the body
+
+    Returns:
+        int: Amount of written bytes
+    """  # noqa: E501
+    start = file.tell()
+    expected: Optional[int] = None
+    if preallocate_file and (length := response.headers.get("Content-Length")):
+        expected = int(length)
+        preallocate(file, expected)
+
+    raw = response.raw
+    raw.decode_content = True
+
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    written = 0
+    try:
+        while n := raw.readinto(buffer):
+            chunk = view[:n]
+            if hasher is not None:
+                hasher.update(chunk)
+            file.write(chunk)
+            written += n
+    # raised as `requests` exceptions, like `Response.iter_content` does
+    except ProtocolError as e:
+        raise requests.exceptions.ChunkedEncodingError(e)
+    except DecodeError as e:
+        raise requests.exceptions.ContentDecodingError(e)
+    except ReadTimeoutError as e:
+        raise requests.exceptions.ConnectionError(e)
+    except SSLError as e:
+        raise requests.exceptions.SSLError(e)
+    finally:
+        # also give back space reserved for the rest of a body that was cut short
+        if expected is not None and expected != written:
+            file.truncate(start + written)
+
+    return written
+
+
+class _JsonReader:
+    """Incremental reader of a JSON document coming in chunks of bytes."""
+
+    _decoder = json.JSONDecoder()
+    _whitespace = " \t\n\r"
+    _number_continuation = ".eE+-"
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+
+        # drop everything that is already consumed
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+
+        for chunk in self._chunks:
+            if text := self._text_decoder.decode(chunk):
+                self._buffer += text
+                return True
+
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        self._eof = True
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self._pos < len(self._buffer):
+                char = self._buffer[self._pos]
+                if char not in self._whitespace:
+                    return char
+                self._pos += 1
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON data")
+
+    def expect(self, char: str) -> None:
+        if (found := self.peek()) != char:
+            raise ValueError(f"Expected '{char}' but got '{found}' in JSON data")
+        self._pos += 1
+
+    def skip(self, char: str) -> bool:
+        if self.peek() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # the value may just be incomplete yet
+                if not self._fill():
+                    raise
+                continue
+
+            if (
+                isinstance(value, (int, float))
+                and (end == len(self._buffer) or self._buffer[end] in self._number_continuation)
+                and self._fill()
+            ):
+                # a number could continue in the next chunk, "1." or "1e" are decoded as 1
+                continue
+
+            self._pos = end
+            return value
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str = "results") -> Iterator[Any]:
+    """Lazily decode items of an array stored under `key` of a top-level JSON object.
+
+    Only one item (plus the unparsed tail of the current chunk) is kept in memory at a time,
+    so it doesn't matter how large the whole document is. Other keys are parsed and skipped.
+
+    Args:
+        chunks (Iterable[bytes]): Raw document split into chunks of any size (like `Response.iter_content()`).
+        key (str, optional): Key of the array. Defaults to "results".
+
+    Raises:
+        ValueError: If the data is not a valid JSON object
+
+    Yields:
+        Any: Decoded items of the array
+    """  # noqa: E501
+    reader = _JsonReader(chunks)
+
+    reader.expect("{")
+    if reader.skip("}"):
+        return
+
+    while True:
+        name = reader.value()
+        reader.expect(":")
+
+        if name == key:
+            reader.expect("[")
+            if not reader.skip("]"):
+                while True:
+                    yield reader.value()
+                    if reader.skip("]"):
+                        break
+                    reader.expect(",")
+        else:
+            reader.value()
+
+        if reader.skip("}"):
+            return
+        reader.expect(",")
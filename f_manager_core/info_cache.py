@@ -0,0 +1,215 @@
+"""Persistent cache of parsed ``info.json`` files of mod zips.
+
+Mod zips are practically immutable, so the parsed ``info.json`` of every zip is kept in SQLite
+keyed by its path, size and mtime. A changed file has another size or mtime and is read again.
+"""
+
+import json
+import os
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from f_manager_core.configuration import config
+
+INFO_CACHE_FILE_NAME = "mod_info.sqlite3"
+
+
+def _signature(stat: os.stat_result) -> Tuple[int, int]:
+    return stat.st_size, stat.st_mtime_ns
+
+
+class InfoCache:
+    """Parsed `info.json` of mod zips by (path, size, mtime).
+
+    All rows are read into memory on first use, so a warm lookup is a `stat` of the zip and
+    a dict access instead of opening the archive.
+    """
+
+    _table = "mod_info"
+    _column = "info"
+    _encode = staticmethod(json.dumps)
+    _decode = staticmethod(json.loads)
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        """
+        Args:
+            path (Optional[Path], optional): Database file. Defaults to a file in `config.data.storage`.
+        """  # noqa: E501
+        self._path = path
+        self._lock = threading.RLock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._entries: Optional[Dict[str, Tuple[int, int, dict]]] = None
+
+    @property
+    def path(self) -> Path:
+        return Path(self._path or config.data.storage.joinpath(INFO_CACHE_FILE_NAME))
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None
+            )
+            self._connection.executescript(
+                f"""
+                PRAGMA journal_mode=WAL;
+                CREATE TABLE IF NOT EXISTS {self._table} (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    {self._column} TEXT NOT NULL
+                );
+                """
+            )
+        return self._connection
+
+    @property
+    def entries(self) -> Dict[str, Tuple[int, int, dict]]:
+        with self._lock:
+            if self._entries is None:
+                self._entries = {
+                    path: (size, mtime_ns, self._decode(value))
+                    for path, size, mtime_ns, value in self.connection.execute(
+                        f"SELECT path, size, mtime_ns, {self._column} FROM {self._table}"
+                    )
+                }
+            return self._entries
+
+    def get(self, path: Path, stat: Optional[os.stat_result] = None) -> Optional[dict]:
+        """Return the cached `info.json` of a zip if the zip hasn't changed.
+
+        Args:
+            path (Path): Mod zip.
+            stat (Optional[os.stat_result], optional): Already known stat of the zip. Defaults to None.
+
+        Returns:
+            Optional[dict]: Parsed `info.json`, `None` if it isn't cached or is outdated
+        """  # noqa: E501
+        try:
+            stat = stat or os.stat(path)
+        except FileNotFoundError:
+            return None
+        entry = self.entries.get(str(path))
+        if entry is None or entry[:2] != _signature(stat):
+            return None
+        return entry[2]
+
+    def put(self, path: Path, info: dict, stat: Optional[os.stat_result] = None) -> None:
+        """Store the parsed `info.json` of a zip."""
+        size, mtime_ns = _signature(stat or os.stat(path))
+        with self._lock:
+            self.connection.execute(
+                f"INSERT OR REPLACE INTO {self._table} VALUES (?, ?, ?, ?)",
+                (str(path), size, mtime_ns, self._encode(info)),
+            )
+            self.entries[str(path)] = (size, mtime_ns, info)
+
+    def put_many(self, items: Iterable[Tuple[Path, dict, os.stat_result]]) -> None:
+        """Store parsed `info.json` of many zips in one transaction.
+
+        Args:
+            items (Iterable[Tuple[Path, dict, os.stat_result]]): Zips with their `info.json` and stat.
+        """  # noqa: E501
+        rows = [(str(path), *_signature(stat), info) for path, info, stat in items]
+        with self._lock:
+            self.connection.execute("BEGIN")
+            try:
+                self.connection.executemany(
+                    f"INSERT OR REPLACE INTO {self._table} VALUES (?, ?, ?, ?)",
+                    [(path, size, mtime_ns, self._encode(info)) for path, size, mtime_ns, info in rows],
+                )
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+            for path, size, mtime_ns, info in rows:
+                self.entries[path] = (size, mtime_ns, info)
+
+    def load(self, path: Path, read: Callable[[Path], dict]) -> dict:
+        """Return the `info.json` of a zip, reading it with `read` on a cache miss.
+
+        Args:
+            path (Path): Mod zip.
+            read (Callable[[Path], dict]): Function parsing `info.json` of a zip.
+
+        Returns:
+            dict: Parsed `info.json`
+        """
+        stat = os.stat(path)
+        if (info := self.get(path, stat)) is not None:
+            return info
+        info = read(path)
+        self.put(path, info, stat)
+        return info
+
+    def discard(self, path: Path) -> None:
+        with self._lock:
+            self.connection.execute(f"DELETE FROM {self._table} WHERE path = ?", (str(path),))
+            self.entries.pop(str(path), None)
+
+    def prune(self, paths: Iterable[Path]) -> int:
+        """Drop entries of all zips except `paths`.
+
+        Returns:
+            int: Amount of dropped entries
+        """
+        keep = {str(path) for path in paths}
+        with self._lock:
+            stale = [path for path in self.entries if path not in keep]
+            self.connection.executemany(
+                f"DELETE FROM {self._table} WHERE path = ?", [(path,) for path in stale]
+            )
+            for path in stale:
+                del self.entries[path]
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.connection.execute(f"DELETE FROM {self._table}")
+            self._entries = {}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            self._entries = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path='{self.path}')"
+
+
+class Sha1Cache(InfoCache):
+    """Sha1 of mod zips by (path, size, mtime), so unchanged zips aren't hashed again."""
+
+    _table = "mod_sha1"
+    _column = "sha1"
+    _encode = staticmethod(str)
+    _decode = staticmethod(str)
+
+
+_default_cache: Optional[InfoCache] = None
+
+
+def get_info_cache() -> InfoCache:
+    """Return the shared `info.json` cache, creating it on first use."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = InfoCache()
+    return _default_cache
+
+
+def set_info_cache(cache: InfoCache) -> None:
+    """Replace the shared `info.json` cache.
+
+    Args:
+        cache (InfoCache): New shared cache.
+    """
+    global _default_cache
+    _default_cache = cache
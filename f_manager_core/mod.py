@@ -26,33 +26,100 @@ BaseMod
 
 from abc import abstractmethod, ABC
 import json
+from pathlib import Path
 
-from typing import Iterable, Optional
-import zipfile
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from packaging.version import InvalidVersion, Version
 
 from f_manager_core import config
-from f_manager_core.exceptions import BrokenModException, ModNotFoundError
+from f_manager_core.exceptions import ModNotFoundError
+from f_manager_core.factorio.batch import get_mods_by_names
+from f_manager_core.factorio.json_object_types import Release
+from f_manager_core.info_cache import get_info_cache
+from f_manager_core.mod_index import get_mods_index, parse_mod_file_name
+from f_manager_core.mod_info import ModInfo
+from f_manager_core.mod_zip import read_info_json
 
 
 class Mod(ABC):
-    """Base class for mod classes"""
+    """Base class for mod classes
+
+    `info.json` is loaded on the first access to an attribute it provides (`version`, `title`,
+    ...), so creating a mod object doesn't read anything. An already known `info.json` (from a
+    bulk scan or a cache) can be passed to the constructor instead.
+    """
 
     name: str
     version: str
     title: str
     author: str
-    contact: Optional[str] = None
-    homepage: Optional[str] = None
-    description: Optional[str] = None
-    factorio_version: Optional[str] = None
-    dependencies: Optional[Iterable[str]] = ("base",)
+    contact: Optional[str]
+    homepage: Optional[str]
+    description: Optional[str]
+    factorio_version: Optional[str]
+    dependencies: Optional[Iterable[str]]
+
+    # values of optional info.json keys; kept out of the class namespace, otherwise they would
+    # be found before __getattr__ and never trigger loading
+    _defaults: Dict[str, Any] = {
+        "contact": None,
+        "homepage": None,
+        "description": None,
+        "factorio_version": None,
+        "dependencies": ("base",),
+    }
+
+    def __init__(self, info: Optional[Union[dict, ModInfo]] = None) -> None:
+        self._loaded = False
+        if isinstance(info, ModInfo):
+            self.update_from_info(info)
+        elif info is not None:
+            self.update_from_json(info)
+
+    @property
+    def loaded(self) -> bool:
+        """Whether `info.json` of the mod was already loaded."""
+        return self._loaded
+
+    @property
+    def info(self) -> ModInfo:
+        """Compact record of `info.json` with parsed version and dependencies."""
+        if (info := self.__dict__.get("_info")) is None:
+            self.load()
+            info = self._info = ModInfo.from_json(
+                {key: getattr(self, key) for key in ModInfo.__slots__ if hasattr(self, key)}
+            )
+        return info
 
-    def __init__(self) -> None:
-        self.update_from_json(self.get_mod_info_json())
+    def load(self) -> None:
+        """Load `info.json` now instead of on the first attribute access."""
+        if not self._loaded:
+            self.update_from_json(self.get_mod_info_json())
 
     def update_from_json(self, json_data: dict):
         for key, value in json_data.items():
             self.__dict__[key] = value
+        self._loaded = True
+
+    def update_from_info(self, info: ModInfo) -> None:
+        """Use a `ModInfo` record instead of keeping `info.json` keys in the instance."""
+        self._info = info
+        self._loaded = True
+
+    def __getattr__(self, name: str) -> Any:
+        # called only for attributes which aren't set yet
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if not self.__dict__.get("_loaded", True):
+            self.load()
+            if name in self.__dict__:
+                return self.__dict__[name]
+        if (info := self.__dict__.get("_info")) is not None and name in ModInfo.__slots__:
+            return getattr(info, name)
+        if name in self._defaults:
+            return self._defaults[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     @abstractmethod
     def get_mod_info_json(self) -> dict:
@@ -66,9 +133,9 @@ class Mod(ABC):
 class BaseMod(Mod):
     """Base mod class to avoid using of unacceptable methods"""
 
-    def __init__(self) -> None:
+    def __init__(self, info: Optional[Union[dict, ModInfo]] = None) -> None:
         self.name = "base"
-        super().__init__()
+        super().__init__(info)
 
     def get_mod_info_json(self) -> dict:
         """
@@ -85,56 +152,43 @@ class BaseMod(Mod):
 class LocalMod(Mod):
     """Regular mod class"""
 
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str, info: Optional[Union[dict, ModInfo]] = None) -> None:
+        """
+        Args:
+            name (str): Name of an installed mod.
+            info (Optional[Union[dict, ModInfo]], optional): Already parsed `info.json`, read from the zip on first use if not given. Defaults to None.
+
+        Raises:
+            ModNotFoundError: If the mod isn't installed
+        """  # noqa: E501
         self.name = name
-        self.file = None
-        super().__init__()
+        self.file = get_mods_index(config.factorio.mods_dir).path(name)
+        if self.file is None:
+            raise ModNotFoundError(name)
+        super().__init__(info)
 
     def get_mod_info_json(self) -> dict:
         """
         docstring
         """
-
-        zip_file = next(
-            (
-                mod_file
-                for mod_file in filter(
-                    lambda file: file.suffix == ".zip",
-                    config.factorio.mods_dir.iterdir(),
-                )
-                if mod_file.stem.split("_")[0] == self.name
-            ),
-            None,
-        )
-        if zip_file is None:
-            raise ModNotFoundError(self.name)
-
-        with zipfile.ZipFile(zip_file) as archieve:
-            info_json_file = next(
-                (
-                    file
-                    for file in archieve.filelist
-                    if file.filename.endswith("info.json")
-                ),
-                None,
-            )
-            if info_json_file is None:
-                raise BrokenModException(
-                    f"Could not find 'info.json' file in '{self.name}' mod"
-                )
-
-            with archieve.open(info_json_file) as mod_info:
-                return json.load(mod_info)
+        return get_info_cache().load(self.file, read_mod_info_json)
 
     def remove(self):
         """should remove a mod with his deps or not if it needed (returning Iterable of removing mods of RemoteMod)"""
         raise NotImplementedError
 
-    def update(self):
-        """should return something like status if update is available or update information (like link to a new version)
-        or a list of updatable mods
-        """
-        raise NotImplementedError
+    def update(self, factorio_version: Optional[str] = None) -> Optional[Release]:
+        """Check the mod portal for a newer version of the mod.
+
+        Use `check_updates` to check many mods at once.
+
+        Args:
+            factorio_version (Optional[str], optional): Factorio version the release should be compatible with. Defaults to `factorio_version` of the installed mod.
+
+        Returns:
+            Optional[Release]: The newest compatible release if it is newer than the installed one
+        """  # noqa: E501
+        return check_updates([self.name], factorio_version).get(self.name)
 
     def upgrade(self):
         """should upgrade the current mod to a new version takes as an argument something like info for upgrading"""
@@ -146,6 +200,7 @@ class LocalMod(Mod):
 
 class RemoteMod(Mod):
     def __init__(self, name: str) -> None:
+        self.name = name
         super().__init__()
 
     def download(self):
@@ -164,6 +219,21 @@ class RemoteMod(Mod):
         raise NotImplementedError
 
 
+def read_mod_info_json(zip_file: Path) -> dict:
+    """Read `info.json` of a mod zip.
+
+    Args:
+        zip_file (Path): Mod zip.
+
+    Raises:
+        BrokenModException: If the zip is damaged or has no `info.json`
+
+    Returns:
+        dict: Parsed `info.json`
+    """
+    return read_info_json(zip_file, *parse_mod_file_name(zip_file.name))
+
+
 def gmod(name: Optional[str] = None) -> LocalMod | BaseMod | RemoteMod:
     """Something like factory (Get MOD)
 
@@ -175,16 +245,92 @@ def gmod(name: Optional[str] = None) -> LocalMod | BaseMod | RemoteMod:
     """
     if name and name != "base":
         return (
-            LocalMod(name) if name in get_locally_installed_mods() else RemoteMod(name)
+            LocalMod(name) if name in get_mods_index(config.factorio.mods_dir) else RemoteMod(name)
         )
     return BaseMod()
 
 
+def get_local_mods(infos: Optional[Dict[str, Union[dict, ModInfo]]] = None) -> List[LocalMod]:
+    """Return all installed mods without reading their zips.
+
+    Args:
+        infos (Optional[Dict[str, Union[dict, ModInfo]]], optional): Parsed `info.json` by mod name to inject, like `mod_scanner.scan_mods().mods`. Defaults to None.
+
+    Returns:
+        List[LocalMod]: Newest installed version of every mod
+    """  # noqa: E501
+    infos = infos or {}
+    return [LocalMod(name, infos.get(name)) for name in get_mods_index(config.factorio.mods_dir)]
+
+
 def get_locally_installed_mods() -> Iterable[str]:
     """Scans game's mods direectory for all zip files
 
     Returns:
         Iterable[str]: Iterable by strings of mods names
     """
-    for file in filter(lambda f: f.suffix == ".zip", config.factorio.mods_dir.iterdir()):
-        yield file.stem.split("_")[0]
+    yield from get_mods_index(config.factorio.mods_dir)
+
+
+def newest_compatible_release(
+    releases: Iterable[Release],
+    current_version: str,
+    factorio_version: Optional[str],
+) -> Optional[Release]:
+    """Pick the newest release which is newer than `current_version` and made for `factorio_version`.
+
+    Args:
+        releases (Iterable[Release]): Releases of a mod.
+        current_version (str): Installed version of the mod.
+        factorio_version (Optional[str]): Required `factorio_version` of the release. Any if None.
+
+    Returns:
+        Optional[Release]: The newest suitable release if there is one
+    """  # noqa: E501
+    try:
+        newest_version = Version(current_version)
+    except InvalidVersion:
+        newest_version = Version("0")
+
+    newest = None
+    for release in releases:
+        if factorio_version and getattr(release.info_json, "factorio_version", None) != factorio_version:
+            continue
+        try:
+            version = Version(release.version)
+        except InvalidVersion:
+            continue
+        if version > newest_version:
+            newest, newest_version = release, version
+    return newest
+
+
+def check_updates(
+    names: Optional[Iterable[str]] = None, factorio_version: Optional[str] = None
+) -> Dict[str, Release]:
+    """Find updates of installed mods using batched portal requests.
+
+    Args:
+        names (Optional[Iterable[str]], optional): Names of installed mods to check. Defaults to all installed mods.
+        factorio_version (Optional[str], optional): Factorio version the releases should be compatible with. Defaults to `factorio_version` of each installed mod.
+
+    Returns:
+        Dict[str, Release]: The newest compatible release of every outdated mod by its name
+    """  # noqa: E501
+    local_mods: List[LocalMod] = [
+        LocalMod(name)
+        for name in dict.fromkeys(get_locally_installed_mods() if names is None else names)
+    ]
+    remote_mods = get_mods_by_names(mod.name for mod in local_mods)
+
+    updates = {}
+    for mod in local_mods:
+        if (remote := remote_mods.get(mod.name)) is None:
+            continue
+        releases = remote.releases or ([remote.latest_release] if remote.latest_release else [])
+        release = newest_compatible_release(
+            releases, mod.version, factorio_version or mod.factorio_version
+        )
+        if release is not None:
+            updates[mod.name] = release
+    return updates
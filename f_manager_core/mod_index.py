@@ -0,0 +1,279 @@
+"""In-memory index of the mods directory.
+
+The directory is listed once into a map of mod names to their installed versions (sorted,
+with precomputed keys, so latest/exact/specifier lookups don't parse versions), which is only
+rebuilt when the directory mtime changes (a file was added, removed or renamed), so looking
+up installed mods doesn't walk the directory every time. While a `ModsWatcher` keeps the
+index up to date, it isn't even checked.
+"""
+
+from bisect import bisect_left
+import os
+from pathlib import Path
+import re
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from packaging.specifiers import SpecifierSet
+
+_FILE_NAME_RE = re.compile(r"^(?P<name>.+)_(?P<version>\d+(?:\.\d+)*)$")
+
+
+def parse_mod_file_name(file_name: str) -> Tuple[str, str]:
+    """Split a mod file name like ``Squeak_Through_1.8.2.zip`` into its name and version.
+
+    Args:
+        file_name (str): Name of a mod zip.
+
+    Returns:
+        Tuple[str, str]: Name and version of the mod (version is empty if there is none)
+    """
+    stem = file_name[: -len(".zip")] if file_name.endswith(".zip") else file_name
+    # names may contain underscores, only the part after the last one can be a version
+    if match := _FILE_NAME_RE.match(stem):
+        return match["name"], match["version"]
+    return stem, ""
+
+
+VersionKey = Tuple
+
+
+def version_key(version: str) -> VersionKey:
+    """Sort key of a mod version, ``"1.10.2"`` becomes ``(1, 10, 2)``.
+
+    Versions which aren't dot separated numbers sort before all valid ones.
+    """
+    try:
+        return tuple(int(part) for part in version.split("."))
+    except ValueError:
+        return (-1, version)
+
+
+class InstalledVersions:
+    """Installed versions of one mod sorted from the oldest, with precomputed sort keys.
+
+    Instances are never changed in place (`with_version` / `without_version` return new ones),
+    so readers can use them while the index is being updated.
+    """
+
+    __slots__ = ("keys", "versions", "paths")
+
+    keys: List[VersionKey]
+    versions: List[str]
+    paths: List[Path]
+
+    def __init__(self, entries: Iterable[Tuple[str, Path]] = ()) -> None:
+        entries = sorted(((version_key(v), v, p) for v, p in entries), key=lambda entry: entry[0])
+        self.keys = [key for key, _, _ in entries]
+        self.versions = [version for _, version, _ in entries]
+        self.paths = [path for _, _, path in entries]
+
+    def _position(self, version: str) -> int:
+        key = version_key(version)
+        position = bisect_left(self.keys, key)
+        if position < len(self.keys) and self.keys[position] == key:
+            return position
+        return -1
+
+    @property
+    def latest(self) -> Optional[str]:
+        return self.versions[-1] if self.versions else None
+
+    @property
+    def latest_path(self) -> Optional[Path]:
+        return self.paths[-1] if self.paths else None
+
+    def get(self, version: str) -> Optional[Path]:
+        position = self._position(version)
+        return self.paths[position] if position >= 0 else None
+
+    def _bounds(self, spec: SpecifierSet) -> Tuple[int, int]:
+        """Narrow the positions of versions which may match `spec` by bisecting the keys.
+
+        Bounds are conservative (``1.0`` and ``1.0.0`` are the same version for `packaging`,
+        but not the same key), matching is still checked on the versions in between.
+        """
+        low, high = 0, len(self.keys)
+        for specifier in spec:
+            key = version_key(specifier.version)
+            if key and key[0] == -1:  # wildcard or arbitrary version, not narrowed
+                continue
+            # the smallest key equal to the version, and the one after all keys equal to it
+            while key and key[-1] == 0:
+                key = key[:-1]
+            above = key[:-1] + (key[-1] + 1,) if key else (1,)
+
+            if specifier.operator in (">=", ">", "==", "~="):
+                low = max(low, bisect_left(self.keys, key, low, high))
+            if specifier.operator == "<":
+                high = min(high, bisect_left(self.keys, key, low, high))
+            elif specifier.operator in ("<=", "=="):
+                high = min(high, bisect_left(self.keys, above, low, high))
+        return low, high
+
+    def satisfying(self, spec: Union[str, SpecifierSet]) -> Optional[str]:
+        """Return the newest installed version matching a specifier like ``">= 1.1.0"``."""
+        spec = SpecifierSet(spec) if isinstance(spec, str) else spec
+        low, high = self._bounds(spec)
+        for position in range(high - 1, low - 1, -1):
+            if spec.contains(self.versions[position], prereleases=True):
+                return self.versions[position]
+        return None
+
+    def with_version(self, version: str, path: Path) -> "InstalledVersions":
+        entries = dict(zip(self.versions, self.paths))
+        entries[version] = path
+        return InstalledVersions(entries.items())
+
+    def without_version(self, version: str) -> "InstalledVersions":
+        return InstalledVersions((v, p) for v, p in zip(self.versions, self.paths) if v != version)
+
+    def items(self) -> Iterator[Tuple[str, Path]]:
+        return zip(self.versions, self.paths)
+
+    def __contains__(self, version: str) -> bool:
+        return self._position(version) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.versions)
+
+    def __len__(self) -> int:
+        return len(self.versions)
+
+    def __repr__(self) -> str:
+        return f"InstalledVersions(versions='{self.versions}')"
+
+
+class ModsIndex:
+    """Installed mods of a mods directory by name and version."""
+
+    def __init__(self, mods_dir: Path) -> None:
+        self.mods_dir = Path(mods_dir)
+        self._mods: Dict[str, InstalledVersions] = {}
+        self._mtime: Optional[int] = None
+        self._lock = threading.Lock()
+        self.watched = False
+
+    def refresh(self, force: bool = False) -> bool:
+        """Rescan the directory if it has changed since the last scan.
+
+        Args:
+            force (bool, optional): Rescan even if the directory mtime is the same or the index is watched. Defaults to False.
+
+        Returns:
+            bool: Whether the directory was rescanned
+        """  # noqa: E501
+        if self.watched and not force and self._mtime is not None:
+            return False
+
+        try:
+            mtime = os.stat(self.mods_dir).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        with self._lock:
+            if not force and self._mtime is not None and mtime == self._mtime:
+                return False
+
+            found: Dict[str, List[Tuple[str, Path]]] = {}
+            if mtime is not None:
+                with os.scandir(self.mods_dir) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith(".zip") or not entry.is_file():
+                            continue
+                        name, version = parse_mod_file_name(entry.name)
+                        found.setdefault(name, []).append((version, Path(entry.path)))
+
+            self._mods = {name: InstalledVersions(versions) for name, versions in found.items()}
+            self._mtime = mtime
+            return True
+
+    def add(self, path: Path) -> None:
+        """Add or replace a zip without rescanning the directory."""
+        name, version = parse_mod_file_name(path.name)
+        with self._lock:
+            self._mods[name] = self._mods.get(name, InstalledVersions()).with_version(version, Path(path))
+
+    def discard(self, path: Path) -> None:
+        """Drop a zip without rescanning the directory."""
+        name, version = parse_mod_file_name(path.name)
+        with self._lock:
+            if (installed := self._mods.get(name)) is None:
+                return
+            if installed := installed.without_version(version):
+                self._mods[name] = installed
+            else:
+                del self._mods[name]
+
+    def __contains__(self, name: str) -> bool:
+        self.refresh()
+        return name in self._mods
+
+    def __iter__(self) -> Iterator[str]:
+        self.refresh()
+        return iter(list(self._mods))
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._mods)
+
+    def installed(self, name: str) -> InstalledVersions:
+        """Return installed versions of a mod (empty if it isn't installed)."""
+        self.refresh()
+        return self._mods.get(name) or InstalledVersions()
+
+    def versions(self, name: str) -> Dict[str, Path]:
+        """Return zip paths of all installed versions of a mod, oldest first."""
+        return dict(self.installed(name).items())
+
+    def latest(self, name: str) -> Optional[str]:
+        """Return the newest installed version of a mod."""
+        return self.installed(name).latest
+
+    def path(self, name: str, version: Optional[str] = None) -> Optional[Path]:
+        """Return the zip of a mod.
+
+        Args:
+            name (str): Name of the mod.
+            version (Optional[str], optional): Version of the mod. Defaults to the newest installed one.
+
+        Returns:
+            Optional[Path]: Path to the zip, `None` if it isn't installed
+        """  # noqa: E501
+        installed = self.installed(name)
+        return installed.latest_path if version is None else installed.get(version)
+
+    def satisfies(
+        self, name: str, spec: Union[str, SpecifierSet], version: Optional[str] = None
+    ) -> bool:
+        """Check whether an installed version of a mod matches a specifier.
+
+        Args:
+            name (str): Name of the mod.
+            spec (Union[str, SpecifierSet]): Version specifier like ``">= 1.1.0"`` (as parsed by `helpers.parse_dependencies`).
+            version (Optional[str], optional): Installed version to check. Defaults to any installed version.
+
+        Returns:
+            bool: Whether the version is installed and matches
+        """  # noqa: E501
+        installed = self.installed(name)
+        if version is None:
+            return installed.satisfying(spec) is not None
+        spec = SpecifierSet(spec) if isinstance(spec, str) else spec
+        return version in installed and spec.contains(version, prereleases=True)
+
+    def __repr__(self) -> str:
+        return f"ModsIndex(mods_dir='{self.mods_dir}', mods='{len(self._mods)}')"
+
+
+_indexes: Dict[Path, ModsIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_mods_index(mods_dir: Path) -> ModsIndex:
+    """Return the shared index of a mods directory."""
+    mods_dir = Path(mods_dir)
+    with _indexes_lock:
+        if (index := _indexes.get(mods_dir)) is None:
+            index = _indexes[mods_dir] = ModsIndex(mods_dir)
+    return index
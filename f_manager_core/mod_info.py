@@ -0,0 +1,154 @@
+"""Compact immutable record of a mod's ``info.json``.
+
+Thousands of installed mods share most of their strings (authors, ``"1.1"``, ``"base"``) and
+dependency declarations (``"base >= 1.1"``). `ModInfo` interns those strings, parses every
+distinct dependency string once and keeps the result in slots instead of a per-mod dict.
+"""
+
+from functools import lru_cache
+import sys
+from typing import Any, Iterable, Optional, Tuple
+
+from packaging.specifiers import SpecifierSet
+
+from f_manager_core.helpers import parse_dependencies
+from f_manager_core.mod_index import version_key, VersionKey
+
+Dependency = Tuple[str, SpecifierSet]
+Dependencies = Tuple[Dependency, ...]
+
+DEFAULT_DEPENDENCIES = ("base",)
+
+# order of dependency kinds returned by helpers.parse_dependencies
+_DEPENDENCY_KINDS = ("mandatory", "optional", "hidden_optional", "no_load_order", "incompatible")
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@lru_cache(maxsize=None)
+def _parse_dependency(dependency: str) -> Tuple[int, Dependency]:
+    """Return the kind (index in `_DEPENDENCY_KINDS`) and parsed form of a dependency string."""
+    for kind, parsed in enumerate(parse_dependencies([dependency])):
+        if parsed:
+            name, specifier = parsed[0]
+            return kind, (sys.intern(name), specifier)
+    raise ValueError(f"Can't parse dependency '{dependency}'")
+
+
+class ModInfo:
+    """Immutable, slotted `info.json` of a mod with parsed version and dependencies."""
+
+    __slots__ = (
+        "name",
+        "version",
+        "version_key",
+        "factorio_version",
+        "title",
+        "author",
+        "contact",
+        "homepage",
+        "description",
+        "dependencies",
+        "mandatory_dependencies",
+        "optional_dependencies",
+        "hidden_optional_dependencies",
+        "no_load_order_dependencies",
+        "incompatible_dependencies",
+    )
+
+    name: str
+    version: str
+    version_key: VersionKey
+    factorio_version: Optional[str]
+    title: Optional[str]
+    author: Optional[str]
+    contact: Optional[str]
+    homepage: Optional[str]
+    description: Optional[str]
+    dependencies: Tuple[str, ...]
+    mandatory_dependencies: Dependencies
+    optional_dependencies: Dependencies
+    hidden_optional_dependencies: Dependencies
+    no_load_order_dependencies: Dependencies
+    incompatible_dependencies: Dependencies
+
+    def __init__(
+        self,
+        name: str,
+        version: str,
+        factorio_version: Optional[str] = None,
+        title: Optional[str] = None,
+        author: Optional[str] = None,
+        contact: Optional[str] = None,
+        homepage: Optional[str] = None,
+        description: Optional[str] = None,
+        dependencies: Iterable[str] = DEFAULT_DEPENDENCIES,
+    ) -> None:
+        dependencies = tuple(sys.intern(dependency) for dependency in dependencies)
+        parsed: Tuple[list, ...] = tuple([] for _ in _DEPENDENCY_KINDS)
+        for dependency in dependencies:
+            kind, dependency_spec = _parse_dependency(dependency)
+            parsed[kind].append(dependency_spec)
+
+        values = {
+            "name": sys.intern(name),
+            "version": sys.intern(version),
+            "version_key": version_key(version),
+            "factorio_version": _intern(factorio_version),
+            "title": title,
+            "author": _intern(author),
+            "contact": _intern(contact),
+            "homepage": _intern(homepage),
+            "description": description,
+            "dependencies": dependencies,
+        }
+        for kind, kind_dependencies in zip(_DEPENDENCY_KINDS, parsed):
+            values[f"{kind}_dependencies"] = tuple(kind_dependencies)
+        for key, value in values.items():
+            object.__setattr__(self, key, value)
+
+    @classmethod
+    def from_json(cls, json_data: dict) -> "ModInfo":
+        """Build the record from a parsed `info.json`, ignoring unknown keys."""
+        return cls(
+            name=json_data["name"],
+            version=json_data["version"],
+            factorio_version=json_data.get("factorio_version"),
+            title=json_data.get("title"),
+            author=json_data.get("author"),
+            contact=json_data.get("contact"),
+            homepage=json_data.get("homepage"),
+            description=json_data.get("description"),
+            dependencies=json_data.get("dependencies") or DEFAULT_DEPENDENCIES,
+        )
+
+    def to_json(self) -> dict:
+        data = {
+            key: getattr(self, key)
+            for key in ("name", "version", "factorio_version", "title", "author", "contact", "homepage", "description")  # noqa: E501
+            if getattr(self, key) is not None
+        }
+        data["dependencies"] = list(self.dependencies)
+        return data
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"'{type(self).__name__}' is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"'{type(self).__name__}' is immutable")
+
+    def __reduce__(self):
+        return (ModInfo.from_json, (self.to_json(),))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ModInfo):
+            return NotImplemented
+        return self.to_json() == other.to_json()
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.version))
+
+    def __repr__(self) -> str:
+        return f"ModInfo(name='{self.name}', version='{self.version}', title='{self.title}', author='{self.author}', factorio_version='{self.factorio_version}', dependencies='{self.dependencies}')"  # noqa: E501
@@ -0,0 +1,116 @@
+"""Bulk loading of `info.json` of all installed mods.
+
+Zips are read on a thread pool, or a process pool for huge mods directories where parsing
+holds the GIL for too long. Cached entries are served from `InfoCache` and only the missing
+ones are read, a broken zip is reported instead of aborting the whole scan.
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import zipfile
+
+from f_manager_core import config
+from f_manager_core.exceptions import BrokenModException
+from f_manager_core.info_cache import get_info_cache, InfoCache
+from f_manager_core.logger import logger
+from f_manager_core.mod import read_mod_info_json
+from f_manager_core.mod_index import get_mods_index
+
+PROCESS_CHUNK_SIZE = 64
+
+
+class ScanResult:
+    """Parsed `info.json` of installed mods and zips that couldn't be read."""
+
+    mods: Dict[str, dict]
+    paths: Dict[str, Path]
+    errors: Dict[Path, BrokenModException]
+
+    def __init__(self) -> None:
+        self.mods = {}
+        self.paths = {}
+        self.errors = {}
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def __repr__(self) -> str:
+        return f"ScanResult(mods='{len(self.mods)}', errors='{len(self.errors)}')"
+
+
+def _read(path: Path) -> Tuple[Optional[dict], Optional[BrokenModException]]:
+    # runs in workers, errors are returned so one broken zip doesn't cancel the rest
+    try:
+        return read_mod_info_json(path), None
+    except BrokenModException as e:
+        return None, e
+    except (zipfile.BadZipFile, OSError, ValueError, KeyError) as e:
+        return None, BrokenModException(f"Could not read 'info.json' of '{path.name}': {e}")
+
+
+def scan_mods(
+    mods_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+    processes: bool = False,
+    cache: Optional[InfoCache] = None,
+    use_cache: bool = True,
+) -> ScanResult:
+    """Read `info.json` of the newest installed version of every mod.
+
+    Args:
+        mods_dir (Optional[Path], optional): Mods directory. Defaults to `config.factorio.mods_dir`.
+        workers (Optional[int], optional): Size of the pool. Defaults to the executor's default.
+        processes (bool, optional): Use a process pool instead of a thread pool. Defaults to False.
+        cache (Optional[InfoCache], optional): Cache of parsed `info.json`. Defaults to the shared one.
+        use_cache (bool, optional): Read and update the cache. Defaults to True.
+
+    Returns:
+        ScanResult: Parsed `info.json` by mod name and errors by zip
+    """  # noqa: E501
+    if mods_dir is None:
+        mods_dir = config.factorio.mods_dir
+    if use_cache and cache is None:
+        cache = get_info_cache()
+
+    index = get_mods_index(mods_dir)
+    result = ScanResult()
+    missing: List[Tuple[str, Path, os.stat_result]] = []
+    for name in index:
+        path = index.path(name)
+        if path is None:
+            continue
+        result.paths[name] = path
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        if cache is not None and (info := cache.get(path, stat)) is not None:
+            result.mods[name] = info
+        else:
+            missing.append((name, path, stat))
+
+    if missing:
+        executor: Executor = (
+            ProcessPoolExecutor(workers) if processes else ThreadPoolExecutor(workers)
+        )
+        with executor:
+            chunksize = PROCESS_CHUNK_SIZE if processes else 1
+            read = executor.map(_read, [path for _, path, _ in missing], chunksize=chunksize)
+
+            parsed = []
+            for (name, path, stat), (info, error) in zip(missing, read):
+                if error is not None:
+                    logger.warning(str(error))
+                    result.errors[path] = error
+                    continue
+                result.mods[name] = info
+                parsed.append((path, info, stat))
+
+        if cache is not None and parsed:
+            cache.put_many(parsed)
+
+    logger.debug(f"Scanned {len(result.mods)} mods, {len(missing)} zips read, {len(result.errors)} broken")
+    return result
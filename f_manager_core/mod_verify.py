@@ -0,0 +1,178 @@
+"""Integrity check of installed mod zips against sha1 published by the mod portal.
+
+Zips are hashed on a thread pool while the expected sha1 are fetched with batched portal
+requests. Hashes are cached by (path, size, mtime), so verifying again only hashes zips
+which changed since.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import json
+import os
+from pathlib import Path
+import time
+from typing import Dict, List, Optional, Tuple
+
+from f_manager_core import config
+from f_manager_core.factorio.batch import get_mods_by_names
+from f_manager_core.factorio.streaming import DEFAULT_BUFFER_SIZE, sha1_file
+from f_manager_core.info_cache import Sha1Cache
+from f_manager_core.logger import logger
+from f_manager_core.mod_index import get_mods_index
+
+DEFAULT_WORKERS = 4
+MOD_LIST_FILE_NAME = "mod-list.json"
+# mods shipped with the game, they never have a zip in the mods directory
+BUILTIN_MODS = ("base", "core", "elevated-rails", "quality", "space-age")
+
+
+class VerifiedFile:
+    path: Path
+    name: str
+    version: str
+    sha1: Optional[str]
+    expected_sha1: Optional[str]
+    error: Optional[OSError]
+
+    def __init__(
+        self,
+        path: Path,
+        name: str,
+        version: str,
+        sha1: Optional[str] = None,
+        expected_sha1: Optional[str] = None,
+        error: Optional[OSError] = None,
+    ):
+        self.path = path
+        self.name = name
+        self.version = version
+        self.sha1 = sha1
+        self.expected_sha1 = expected_sha1
+        self.error = error
+
+    @property
+    def known(self) -> bool:
+        """Whether the portal has a release of this version."""
+        return self.expected_sha1 is not None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.known and self.sha1 == self.expected_sha1
+
+    def __repr__(self) -> str:
+        return f"VerifiedFile(path='{self.path}', name='{self.name}', version='{self.version}', sha1='{self.sha1}', expected_sha1='{self.expected_sha1}', error='{self.error}')"  # noqa: E501
+
+
+class VerifyReport:
+    files: List[VerifiedFile]
+    missing: List[str]
+    elapsed: float
+
+    def __init__(self, files: List[VerifiedFile], missing: List[str], elapsed: float):
+        self.files = files
+        self.missing = missing
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return not self.missing and all(file.ok for file in self.files)
+
+    @property
+    def mismatched(self) -> List[VerifiedFile]:
+        """Zips whose sha1 differs from the portal release, most likely damaged."""
+        return [f for f in self.files if f.error is None and f.known and not f.ok]
+
+    @property
+    def unknown(self) -> List[VerifiedFile]:
+        """Zips of mods or versions the portal doesn't know (local or removed mods)."""
+        return [f for f in self.files if f.error is None and not f.known]
+
+    @property
+    def failed(self) -> List[VerifiedFile]:
+        """Zips that couldn't be read."""
+        return [f for f in self.files if f.error is not None]
+
+    def __repr__(self) -> str:
+        return f"VerifyReport(files='{len(self.files)}', mismatched='{len(self.mismatched)}', unknown='{len(self.unknown)}', missing='{len(self.missing)}', failed='{len(self.failed)}', elapsed='{self.elapsed:.2f}')"  # noqa: E501
+
+
+def enabled_mods(mods_dir: Path) -> List[str]:
+    """Return names of mods enabled in `mod-list.json` of a mods directory."""
+    try:
+        with mods_dir.joinpath(MOD_LIST_FILE_NAME).open() as f:
+            mod_list = json.load(f)
+    except FileNotFoundError:
+        return []
+    return [mod["name"] for mod in mod_list.get("mods", []) if mod.get("enabled", True)]
+
+
+def verify_mods(
+    mods_dir: Optional[Path] = None,
+    workers: int = DEFAULT_WORKERS,
+    cache: Optional[Sha1Cache] = None,
+    use_cache: bool = True,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> VerifyReport:
+    """Verify every zip of a mods directory against `Release.sha1` of the mod portal.
+
+    Args:
+        mods_dir (Optional[Path], optional): Mods directory. Defaults to `config.factorio.mods_dir`.
+        workers (int, optional): Maximum number of zips hashed at the same time. Defaults to 4.
+        cache (Optional[Sha1Cache], optional): Cache of computed sha1. Defaults to one in `config.data.storage`.
+        use_cache (bool, optional): Read and update the cache. Defaults to True.
+        buffer_size (int, optional): Size of read blocks while hashing. Defaults to 1 MiB.
+
+    Returns:
+        VerifyReport: Mismatched, unknown and missing (enabled in `mod-list.json`, but not installed) mods
+    """  # noqa: E501
+    started = time.perf_counter()
+    mods_dir = Path(mods_dir or config.factorio.mods_dir)
+    if use_cache and cache is None:
+        cache = Sha1Cache()
+
+    index = get_mods_index(mods_dir)
+    files = [
+        VerifiedFile(path, name, version)
+        for name in index
+        for version, path in index.installed(name).items()
+    ]
+    hashed: List[Tuple[Path, str, os.stat_result]] = []
+
+    def hash_file(file: VerifiedFile) -> None:
+        try:
+            stat = os.stat(file.path)
+            if cache is not None and (sha1 := cache.get(file.path, stat)) is not None:
+                file.sha1 = sha1
+                return
+            file.sha1 = sha1_file(file.path, buffer_size)
+            hashed.append((file.path, file.sha1, stat))
+        except OSError as e:
+            logger.warning(f"Can't read '{file.path.name}': {e}")
+            file.error = e
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="f_manager_verify") as executor:
+        # zips are hashed while the portal is queried
+        futures: List[Future] = [executor.submit(hash_file, file) for file in files]
+        remote_mods = get_mods_by_names(dict.fromkeys(file.name for file in files))
+        for future in futures:
+            future.result()
+
+    expected: Dict[Tuple[str, str], str] = {}
+    for name, remote in remote_mods.items():
+        releases = remote.releases or ([remote.latest_release] if remote.latest_release else [])
+        for release in releases:
+            expected[(name, release.version)] = release.sha1
+    for file in files:
+        file.expected_sha1 = expected.get((file.name, file.version))
+
+    if cache is not None and hashed:
+        cache.put_many(hashed)
+
+    missing = [
+        name
+        for name in enabled_mods(mods_dir)
+        if name not in BUILTIN_MODS and name not in index
+    ]
+
+    report = VerifyReport(files, missing, time.perf_counter() - started)
+    logger.info(str(report))
+    return report
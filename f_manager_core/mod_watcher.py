@@ -0,0 +1,215 @@
+"""Keep the mods index and `info.json` cache up to date with inotify (Linux only).
+
+A long running process watching the mods directory applies every added, replaced or removed
+zip to `ModsIndex` and `InfoCache` as it happens, so lookups never rescan the directory.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+from pathlib import Path
+import select
+import struct
+import sys
+import threading
+from typing import Optional
+
+from f_manager_core import config
+from f_manager_core.exceptions import BrokenModException, UnknownSystem
+from f_manager_core.info_cache import get_info_cache, InfoCache
+from f_manager_core.logger import logger
+from f_manager_core.mod import read_mod_info_json
+from f_manager_core.mod_index import get_mods_index, ModsIndex
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+)
+_LOST_MASK = IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF
+
+# struct inotify_event: int wd, uint32 mask, uint32 cookie, uint32 len, char name[len]
+_EVENT = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+def _libc() -> ctypes.CDLL:
+    if not sys.platform.startswith("linux"):
+        raise UnknownSystem("Watching the mods directory needs inotify (Linux)")
+    return ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+
+
+class ModsWatcher:
+    """Background thread applying inotify events of the mods directory to the index and cache.
+
+    Usage:
+        with ModsWatcher():
+            ...  # gmod(), get_locally_installed_mods(), ... don't rescan the directory
+    """
+
+    def __init__(
+        self,
+        mods_dir: Optional[Path] = None,
+        index: Optional[ModsIndex] = None,
+        cache: Optional[InfoCache] = None,
+        read_info: bool = True,
+    ) -> None:
+        """
+        Args:
+            mods_dir (Optional[Path], optional): Watched directory. Defaults to `config.factorio.mods_dir`.
+            index (Optional[ModsIndex], optional): Updated index. Defaults to the shared index of `mods_dir`.
+            cache (Optional[InfoCache], optional): Updated `info.json` cache. Defaults to the shared one.
+            read_info (bool, optional): Read `info.json` of new zips into the cache right away, otherwise only drop stale entries. Defaults to True.
+        """  # noqa: E501
+        self.mods_dir = Path(mods_dir or config.factorio.mods_dir)
+        self.index = index if index is not None else get_mods_index(self.mods_dir)
+        self._cache = cache
+        self.read_info = read_info
+
+        self._fd: Optional[int] = None
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def cache(self) -> InfoCache:
+        return self._cache if self._cache is not None else get_info_cache()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "ModsWatcher":
+        """Subscribe to events of the directory and start applying them."""
+        if self.running:
+            return self
+        libc = _libc()
+
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            code = ctypes.get_errno()
+            raise OSError(code, os.strerror(code))
+        if libc.inotify_add_watch(fd, os.fsencode(self.mods_dir), _WATCH_MASK) < 0:
+            code = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(code, os.strerror(code), str(self.mods_dir))
+
+        self._fd = fd
+        self._wake_r, self._wake_w = os.pipe()
+        # events arriving from now on are applied on top of this scan
+        self.index.refresh(force=True)
+        self.index.watched = True
+
+        self._thread = threading.Thread(target=self._run, name="mods-watcher", daemon=True)
+        self._thread.start()
+        logger.debug(f"Watching {self.mods_dir}")
+        return self
+
+    def stop(self) -> None:
+        """Stop watching, the index falls back to checking the directory mtime."""
+        if self._thread is not None:
+            os.write(self._wake_w, b"\0")  # type: ignore
+            self._thread.join()
+            self._thread = None
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            if fd is not None:
+                os.close(fd)
+        self._fd = self._wake_r = self._wake_w = None
+        self.index.watched = False
+
+    def __enter__(self) -> "ModsWatcher":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    ############################################################################
+
+    def _run(self) -> None:
+        try:
+            self._loop()
+        except Exception as e:
+            logger.error(f"Stopped watching {self.mods_dir}: {e}")
+        finally:
+            # whatever stopped the thread, the index goes back to checking the directory mtime
+            self.index.watched = False
+
+    def _loop(self) -> None:
+        while True:
+            try:
+                readable, _, _ = select.select([self._fd, self._wake_r], [], [])
+            except InterruptedError:
+                continue
+            if self._wake_r in readable:
+                return
+
+            try:
+                data = os.read(self._fd, _READ_SIZE)  # type: ignore
+            except BlockingIOError:
+                continue
+            except OSError as e:
+                if e.errno == errno.EINTR:
+                    continue
+                raise
+
+            try:
+                self._handle(data)
+            except Exception as e:  # the watcher must survive a bad event
+                logger.error(f"Failed to apply changes of {self.mods_dir}: {e}")
+                self.index.watched = False
+
+    def _handle(self, data: bytes) -> None:
+        position = 0
+        while position < len(data):
+            _, mask, _, length = _EVENT.unpack_from(data, position)
+            start = position + _EVENT.size
+            name = data[start:start + length].rstrip(b"\0")
+            position = start + length
+
+            if mask & _LOST_MASK:
+                logger.warning(f"{self.mods_dir} was moved or removed, it isn't watched anymore")
+                self.index.watched = False
+                continue
+            if mask & IN_Q_OVERFLOW:
+                logger.debug(f"Events of {self.mods_dir} were lost, rescanning it")
+                self.index.refresh(force=True)
+                continue
+            if mask & IN_ISDIR or not name.endswith(b".zip"):
+                continue
+
+            path = self.mods_dir.joinpath(os.fsdecode(name))
+            if mask & (IN_DELETE | IN_MOVED_FROM):
+                self.index.discard(path)
+                self.cache.discard(path)
+            elif mask & IN_MODIFY:
+                # being written, don't serve a cached info.json of the previous content
+                self.cache.discard(path)
+            elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                self.index.add(path)
+                if self.read_info:
+                    self._read_info(path)
+                else:
+                    self.cache.discard(path)
+
+    def _read_info(self, path: Path) -> None:
+        try:
+            self.cache.load(path, read_mod_info_json)
+        except FileNotFoundError:
+            self.index.discard(path)
+        except (BrokenModException, ValueError) as e:
+            logger.warning(f"Can't read 'info.json' of new mod '{path.name}': {e}")
+
+    def __repr__(self) -> str:
+        return f"ModsWatcher(mods_dir='{self.mods_dir}', running='{self.running}')"
@@ -0,0 +1,170 @@
+"""Fast reading of ``info.json`` from mod zips.
+
+Instead of building `zipfile.ZipFile.filelist` (a Python object per entry, and graphics mods
+have tens of thousands) the archive is memory-mapped, the end of central directory record is
+located directly and the central directory is searched for ``<name>_<version>/info.json``.
+Only that one member is decompressed. Archives this reader doesn't handle (ZIP64, unusual
+compression methods) are read with `zipfile` instead.
+"""
+
+import json
+import mmap
+from pathlib import Path
+import struct
+from typing import Optional, Tuple
+import zipfile
+import zlib
+
+from f_manager_core.exceptions import BrokenModException
+
+_END_OF_CENTRAL_DIRECTORY = struct.Struct("<4s4H2LH")
+_CENTRAL_DIRECTORY_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+_LOCAL_FILE_HEADER = struct.Struct("<4s2B4HL2L2H")
+
+_EOCD_SIGNATURE = b"PK\x05\x06"
+_CD_SIGNATURE = b"PK\x01\x02"
+_LOCAL_SIGNATURE = b"PK\x03\x04"
+_MAX_COMMENT_SIZE = 0xFFFF
+_ZIP64_LIMIT = 0xFFFFFFFF
+
+_STORED = 0
+_DEFLATED = 8
+_ENCRYPTED_FLAG = 0x1
+
+INFO_JSON = "info.json"
+
+
+class _Unsupported(Exception):
+    """The archive is valid, but should be read by `zipfile`."""
+
+
+class _Member:
+    __slots__ = ("filename", "method", "flags", "crc", "compressed_size", "offset")
+
+    def __init__(self, header: tuple, filename: str) -> None:
+        self.filename = filename
+        self.flags = header[5]
+        self.method = header[6]
+        self.crc = header[9]
+        self.compressed_size = header[10]
+        self.offset = header[18]
+
+
+def _central_directory(data: mmap.mmap) -> Tuple[int, int, int]:
+    """Return the start and end of the central directory and the offset of prepended data."""
+    search_from = max(0, len(data) - _END_OF_CENTRAL_DIRECTORY.size - _MAX_COMMENT_SIZE)
+    position = data.rfind(_EOCD_SIGNATURE, search_from)
+    if position < 0:
+        raise BrokenModException("File is not a zip file")
+
+    eocd = _END_OF_CENTRAL_DIRECTORY.unpack_from(data, position)
+    size, offset = eocd[5], eocd[6]
+    if offset == _ZIP64_LIMIT or size == _ZIP64_LIMIT:
+        raise _Unsupported("ZIP64")
+
+    start = position - size
+    if start < 0:
+        raise BrokenModException("Truncated central directory")
+    return start, position, start - offset
+
+
+def _member_at(data: mmap.mmap, position: int) -> Tuple[_Member, int]:
+    header = _CENTRAL_DIRECTORY_HEADER.unpack_from(data, position)
+    if header[0] != _CD_SIGNATURE:
+        raise BrokenModException("Bad central directory entry")
+    name_start = position + _CENTRAL_DIRECTORY_HEADER.size
+    name = data[name_start:name_start + header[12]].decode("utf-8", "replace")
+    end = name_start + header[12] + header[13] + header[14]
+    return _Member(header, name), end
+
+
+def _find_member(data: mmap.mmap, start: int, end: int, filename: Optional[str]) -> Optional[_Member]:
+    # the expected path is looked up with a single C-level search of the central directory
+    if filename is not None:
+        encoded = filename.encode()
+        position = data.find(encoded, start, end)
+        while position >= 0:
+            header_position = position - _CENTRAL_DIRECTORY_HEADER.size
+            if header_position >= start and data[header_position:header_position + 4] == _CD_SIGNATURE:
+                member, _ = _member_at(data, header_position)
+                if member.filename == filename:
+                    return member
+            position = data.find(encoded, position + 1, end)
+
+    # otherwise take the shallowest info.json, a nested one may belong to bundled files
+    best: Optional[_Member] = None
+    position = start
+    while position < end:
+        member, position = _member_at(data, position)
+        if member.filename == INFO_JSON or member.filename.endswith("/" + INFO_JSON):
+            if best is None or member.filename.count("/") < best.filename.count("/"):
+                best = member
+    return best
+
+
+def _read_member(data: mmap.mmap, member: _Member, prepended: int) -> bytes:
+    if member.flags & _ENCRYPTED_FLAG:
+        raise BrokenModException(f"'{member.filename}' is encrypted")
+    if member.method not in (_STORED, _DEFLATED):
+        raise _Unsupported(f"compression method {member.method}")
+    if member.compressed_size == _ZIP64_LIMIT or member.offset == _ZIP64_LIMIT:
+        raise _Unsupported("ZIP64")
+
+    position = member.offset + prepended
+    header = _LOCAL_FILE_HEADER.unpack_from(data, position)
+    if header[0] != _LOCAL_SIGNATURE:
+        raise BrokenModException(f"Bad local header of '{member.filename}'")
+    start = position + _LOCAL_FILE_HEADER.size + header[10] + header[11]
+    raw = data[start:start + member.compressed_size]
+
+    content = zlib.decompress(raw, -zlib.MAX_WBITS) if member.method == _DEFLATED else raw
+    if zlib.crc32(content) != member.crc:
+        raise BrokenModException(f"Bad CRC-32 of '{member.filename}'")
+    return content
+
+
+def _read_with_zipfile(path: Path, filename: Optional[str]) -> bytes:
+    with zipfile.ZipFile(path) as archive:
+        names = archive.namelist()
+        if filename not in names:
+            candidates = [n for n in names if n == INFO_JSON or n.endswith("/" + INFO_JSON)]
+            filename = min(candidates, key=lambda n: n.count("/")) if candidates else None
+        if filename is None:
+            raise BrokenModException(f"Could not find 'info.json' file in '{path.name}'")
+        return archive.read(filename)
+
+
+def read_info_json(path: Path, name: Optional[str] = None, version: Optional[str] = None) -> dict:
+    """Read `info.json` of a mod zip.
+
+    Args:
+        path (Path): Mod zip.
+        name (Optional[str], optional): Mod name, used with `version` to find `<name>_<version>/info.json` directly. Defaults to None.
+        version (Optional[str], optional): Mod version. Defaults to None.
+
+    Raises:
+        BrokenModException: If the zip is damaged or has no `info.json`
+
+    Returns:
+        dict: Parsed `info.json`
+    """  # noqa: E501
+    filename = f"{name}_{version}/{INFO_JSON}" if name and version else None
+
+    try:
+        with open(path, "rb") as file:
+            try:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise BrokenModException(f"'{path.name}' is empty")
+            with data:
+                start, end, prepended = _central_directory(data)
+                member = _find_member(data, start, end, filename)
+                if member is None:
+                    raise BrokenModException(f"Could not find 'info.json' file in '{path.name}'")
+                content = _read_member(data, member, prepended)
+    except _Unsupported:
+        content = _read_with_zipfile(path, filename)
+    except (struct.error, zlib.error) as e:
+        raise BrokenModException(f"'{path.name}' is damaged: {e}")
+
+    return json.loads(content)
@@ -35,5 +35,9 @@ setup(
         "tqdm==4.65.0",
         "urllib3==1.26.14"
     ],
+    extras_require={
+        'fast': ["orjson"],
+        'analytics': ["numpy"],
+    },
     package_data={'f_manager_core': ['configs/*', 'factorio/*']}
 )
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from f_manager_core.factorio import aio
+from f_manager_core.factorio.json_object_types import Result
+
+
+class InFlightCounter:
+    """Blocking stand-in of an API function recording the peak number of concurrent calls."""
+
+    def __init__(self, delay: float = 0.02) -> None:
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, mod_name: str, cached: bool = True) -> Result:
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+            self.calls += 1
+        return Result({"name": mod_name})
+
+
+class TestAio(TestCase):
+    def setUp(self):
+        self.addCleanup(aio.set_concurrency, aio.DEFAULT_CONCURRENCY)
+
+    def test_concurrency_limit(self):
+        aio.set_concurrency(3)
+        fake = InFlightCounter()
+
+        async def main():
+            return await asyncio.gather(*(aio.get_mods_short(f"mod{i}") for i in range(12)))
+
+        with patch("f_manager_core.factorio.api.get_mods_short", fake):
+            results = asyncio.run(main())
+
+        self.assertEqual([r.name for r in results], [f"mod{i}" for i in range(12)])
+        self.assertEqual(fake.peak, 3)
+        self.assertEqual(aio.get_concurrency(), 3)
+
+    def test_set_concurrency_drains_previous_pool(self):
+        aio.set_concurrency(1)
+        fake = InFlightCounter()
+
+        async def main():
+            tasks = [asyncio.ensure_future(aio.get_mods_short(f"mod{i}")) for i in range(4)]
+            await asyncio.sleep(0.005)
+            aio.set_concurrency(4)
+            # every request queued with the previous limit has run, one at a time
+            self.assertEqual(fake.calls, 4)
+            await asyncio.gather(*tasks)
+
+        with patch("f_manager_core.factorio.api.get_mods_short", fake):
+            asyncio.run(main())
+
+        self.assertEqual(fake.peak, 1)
+
+    def test_invalid_limit(self):
+        with self.assertRaises(ValueError):
+            aio.set_concurrency(0)
+
+    def test_arguments_forwarded(self):
+        with patch("f_manager_core.factorio.api.get_mods") as get_mods:
+            asyncio.run(aio.get_mods("1.1", page=2, page_size="max", namelist=["flib"]))
+
+        get_mods.assert_called_once_with(
+            "1.1",
+            hide_deprecated=True,
+            page=2,
+            page_size="max",
+            sort="name",
+            sort_order="desc",
+            namelist=["flib"],
+            cached=True,
+        )
@@ -0,0 +1,58 @@
+import hashlib
+import io
+import os
+from pathlib import Path
+import tempfile
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import requests
+
+from f_manager_core.factorio import api
+from f_manager_core.factorio.client import PortalClient
+
+
+def make_response(status_code: int, body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(body)
+    response.raw.release_conn = Mock()
+    response.headers["Content-Length"] = str(len(body))
+    return response
+
+
+class TestGetMod(TestCase):
+    def setUp(self):
+        self.client = PortalClient()
+        patcher = patch("f_manager_core.factorio.client._default_client", self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.filename = Path(self.tmp.name).joinpath("mod_1.0.0.zip")
+
+    def test_download(self):
+        data = os.urandom(300 * 1024)
+        response = make_response(200, data)
+        self.client.session.request = Mock(return_value=response)
+
+        sha1 = api.get_mod("user", "token", "/download/mod/1", self.filename, buffer_size=4096)
+
+        self.assertEqual(sha1, hashlib.sha1(data).hexdigest())
+        self.assertEqual(self.filename.read_bytes(), data)
+        (method, url), kwargs = self.client.session.request.call_args
+        self.assertEqual(method, "GET")
+        self.assertEqual(url, "https://mods.factorio.com/download/mod/1?username=user&token=token")
+        self.assertTrue(kwargs["stream"])
+        response.raw.release_conn.assert_called_once()
+
+    def test_http_error_closes_response(self):
+        response = make_response(404, b"not found")
+        self.client.session.request = Mock(return_value=response)
+
+        with self.assertRaises(requests.HTTPError):
+            api.get_mod("user", "token", "/download/mod/1", self.filename)
+
+        self.assertFalse(self.filename.exists())
+        response.raw.release_conn.assert_called_once()
@@ -0,0 +1,66 @@
+from unittest import TestCase
+from unittest.mock import patch
+from urllib.parse import quote
+
+from f_manager_core.factorio.batch import chunk_names, get_mods_by_names
+from f_manager_core.factorio.json_object_types import ModListResponse, Result
+
+
+def fake_get_mods(version, hide_deprecated, page_size, namelist):
+    return ModListResponse(
+        {
+            "results": [
+                {"name": name, "releases": []} for name in namelist if name != "unknown"
+            ]
+        }
+    )
+
+
+def fake_get_mods_full(name):
+    return Result({"name": name, "changelog": f"{name} changelog"})
+
+
+class TestChunkNames(TestCase):
+    def test_max_names(self):
+        names = [f"mod{i}" for i in range(250)]
+
+        chunks = chunk_names(names, max_names=100)
+
+        self.assertEqual([len(chunk) for chunk in chunks], [100, 100, 50])
+        self.assertEqual(sum(chunks, []), names)
+
+    def test_max_length(self):
+        names = [f"Squeak Through {i}" for i in range(100)]
+
+        chunks = chunk_names(names, max_length=300)
+
+        for chunk in chunks:
+            query = "".join(f"&namelist={quote(name, safe='')}" for name in chunk)
+            self.assertLessEqual(len(query), 300)
+        self.assertEqual(sum(chunks, []), names)
+
+    def test_duplicates(self):
+        self.assertEqual(chunk_names(["a", "b", "a"]), [["a", "b"]])
+
+
+class TestGetModsByNames(TestCase):
+    @patch("f_manager_core.factorio.batch.get_mods_full", side_effect=fake_get_mods_full)
+    @patch("f_manager_core.factorio.batch.get_mods", side_effect=fake_get_mods)
+    def test_merge(self, get_mods, get_mods_full):
+        names = [f"mod{i}" for i in range(150)] + ["unknown"]
+
+        results = get_mods_by_names(names, full_fields=["changelog"])
+
+        # call_count isn't updated atomically by calls from the thread pool, call_args_list is
+        self.assertEqual(len(get_mods.call_args_list), 2)
+        self.assertEqual(len(get_mods_full.call_args_list), 150)
+        self.assertEqual(set(results), set(names) - {"unknown"})
+        self.assertEqual(results["mod42"].changelog, "mod42 changelog")
+
+    @patch("f_manager_core.factorio.batch.get_mods_full", side_effect=fake_get_mods_full)
+    @patch("f_manager_core.factorio.batch.get_mods", side_effect=fake_get_mods)
+    def test_no_full_fields(self, get_mods, get_mods_full):
+        results = get_mods_by_names(["a", "b"])
+
+        self.assertEqual(set(results), {"a", "b"})
+        get_mods_full.assert_not_called()
@@ -0,0 +1,54 @@
+from pathlib import Path
+import tempfile
+from unittest import TestCase
+
+import requests
+
+from f_manager_core.factorio.cache import ResponseCache
+
+
+def make_response(body: bytes, etag=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    if etag:
+        response.headers["ETag"] = etag
+    return response
+
+
+class TestResponseCache(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(Path(self.tmp.name).joinpath("cache.sqlite3"), max_size=25)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def test_key(self):
+        self.assertEqual(
+            ResponseCache.key("u", {"b": 2, "a": 1, "c": None, "n": ["x", "y"]}),
+            ResponseCache.key("u", {"n": ["x", "y"], "a": 1, "b": 2}),
+        )
+        self.assertNotEqual(ResponseCache.key("u", {"a": 1}), ResponseCache.key("u", {"a": 2}))
+
+    def test_put_get(self):
+        self.cache.put("k", "mods", make_response(b'{"results": []}', etag='"1"'))
+
+        entry = self.cache.get("k")
+
+        self.assertEqual(entry.body, b'{"results": []}')
+        self.assertEqual(entry.validators(), {"If-None-Match": '"1"'})
+        self.assertEqual(entry.to_response("u").json(), {"results": []})
+        self.assertTrue(entry.is_fresh(self.cache.ttl("mods")))
+        self.assertIsNone(self.cache.get("other"))
+
+    def test_lru_eviction(self):
+        self.cache.put("a", "mods", make_response(b"a" * 10))
+        self.cache.put("b", "mods", make_response(b"b" * 10))
+        self.cache.get("a")
+        self.cache.put("c", "mods", make_response(b"c" * 10))
+
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("c"))
@@ -0,0 +1,44 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from f_manager_core.factorio.catalog import iter_catalog
+from f_manager_core.factorio.json_object_types import ModListResponse
+
+
+def fake_get_mods(version, page, page_size, **kwargs):
+    count = 23
+    page_count = (count + page_size - 1) // page_size
+    first = (page - 1) * page_size
+    return ModListResponse(
+        {
+            "pagination": {
+                "count": count,
+                "links": {},
+                "page": page,
+                "page_count": page_count,
+                "page_size": page_size,
+            },
+            "results": [
+                {"name": f"mod{i}"} for i in range(first, min(first + page_size, count))
+            ],
+        }
+    )
+
+
+class TestIterCatalog(TestCase):
+    @patch("f_manager_core.factorio.catalog.get_mods", side_effect=fake_get_mods)
+    def test_all_pages_in_order(self, get_mods):
+        names = [result.name for result in iter_catalog("1.1", page_size=5, window=2)]
+
+        self.assertEqual(names, [f"mod{i}" for i in range(23)])
+        self.assertEqual(
+            sorted(call.kwargs["page"] for call in get_mods.call_args_list),
+            [1, 2, 3, 4, 5],
+        )
+
+    @patch("f_manager_core.factorio.catalog.get_mods", side_effect=fake_get_mods)
+    def test_single_page(self, get_mods):
+        names = [result.name for result in iter_catalog("1.1", page_size=50)]
+
+        self.assertEqual(len(names), 23)
+        self.assertEqual(get_mods.call_count, 1)
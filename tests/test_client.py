@@ -0,0 +1,264 @@
+from pathlib import Path
+import tempfile
+import time
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import requests
+
+from f_manager_core.factorio import api
+from f_manager_core.factorio.cache import ResponseCache
+from f_manager_core.factorio.ratelimit import AdaptiveRateLimiter
+from f_manager_core.factorio.client import (
+    DEFAULT_RETRY_STATUSES,
+    DEFAULT_TIMEOUT,
+    PortalClient,
+    get_default_client,
+    set_default_client,
+)
+
+
+def make_response(status_code: int = 200, body: bytes = b"{}", headers=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response._content_consumed = True
+    response.headers.update(headers or {})
+    return response
+
+
+class TestPortalClient(TestCase):
+    def test_adapter(self):
+        client = PortalClient(pool_size=4, retries=5, backoff_factor=0.25)
+
+        for prefix in ("https://", "http://"):
+            adapter = client.session.get_adapter(f"{prefix}mods.factorio.com")
+            self.assertEqual(adapter._pool_connections, 4)
+            self.assertEqual(adapter._pool_maxsize, 4)
+
+            retry = adapter.max_retries
+            self.assertEqual(retry.total, 5)
+            self.assertEqual(retry.backoff_factor, 0.25)
+            self.assertEqual(set(retry.status_forcelist), set(DEFAULT_RETRY_STATUSES))
+            self.assertTrue(retry.respect_retry_after_header)
+            self.assertFalse(retry.raise_on_status)
+            # only idempotent methods are retried, never POST
+            self.assertIn("GET", retry.allowed_methods)
+            self.assertNotIn("POST", retry.allowed_methods)
+
+    def test_adapter_with_limiter(self):
+        client = PortalClient(limiter=Mock())
+
+        retry = client.session.get_adapter("https://mods.factorio.com").max_retries
+
+        self.assertNotIn(429, retry.status_forcelist)
+        self.assertFalse(retry.respect_retry_after_header)
+
+    def test_default_timeout(self):
+        client = PortalClient()
+        client.session.request = Mock(return_value=make_response())
+
+        client.get("https://mods.factorio.com/api/categories")
+        client.post("https://auth.factorio.com/api-login", timeout=1.0)
+
+        (_, kwargs), (_, post_kwargs) = client.session.request.call_args_list
+        self.assertEqual(kwargs["timeout"], DEFAULT_TIMEOUT)
+        self.assertEqual(post_kwargs["timeout"], 1.0)
+
+    def test_session_reused(self):
+        client = PortalClient()
+        session = client.session
+        client.session.request = Mock(return_value=make_response())
+
+        client.get("https://mods.factorio.com/api/mods")
+        client.get("https://mods.factorio.com/api/mods")
+
+        self.assertIs(client.session, session)
+        self.assertEqual(session.request.call_count, 2)
+
+
+class TestRateLimitedRequest(TestCase):
+    url = "https://mods.factorio.com/api/mods"
+    budgets = {
+        "metadata": {"rate": 100.0, "max_rate": 100.0, "capacity": 10.0},
+        "download": {"rate": 10.0, "max_rate": 10.0, "capacity": 1.0},
+    }
+
+    def setUp(self):
+        self.limiter = AdaptiveRateLimiter(self.budgets)
+        self.limiter.acquire = Mock(wraps=self.limiter.acquire)
+        self.limiter.on_throttled = Mock(wraps=self.limiter.on_throttled)
+        self.client = PortalClient(retries=2, limiter=self.limiter)
+        self.client.session.request = Mock()
+
+    def test_retried_after_throttling(self):
+        throttled = make_response(429, b"", headers={"Retry-After": "0.05"})
+        self.client.session.request.side_effect = [throttled, make_response(200, b"[]")]
+
+        started = time.monotonic()
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.session.request.call_count, 2)
+        self.assertEqual(self.limiter.acquire.call_count, 2)
+        self.limiter.on_throttled.assert_called_once_with("metadata", 0.05)
+        # the retry waited for Retry-After and the budget was slowed down
+        self.assertGreaterEqual(time.monotonic() - started, 0.04)
+        self.assertLess(self.limiter.rate("metadata"), 100.0)
+        self.assertEqual(self.limiter.rate("download"), 10.0)
+
+    def test_gives_up(self):
+        self.client.session.request.side_effect = lambda *args, **kwargs: make_response(
+            429, b"", headers={"Retry-After": "0"}
+        )
+
+        response = self.client.get(self.url)
+
+        # the first attempt and `retries` retries, then the throttled answer is returned
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(self.client.session.request.call_count, 3)
+        self.assertEqual(self.limiter.on_throttled.call_count, 3)
+        with self.assertRaises(requests.HTTPError):
+            response.raise_for_status()
+
+    def test_post_not_retried(self):
+        self.client.session.request.return_value = make_response(429, b"", headers={"Retry-After": "0"})
+
+        response = self.client.post("https://auth.factorio.com/api-login")
+
+        # a POST isn't idempotent, the throttled answer is returned but still slows the budget down
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(self.client.session.request.call_count, 1)
+        self.limiter.on_throttled.assert_called_once_with("metadata", 0.0)
+
+
+class TestGetCached(TestCase):
+    url = "https://mods.factorio.com/api/mods"
+    params = {"page": 1, "version": "1.1"}
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache = ResponseCache(Path(self.tmp.name).joinpath("cache.sqlite3"))
+        self.client = PortalClient(cache=self.cache)
+        self.addCleanup(self.client.close)
+        self.client.session.request = Mock()
+
+    def store(self, body: bytes, age: float = 0.0) -> str:
+        key = self.cache.key(self.url, self.params)
+        self.cache.put(key, "mods", make_response(body=body, headers={"ETag": '"v1"'}))
+        self.cache.connection.execute(
+            "UPDATE responses SET stored_at = ? WHERE key = ?", (time.time() - age, key)
+        )
+        return key
+
+    def get(self, **kwargs) -> requests.Response:
+        return self.client.get_cached(self.url, "mods", params=self.params, **kwargs)
+
+    def test_miss_stored(self):
+        self.client.session.request.return_value = make_response(body=b'{"results": [1]}')
+
+        self.assertEqual(self.get().json(), {"results": [1]})
+        self.assertEqual(self.get().json(), {"results": [1]})
+
+        self.assertEqual(self.client.session.request.call_count, 1)
+
+    def test_fresh_hit(self):
+        self.store(b'{"results": []}')
+
+        self.assertEqual(self.get().json(), {"results": []})
+        self.client.session.request.assert_not_called()
+
+    def test_not_modified(self):
+        key = self.store(b'{"results": []}', age=3600)
+        self.client.session.request.return_value = make_response(304, b"")
+
+        self.assertEqual(self.get().json(), {"results": []})
+
+        _, kwargs = self.client.session.request.call_args
+        self.assertEqual(kwargs["headers"], {"If-None-Match": '"v1"'})
+        self.assertTrue(self.cache.get(key).is_fresh(self.cache.ttl("mods")))
+
+    def test_modified(self):
+        key = self.store(b'{"results": []}', age=3600)
+        self.client.session.request.return_value = make_response(body=b'{"results": [2]}')
+
+        self.assertEqual(self.get().json(), {"results": [2]})
+        self.assertEqual(self.cache.get(key).body, b'{"results": [2]}')
+
+    def test_offline(self):
+        self.client.offline = True
+        self.store(b'{"results": []}', age=3600)
+
+        self.assertEqual(self.get().json(), {"results": []})
+        self.client.session.request.assert_not_called()
+
+    def test_unreachable(self):
+        self.store(b'{"results": []}', age=3600)
+
+        for error in (requests.ConnectionError, requests.Timeout):
+            with self.subTest(error=error):
+                self.client.session.request.side_effect = error
+                self.assertEqual(self.get().json(), {"results": []})
+
+    def test_unreachable_without_entry(self):
+        self.client.session.request.side_effect = requests.ConnectionError
+
+        with self.assertRaises(requests.ConnectionError):
+            self.get()
+
+    def test_server_error(self):
+        self.store(b'{"results": []}', age=3600)
+        self.client.session.request.return_value = make_response(503, b"")
+
+        self.assertEqual(self.get().json(), {"results": []})
+
+    def test_server_error_without_entry(self):
+        self.client.session.request.return_value = make_response(503, b"")
+
+        self.assertEqual(self.get().status_code, 503)
+
+    def test_bypass(self):
+        key = self.store(b'{"results": []}')
+        self.client.session.request.return_value = make_response(body=b'{"results": [3]}')
+
+        self.assertEqual(self.get(cached=False).json(), {"results": [3]})
+
+        _, kwargs = self.client.session.request.call_args
+        self.assertNotIn("If-None-Match", kwargs.get("headers") or {})
+        self.assertEqual(self.cache.get(key).body, b'{"results": [3]}')
+
+    def test_api_bypass(self):
+        self.client.session.request.return_value = make_response(body=b'{"results": []}')
+
+        with patch("f_manager_core.factorio.client._default_client", self.client):
+            api.get_mods("1.1", page_size=25, cached=False)
+            api.get_mods("1.1", page_size=25)
+
+        # only the bypassing call reached the portal, the second one was served from the cache
+        self.assertEqual(self.client.session.request.call_count, 1)
+
+
+class TestDefaultClient(TestCase):
+    def setUp(self):
+        patcher = patch("f_manager_core.factorio.client._default_client", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_created_once(self):
+        with patch("f_manager_core.factorio.client.ResponseCache"):
+            self.assertIs(get_default_client(), get_default_client())
+
+    def test_api_uses_default_client(self):
+        client = PortalClient()
+        client.session.request = Mock(return_value=make_response(body=b'[["General", "general", "Mods"]]'))
+        set_default_client(client)
+
+        categories = api.get_categories()
+        api.get_bookmarks("user", "token")
+
+        self.assertEqual([c.name for c in categories], ["general"])
+        self.assertEqual(client.session.request.call_count, 2)
+        (method, url), kwargs = client.session.request.call_args
+        self.assertEqual((method, url), ("GET", "https://mods.factorio.com/api/bookmarks"))
+        self.assertEqual(kwargs["params"], {"username": "user", "token": "token"})
@@ -0,0 +1,81 @@
+import copy
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase, skipIf
+
+from f_manager_core.factorio.json_object_types import LazyResult, Result
+
+try:
+    from f_manager_core.factorio.columnar import CatalogColumns
+except ImportError:
+    CatalogColumns = None
+
+NOW = datetime(2023, 6, 1, tzinfo=timezone.utc)
+
+
+def result(name: str, category: str, downloads_count: int, released_at: str) -> dict:
+    return {
+        "name": name,
+        "title": name.title(),
+        "category": category,
+        "downloads_count": downloads_count,
+        "created_at": "2020-01-01T00:00:00+00:00",
+        "latest_release": {
+            "download_url": f"/download/{name}",
+            "file_name": f"{name}_1.0.0.zip",
+            "info_json": {"factorio_version": "1.1"},
+            "released_at": released_at,
+            "version": "1.0.0",
+            "sha1": "",
+        },
+    }
+
+
+RESULTS = [
+    result("a", "content", 10, "2023-05-20T00:00:00+00:00"),
+    result("b", "content", 500, "2022-01-01T00:00:00+00:00"),
+    result("c", "content", 300, "2023-05-01T00:00:00+00:00"),
+    result("d", "utilities", 1000, "2023-05-30T00:00:00+00:00"),
+    result("e", "content", 200, "2023-04-01T00:00:00+00:00"),
+]
+
+
+@skipIf(CatalogColumns is None, "numpy is not installed")
+class TestCatalogColumns(TestCase):
+    def setUp(self):
+        self.columns = CatalogColumns.from_results(Result(copy.deepcopy(r)) for r in RESULTS)
+
+    def test_columns(self):
+        self.assertEqual(len(self.columns), 5)
+        self.assertEqual(self.columns.categories, ["content", "utilities"])
+        self.assertEqual(self.columns.downloads_count.tolist(), [10, 500, 300, 1000, 200])
+        self.assertEqual(self.columns.index("d"), 3)
+
+    def test_top(self):
+        rows = self.columns.top(2)
+
+        self.assertEqual(self.columns.names[rows].tolist(), ["d", "b"])
+        self.assertEqual(self.columns.names[self.columns.top(10)].tolist(), ["d", "b", "c", "e", "a"])
+
+    def test_top_without_dates(self):
+        undated = copy.deepcopy(RESULTS[:3])
+        undated[1]["created_at"] = None
+        undated[1]["latest_release"] = None
+        undated[2]["created_at"] = "2021-01-01T00:00:00+00:00"
+        columns = CatalogColumns.from_results(Result(r) for r in undated)
+
+        # mods without a date aren't ranked first (or at all)
+        self.assertEqual(columns.names[columns.top(2, by="created_at")].tolist(), ["c", "a"])
+        self.assertEqual(columns.names[columns.top(1, by="updated_at")].tolist(), ["a"])
+        self.assertEqual(columns.top_names(10, by="updated_at"), ["a", "c"])
+
+    def test_filtered_top(self):
+        mask = self.columns.mask(category="content", updated_within=timedelta(days=90), now=NOW)
+        rows = self.columns.top(2, mask=mask)
+
+        self.assertEqual(self.columns.names[rows].tolist(), ["c", "e"])
+        self.assertFalse(self.columns.mask(category="unknown").any())
+
+    def test_lazy_results(self):
+        columns = CatalogColumns.from_results(LazyResult(copy.deepcopy(r)) for r in RESULTS)
+
+        self.assertEqual(columns.top_names(1, by="updated_at"), ["d"])
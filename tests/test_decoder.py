@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+from f_manager_core.factorio import decoder
+
+DOCUMENT = '{"results": [{"name": "Squeak Through", "title": "Кrastorio ✓", "downloads_count": 12345, "score": 1.5, "deprecated": false, "thumbnail": null}]}'  # noqa: E501
+EXPECTED = {
+    "results": [
+        {
+            "name": "Squeak Through",
+            "title": "Кrastorio ✓",
+            "downloads_count": 12345,
+            "score": 1.5,
+            "deprecated": False,
+            "thumbnail": None,
+        }
+    ]
+}
+
+
+class TestDecoder(TestCase):
+    def setUp(self):
+        self.addCleanup(decoder.set_backend, decoder.get_backend())
+
+    def test_stdlib_available(self):
+        self.assertIn("json", decoder.available_backends())
+
+    def test_backends(self):
+        for backend in decoder.available_backends():
+            with self.subTest(backend=backend):
+                self.assertEqual(decoder.set_backend(backend), backend)
+
+                self.assertEqual(decoder.decode(DOCUMENT.encode()), EXPECTED)
+                self.assertEqual(decoder.decode(memoryview(DOCUMENT.encode())), EXPECTED)
+                with self.assertRaises(ValueError):
+                    decoder.decode(b'{"results": [}')
+
+    def test_default_is_fastest(self):
+        self.assertEqual(decoder.set_backend(), decoder.available_backends()[0])
+
+    def test_unknown(self):
+        with self.assertRaises(ValueError):
+            decoder.set_backend("yaml")
@@ -0,0 +1,248 @@
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+from pathlib import Path
+import tempfile
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests
+
+from f_manager_core.factorio.client import PortalClient
+from f_manager_core.factorio.download import PART_SUFFIX, DownloadManager
+from f_manager_core.factorio.exceptions import ChecksumMismatch
+from f_manager_core.factorio.json_object_types import Release
+from f_manager_core.factorio.store import BlobStore
+from f_manager_core.info_cache import Sha1Cache
+
+PAYLOAD = os.urandom(256 * 1024 + 123)
+SHA1 = hashlib.sha1(PAYLOAD).hexdigest()
+CUT_AT = 50 * 1024
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serves `PAYLOAD`, answering range requests as configured on the server."""
+
+    def do_GET(self):
+        range_header = self.headers.get("Range")
+        self.server.ranges.append(range_header)
+
+        if self.server.mode == "416":
+            self.send_error_response(416)
+            return
+
+        start = 0
+        if range_header and self.server.mode == "range":
+            start = int(range_header[len("bytes="):-len("-")])
+            if start >= len(PAYLOAD):
+                self.send_error_response(416)
+                return
+
+        body = PAYLOAD[start:]
+        self.send_response(206 if start else 200)
+        if start:
+            self.send_header("Content-Range", f"bytes {start}-{len(PAYLOAD) - 1}/{len(PAYLOAD)}")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.server.mode == "cut":
+            # the connection drops in the middle of the body, the next request can resume
+            self.server.mode = "range"
+            self.wfile.write(body[:CUT_AT])
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def send_error_response(self, status: int):
+        self.send_response(status)
+        self.send_header("Content-Range", f"bytes */{len(PAYLOAD)}")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def make_release(file_name: str = "mod_1.0.0.zip", sha1: str = SHA1) -> Release:
+    return Release(
+        {
+            "download_url": "/download/mod/1",
+            "file_name": file_name,
+            "info_json": {"factorio_version": "1.1"},
+            "released_at": "2023-01-01T00:00:00.000000Z",
+            "version": "1.0.0",
+            "sha1": sha1,
+        }
+    )
+
+
+class DownloadTestCase(TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.mode = "range"
+        self.server.ranges = []
+        threading.Thread(target=self.server.serve_forever, args=(0.01,), daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        patcher = patch(
+            "f_manager_core.factorio.download.MOD_PORTAL_BASE_URL",
+            f"http://127.0.0.1:{self.server.server_port}",
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.mods_dir = Path(self.tmp.name).joinpath("mods")
+        self.mods_dir.mkdir()
+        self.client = PortalClient(retries=0)
+        self.addCleanup(self.client.close)
+
+    def manager(self, **kwargs) -> DownloadManager:
+        kwargs.setdefault("target_dir", self.mods_dir)
+        return DownloadManager("user", "token", client=self.client, buffer_size=4096, **kwargs)
+
+    def part(self, file_name: str = "mod_1.0.0.zip") -> Path:
+        return self.mods_dir.joinpath(file_name + PART_SUFFIX)
+
+
+class TestDownloadRelease(DownloadTestCase):
+    def test_download(self):
+        path = self.mods_dir.joinpath("mod_1.0.0.zip")
+        path.write_bytes(b"previous content")
+
+        result = self.manager().download_release(make_release())
+
+        self.assertEqual(path.read_bytes(), PAYLOAD)
+        self.assertFalse(self.part().exists())
+        self.assertEqual(result.downloaded, len(PAYLOAD))
+        self.assertFalse(result.resumed)
+        self.assertEqual(self.server.ranges, [None])
+
+    def test_resume(self):
+        self.part().write_bytes(PAYLOAD[:1000])
+
+        result = self.manager().download_release(make_release())
+
+        self.assertEqual(self.mods_dir.joinpath("mod_1.0.0.zip").read_bytes(), PAYLOAD)
+        self.assertFalse(self.part().exists())
+        self.assertTrue(result.resumed)
+        self.assertEqual(result.downloaded, len(PAYLOAD) - 1000)
+        self.assertEqual(self.server.ranges, ["bytes=1000-"])
+
+    def test_resume_after_dropped_connection(self):
+        self.server.mode = "cut"
+
+        with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+            self.manager().download_release(make_release())
+
+        # the part file holds only received content, not a preallocated zero-filled tail
+        received = self.part().read_bytes()
+        self.assertTrue(0 < len(received) <= CUT_AT)
+        self.assertEqual(received, PAYLOAD[:len(received)])
+
+        result = self.manager().download_release(make_release())
+
+        self.assertEqual(self.mods_dir.joinpath("mod_1.0.0.zip").read_bytes(), PAYLOAD)
+        self.assertTrue(result.resumed)
+        self.assertEqual(result.downloaded, len(PAYLOAD) - len(received))
+        self.assertEqual(self.server.ranges, [None, f"bytes={len(received)}-"])
+
+    def test_range_ignored(self):
+        self.server.mode = "ignore"
+        self.part().write_bytes(b"stale content of another release")
+
+        result = self.manager().download_release(make_release())
+
+        self.assertEqual(self.mods_dir.joinpath("mod_1.0.0.zip").read_bytes(), PAYLOAD)
+        self.assertFalse(result.resumed)
+        self.assertEqual(result.downloaded, len(PAYLOAD))
+
+    def test_part_already_complete(self):
+        self.part().write_bytes(PAYLOAD)
+
+        result = self.manager().download_release(make_release())
+
+        self.assertEqual(self.mods_dir.joinpath("mod_1.0.0.zip").read_bytes(), PAYLOAD)
+        self.assertFalse(self.part().exists())
+        self.assertEqual(result.downloaded, 0)
+        self.assertEqual(self.server.ranges, [f"bytes={len(PAYLOAD)}-"])
+
+    def test_416_without_part(self):
+        self.server.mode = "416"
+
+        with self.assertRaises(requests.HTTPError):
+            self.manager().download_release(make_release(sha1=""))
+
+        self.assertFalse(self.mods_dir.joinpath("mod_1.0.0.zip").exists())
+        self.assertFalse(self.part().exists())
+
+    def test_checksum_mismatch(self):
+        path = self.mods_dir.joinpath("mod_1.0.0.zip")
+        path.write_bytes(b"previous content")
+
+        with self.assertRaises(ChecksumMismatch):
+            self.manager().download_release(make_release(sha1="0" * 40))
+
+        self.assertFalse(self.part().exists())
+        # the previous file is only replaced by a verified download
+        self.assertEqual(path.read_bytes(), b"previous content")
+
+
+class TestDownload(DownloadTestCase):
+    def test_report(self):
+        releases = [make_release("a_1.0.0.zip"), make_release("b_1.0.0.zip", sha1="0" * 40)]
+
+        report = self.manager(workers=2).download(releases)
+
+        self.assertEqual([r.ok for r in report.results], [True, False])
+        self.assertIsInstance(report.failed[0].error, ChecksumMismatch)
+        self.assertEqual(report.downloaded, 2 * len(PAYLOAD))
+        self.assertEqual(sorted(os.listdir(self.mods_dir)), ["a_1.0.0.zip"])
+
+    def test_dropped_connection_reported(self):
+        self.server.mode = "cut"
+
+        report = self.manager().download([make_release()])
+
+        self.assertIsInstance(report.failed[0].error, requests.RequestException)
+        self.assertTrue(self.part().exists())
+        self.assertTrue(self.manager().download([make_release()]).results[0].resumed)
+
+    def test_store(self):
+        store = BlobStore(Path(self.tmp.name).joinpath("store"))
+        other_dir = Path(self.tmp.name).joinpath("other")
+        other_dir.mkdir()
+
+        downloaded = self.manager(store=store).download_release(make_release())
+        materialized = self.manager(store=store, target_dir=other_dir).download_release(
+            make_release()
+        )
+
+        self.assertEqual(list(store), [SHA1])
+        self.assertFalse(downloaded.from_store)
+        self.assertTrue(materialized.from_store)
+        self.assertEqual(self.server.ranges, [None])
+        for mods_dir in (self.mods_dir, other_dir):
+            self.assertEqual(mods_dir.joinpath("mod_1.0.0.zip").read_bytes(), PAYLOAD)
+            self.assertEqual(os.listdir(mods_dir), ["mod_1.0.0.zip"])
+
+    def test_store_gc(self):
+        store = BlobStore(Path(self.tmp.name).joinpath("store"))
+        cache = Sha1Cache(Path(self.tmp.name).joinpath("sha1.sqlite3"))
+        self.addCleanup(cache.close)
+        manager = self.manager(store=store)
+        manager.download_release(make_release())
+        path = self.mods_dir.joinpath("mod_1.0.0.zip")
+
+        # whichever method materialized the file (reflink on btrfs/XFS), it keeps the blob alive
+        self.assertEqual(store.gc([self.mods_dir], cache=cache), [])
+
+        path.unlink()
+        self.assertEqual(store.gc([self.mods_dir], cache=cache), [SHA1])
+        self.assertEqual(list(store), [])
+
+        # removed from the store, so the release is downloaded again
+        self.assertFalse(manager.download_release(make_release()).from_store)
+        self.assertEqual(path.read_bytes(), PAYLOAD)
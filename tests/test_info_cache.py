@@ -0,0 +1,53 @@
+import os
+from pathlib import Path
+import tempfile
+from unittest import TestCase
+from unittest.mock import Mock
+
+from f_manager_core.info_cache import InfoCache
+
+INFO = {"name": "flib", "version": "0.12.9"}
+
+
+class TestInfoCache(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = Path(self.tmp.name).joinpath("mod_info.sqlite3")
+        self.zip = Path(self.tmp.name).joinpath("flib_0.12.9.zip")
+        self.zip.write_bytes(b"zip")
+        self.cache = InfoCache(path=self.db)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def test_load_reads_once(self):
+        read = Mock(return_value=INFO)
+
+        self.assertEqual(self.cache.load(self.zip, read), INFO)
+        self.assertEqual(self.cache.load(self.zip, read), INFO)
+
+        read.assert_called_once_with(self.zip)
+
+    def test_persistent(self):
+        self.cache.put(self.zip, INFO)
+        self.cache.close()
+
+        self.assertEqual(InfoCache(path=self.db).get(self.zip), INFO)
+
+    def test_invalidated_by_change(self):
+        self.cache.put(self.zip, INFO)
+
+        self.zip.write_bytes(b"bigger zip")
+        self.assertIsNone(self.cache.get(self.zip))
+
+        self.cache.put(self.zip, INFO)
+        stat = os.stat(self.zip)
+        os.utime(self.zip, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        self.assertIsNone(self.cache.get(self.zip))
+
+    def test_prune(self):
+        self.cache.put(self.zip, INFO)
+
+        self.assertEqual(self.cache.prune([]), 1)
+        self.assertEqual(len(self.cache), 0)
@@ -0,0 +1,58 @@
+import copy
+import pickle
+from unittest import TestCase
+
+from f_manager_core.factorio.json_object_types import LazyModListResponse, LazyResult, Result
+
+RELEASE = {
+    "download_url": "/download/flib/5f3e",
+    "file_name": "flib_0.12.9.zip",
+    "info_json": {"factorio_version": "1.1", "dependencies": ["base >= 1.1.0"]},
+    "released_at": "2023-05-01T10:00:00.000000Z",
+    "version": "0.12.9",
+    "sha1": "2cd4a9c5c3b2f6bd5d8e1a9e6e6b2f0c5d7e8f90",
+}
+RESULT = {
+    "downloads_count": 1000,
+    "name": "flib",
+    "owner": "raiguard",
+    "summary": "Factorio Library",
+    "title": "Factorio Library",
+    "category": "internal",
+    "created_at": "2020-01-01T00:00:00.000000Z",
+    "latest_release": dict(RELEASE),
+    "releases": [dict(RELEASE)],
+    "tag": [{"id": 1, "name": "utilities", "title": "Utilities", "description": "", "type": "t"}],
+}
+
+
+class TestLazyResult(TestCase):
+    def test_same_as_result(self):
+        result = Result(copy.deepcopy(RESULT))
+        lazy = LazyResult(copy.deepcopy(RESULT))
+
+        for field in ("name", "title", "downloads_count", "created_at", "thumbnail", "changelog"):
+            self.assertEqual(getattr(lazy, field), getattr(result, field), field)
+        self.assertEqual(lazy.latest_release.released_at, result.latest_release.released_at)
+        self.assertEqual(lazy.latest_release.info_json.factorio_version, "1.1")
+        self.assertEqual([r.version for r in lazy.releases], [r.version for r in result.releases])
+        self.assertEqual(lazy.tag[0].name, result.tag[0].name)
+        self.assertIsNone(lazy.licence)
+
+    def test_no_dict(self):
+        lazy = LazyResult(copy.deepcopy(RESULT))
+
+        self.assertFalse(hasattr(lazy, "__dict__"))
+        with self.assertRaises(AttributeError):
+            lazy.unknown
+
+    def test_pickle(self):
+        lazy = pickle.loads(pickle.dumps(LazyResult(copy.deepcopy(RESULT))))
+
+        self.assertEqual(lazy.latest_release.version, "0.12.9")
+
+    def test_list_response(self):
+        response = LazyModListResponse({"pagination": None, "results": [RESULT]})
+
+        self.assertIsNone(response.pagination)
+        self.assertEqual(response.results[0].name, "flib")
@@ -0,0 +1,137 @@
+from pathlib import Path
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from f_manager_core.factorio.json_object_types import Category, ModListResponse, Result
+from f_manager_core.factorio.mirror import CatalogMirror
+
+
+def result(i: int, day: int) -> dict:
+    return {
+        "name": f"mod{i}",
+        "title": f"Mod {i}",
+        "owner": f"owner{i % 2}",
+        "summary": "summary",
+        "category": "content",
+        "downloads_count": i,
+        "latest_release": {
+            "download_url": f"/download/mod{i}",
+            "file_name": f"mod{i}_1.0.{day}.zip",
+            "info_json": {"factorio_version": "1.1"},
+            "released_at": f"2023-01-{day:02d}T00:00:00+00:00",
+            "version": f"1.0.{day}",
+            "sha1": f"{i:040x}",
+        },
+    }
+
+
+def fake_iter_mods(version, page_size):
+    return (Result(result(i, 1 + i % 5)) for i in range(10))
+
+
+def fake_get_mods_by_names(names, version):
+    # namelist responses carry all releases instead of latest_release
+    found = {}
+    for name in names:
+        i = int(name[len("mod"):])
+        releases = [result(i, day)["latest_release"] for day in (2, 20 if i == 3 else 15)]
+        found[name] = Result({"name": name, "releases": releases})
+    return found
+
+
+def fake_get_mods(version, page, page_size, sort, sort_order, cached):
+    return ModListResponse(
+        {
+            "pagination": {"count": 3, "links": {}, "page": 1, "page_count": 1, "page_size": 100},
+            "results": [result(3, 20), result(11, 15), result(5, 3)],
+        }
+    )
+
+
+@patch("f_manager_core.factorio.mirror.get_categories", lambda: [Category(["Content", "content", ""])])
+@patch("f_manager_core.factorio.mirror.get_mods", side_effect=fake_get_mods)
+@patch("f_manager_core.factorio.mirror.iter_mods", side_effect=fake_iter_mods)
+class TestCatalogMirror(TestCase):
+    def setUp(self):
+        patcher = patch(
+            "f_manager_core.factorio.mirror.get_mods_by_names", side_effect=fake_get_mods_by_names
+        )
+        self.get_mods_by_names = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.mirror = CatalogMirror(path=Path(self.tmp.name).joinpath("catalog.sqlite3"))
+
+    def tearDown(self):
+        self.mirror.close()
+        self.tmp.cleanup()
+
+    def test_initial_load(self, iter_mods, get_mods):
+        self.assertEqual(self.mirror.sync(), 10)
+
+        get_mods.assert_not_called()
+        self.assertEqual(len(self.mirror), 10)
+        self.assertEqual(self.mirror.last_updated_at, "2023-01-05T00:00:00+00:00")
+        self.assertEqual(self.mirror.get("mod4").latest_release.version, "1.0.5")
+        self.assertEqual([c.name for c in self.mirror.categories()], ["content"])
+
+    def test_incremental_sync(self, iter_mods, get_mods):
+        self.mirror.sync()
+
+        self.assertEqual(self.mirror.sync(), 2)
+
+        iter_mods.assert_called_once()
+        self.assertFalse(get_mods.call_args.kwargs["cached"])
+        self.assertEqual(len(self.mirror), 11)
+        self.assertEqual(self.mirror.last_updated_at, "2023-01-20T00:00:00+00:00")
+        # older releases of updated mods come from namelist queries
+        self.assertEqual(
+            [r.version for r in self.mirror.releases("mod3")], ["1.0.2", "1.0.4", "1.0.20"]
+        )
+        self.assertEqual(self.mirror.get("mod3").latest_release.version, "1.0.20")
+        self.get_mods_by_names.assert_called_once_with(["mod3", "mod11"], version="1.1")
+
+    def test_incremental_sync_pages(self, iter_mods, get_mods):
+        self.mirror.sync()
+        pages = {
+            # mod0's portal updated_at moved without a new release, later pages are still newer
+            1: [result(20, 25), result(0, 1), result(21, 24)],
+            2: [result(22, 23), result(1, 2)],
+            3: [result(23, 22)],
+        }
+        get_mods.side_effect = lambda version, page, **kwargs: ModListResponse(
+            {
+                "pagination": {
+                    "count": 6, "links": {}, "page": page, "page_count": 3, "page_size": 3
+                },
+                "results": pages[page],
+            }
+        )
+
+        self.assertEqual(self.mirror.sync(), 3)
+
+        self.assertEqual([call.kwargs["page"] for call in get_mods.call_args_list], [1, 2])
+        self.assertEqual(len(self.mirror), 13)
+        self.assertIsNone(self.mirror.get("mod23"))
+
+    def test_queries(self, iter_mods, get_mods):
+        self.mirror.sync()
+
+        self.assertEqual([r.name for r in self.mirror.search("Mod 1")], ["mod1"])
+        self.assertEqual(len(self.mirror.by_owner("owner1")), 5)
+        self.assertEqual(len(self.mirror.by_category("content")), 10)
+        self.assertEqual(len(self.mirror.by_factorio_version("1.1")), 10)
+        self.assertIsNone(self.mirror.get("unknown"))
+
+    def test_snapshot(self, iter_mods, get_mods):
+        self.mirror.sync()
+
+        self.assertTrue(self.mirror.snapshot_path.exists())
+        with patch.object(self.mirror, "_results", side_effect=AssertionError):
+            results = self.mirror.all()
+        self.assertEqual(len(results), 10)
+        self.assertEqual(results[4].latest_release.version, "1.0.5")
+
+        self.mirror.sync()
+
+        self.assertEqual(len(self.mirror.all()), 11)
@@ -0,0 +1,132 @@
+import json
+from pathlib import Path
+import tempfile
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+import zipfile
+
+from f_manager_core.factorio.json_object_types import Result
+from f_manager_core.exceptions import ModNotFoundError
+from f_manager_core.info_cache import InfoCache
+from f_manager_core.mod import check_updates, get_local_mods, gmod, LocalMod, read_mod_info_json
+
+
+def write_mod(mods_dir: Path, name: str, version: str, factorio_version: str = "1.1") -> Path:
+    path = mods_dir.joinpath(f"{name}_{version}.zip")
+    info = {
+        "name": name,
+        "version": version,
+        "title": name,
+        "author": "author",
+        "factorio_version": factorio_version,
+        "dependencies": ["base >= 1.1"],
+    }
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(f"{name}_{version}/info.json", json.dumps(info))
+        archive.writestr(f"{name}_{version}/data.lua", "")
+    return path
+
+
+def remote(name: str, *releases) -> Result:
+    return Result(
+        {
+            "name": name,
+            "releases": [
+                {
+                    "download_url": f"/download/{name}",
+                    "file_name": f"{name}_{version}.zip",
+                    "info_json": {"factorio_version": factorio_version},
+                    "released_at": "2023-01-01T00:00:00+00:00",
+                    "version": version,
+                    "sha1": "",
+                }
+                for version, factorio_version in releases
+            ],
+        }
+    )
+
+
+class ModsDirTestCase(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.mods_dir = Path(self.tmp.name)
+        config_patch = patch(
+            "f_manager_core.mod.config",
+            SimpleNamespace(factorio=SimpleNamespace(mods_dir=self.mods_dir)),
+        )
+        config_patch.start()
+        self.addCleanup(config_patch.stop)
+
+        info_cache = InfoCache(path=Path(self.tmp.name).joinpath("mod_info.sqlite3"))
+        cache_patch = patch("f_manager_core.info_cache._default_cache", info_cache)
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+        self.addCleanup(info_cache.close)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+
+class TestCheckUpdates(ModsDirTestCase):
+    def test_outdated(self):
+        write_mod(self.mods_dir, "flib", "0.12.4")
+        write_mod(self.mods_dir, "Krastorio2", "1.3.20")
+        write_mod(self.mods_dir, "old", "1.0.0", factorio_version="1.0")
+        remote_mods = {
+            "flib": remote("flib", ("0.12.4", "1.1"), ("0.12.9", "1.1"), ("0.13.0", "2.0")),
+            "Krastorio2": remote("Krastorio2", ("1.3.20", "1.1")),
+            "old": remote("old", ("1.0.0", "1.0"), ("1.0.1", "1.0"), ("1.1.0", "1.1")),
+        }
+
+        with patch("f_manager_core.mod.get_mods_by_names", return_value=remote_mods) as get:
+            updates = check_updates()
+
+        get.assert_called_once()
+        self.assertEqual({name: r.version for name, r in updates.items()}, {"flib": "0.12.9", "old": "1.0.1"})
+
+    def test_factorio_version(self):
+        write_mod(self.mods_dir, "old", "1.0.0", factorio_version="1.0")
+        remote_mods = {"old": remote("old", ("1.0.1", "1.0"), ("1.1.0", "1.1"))}
+
+        with patch("f_manager_core.mod.get_mods_by_names", return_value=remote_mods):
+            updates = check_updates(factorio_version="1.1")
+
+        self.assertEqual(updates["old"].version, "1.1.0")
+
+
+class TestLazyLocalMod(ModsDirTestCase):
+    def test_loads_on_access(self):
+        path = write_mod(self.mods_dir, "Squeak_Through", "1.8.2")
+
+        with patch("f_manager_core.mod.read_mod_info_json", wraps=read_mod_info_json) as read:
+            mod = LocalMod("Squeak_Through")
+            self.assertEqual(mod.file, path)
+            self.assertFalse(mod.loaded)
+            read.assert_not_called()
+
+            self.assertEqual(mod.version, "1.8.2")
+            self.assertEqual(mod.title, "Squeak_Through")
+            self.assertIsNone(mod.homepage)
+        read.assert_called_once()
+        self.assertTrue(mod.loaded)
+        with self.assertRaises(AttributeError):
+            mod.unknown
+
+    def test_injected_info(self):
+        write_mod(self.mods_dir, "flib", "0.12.9")
+
+        with patch("f_manager_core.mod.read_mod_info_json") as read:
+            mods = get_local_mods({"flib": {"name": "flib", "version": "0.12.9", "title": "Flib"}})
+
+            self.assertEqual([mod.title for mod in mods], ["Flib"])
+            self.assertEqual(mods[0].dependencies, ("base",))
+        read.assert_not_called()
+
+    def test_exists(self):
+        write_mod(self.mods_dir, "flib", "0.12.9")
+
+        self.assertIsInstance(gmod("flib"), LocalMod)
+        self.assertEqual(gmod("unknown").name, "unknown")
+        with self.assertRaises(ModNotFoundError):
+            LocalMod("unknown")
@@ -0,0 +1,119 @@
+import os
+from pathlib import Path
+import random
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from packaging.specifiers import SpecifierSet
+
+from f_manager_core.mod_index import InstalledVersions, ModsIndex, parse_mod_file_name, version_key
+
+
+class TestModsIndex(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.mods_dir = Path(self.tmp.name)
+        for file_name in ("flib_0.12.4.zip", "flib_0.12.10.zip", "Squeak_Through_1.8.2.zip", "mod-list.json"):
+            self.mods_dir.joinpath(file_name).touch()
+        self.index = ModsIndex(self.mods_dir)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_parse_file_name(self):
+        self.assertEqual(parse_mod_file_name("Squeak_Through_1.8.2.zip"), ("Squeak_Through", "1.8.2"))
+        self.assertEqual(parse_mod_file_name("flib_0.12.4.zip"), ("flib", "0.12.4"))
+        self.assertEqual(parse_mod_file_name("Squeak_Through.zip"), ("Squeak_Through", ""))
+        self.assertEqual(parse_mod_file_name("my_mod_v2_1.0.zip"), ("my_mod_v2", "1.0"))
+
+    def test_version_key(self):
+        self.assertLess(version_key("0.12.9"), version_key("0.12.10"))
+        self.assertLess(version_key("dev"), version_key("0.0.1"))
+
+    def test_lookup(self):
+        self.assertEqual(sorted(self.index), ["Squeak_Through", "flib"])
+        self.assertIn("Squeak_Through", self.index)
+        self.assertEqual(set(self.index.versions("flib")), {"0.12.4", "0.12.10"})
+        self.assertEqual(self.index.path("flib").name, "flib_0.12.10.zip")
+        self.assertEqual(self.index.path("flib", "0.12.4").name, "flib_0.12.4.zip")
+        self.assertIsNone(self.index.path("unknown"))
+
+    def test_scans_only_on_change(self):
+        self.index.refresh()
+
+        with patch("f_manager_core.mod_index.os.scandir") as scandir:
+            self.assertIn("flib", self.index)
+            self.assertEqual(len(self.index), 2)
+        scandir.assert_not_called()
+
+        self.mods_dir.joinpath("new_1.0.0.zip").touch()
+        os.utime(self.mods_dir, ns=(0, 1))
+
+        self.assertIn("new", self.index)
+
+    def test_installed_versions(self):
+        self.mods_dir.joinpath("flib_0.9.0.zip").touch()
+        installed = self.index.installed("flib")
+
+        self.assertEqual(list(installed), ["0.9.0", "0.12.4", "0.12.10"])
+        self.assertEqual(self.index.latest("flib"), "0.12.10")
+        self.assertIn("0.12.4", installed)
+        self.assertNotIn("0.12.5", installed)
+        self.assertEqual(installed.satisfying(">= 0.10, < 0.12.10"), "0.12.4")
+        self.assertIsNone(installed.satisfying(">= 1.0"))
+        self.assertEqual(len(self.index.installed("unknown")), 0)
+
+    def test_satisfying_bisects(self):
+        installed = InstalledVersions(
+            (f"1.{minor}.{patch}", Path("x")) for minor in range(20) for patch in range(50)
+        )
+        contains = SpecifierSet.contains
+
+        with patch.object(SpecifierSet, "contains", autospec=True, side_effect=contains) as contains:
+            self.assertEqual(installed.satisfying("< 1.5.0"), "1.4.49")
+            self.assertEqual(installed.satisfying(">= 1.19.49"), "1.19.49")
+            self.assertIsNone(installed.satisfying("> 2.0"))
+
+        # only versions next to the boundary are checked, not all 1000
+        self.assertLess(contains.call_count, 5)
+
+    def test_satisfying_matches_scan(self):
+        versions = ["0.1", "0.1.0", "1.0", "1.0.0", "1.0.1", "1.1", "1.2.3", "1.10", "2.0.0", "dev"]
+        installed = InstalledVersions((v, Path(v)) for v in versions)
+        random.seed(1)
+        specs = [""] + [
+            f"{operator} {version}"
+            for operator in (">=", ">", "<=", "<", "==", "!=", "~=")
+            for version in ("0", "0.1", "1.0", "1.0.0", "1.1.0", "1.2", "1.10.0", "3")
+            if operator != "~=" or "." in version
+        ]
+        specs += [f"{random.choice(specs)}, {random.choice(specs)}".strip(", ") for _ in range(200)]
+
+        for spec in specs:
+            with self.subTest(spec=spec):
+                spec_set = SpecifierSet(spec)
+                expected = next(
+                    (v for v in reversed(installed.versions) if spec_set.contains(v, prereleases=True)),
+                    None,
+                )
+                self.assertEqual(installed.satisfying(spec), expected)
+
+    def test_satisfies(self):
+        self.assertTrue(self.index.satisfies("flib", ">= 0.12.5"))
+        self.assertFalse(self.index.satisfies("flib", ">= 0.12.5", version="0.12.4"))
+        self.assertTrue(self.index.satisfies("flib", SpecifierSet(""), version="0.12.4"))
+        self.assertFalse(self.index.satisfies("flib", "", version="0.12.5"))
+        self.assertFalse(self.index.satisfies("unknown", ""))
+
+    def test_incremental_update(self):
+        self.index.refresh()
+        installed = self.index.installed("flib")
+
+        self.index.add(self.mods_dir.joinpath("flib_0.13.0.zip"))
+        self.index.discard(self.mods_dir.joinpath("flib_0.12.4.zip"))
+        self.index.discard(self.mods_dir.joinpath("Squeak_Through_1.8.2.zip"))
+
+        self.assertEqual(list(installed), ["0.12.4", "0.12.10"])
+        self.assertEqual(list(self.index.installed("flib")), ["0.12.10", "0.13.0"])
+        self.assertNotIn("Squeak_Through", self.index)
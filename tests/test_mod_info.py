@@ -0,0 +1,69 @@
+import json
+import pickle
+from unittest import TestCase
+
+from packaging.specifiers import SpecifierSet
+
+from f_manager_core.mod import LocalMod
+from f_manager_core.mod_info import ModInfo
+from tests.test_mod import ModsDirTestCase, write_mod
+
+INFO = {
+    "name": "Squeak_Through",
+    "version": "1.8.2",
+    "title": "Squeak Through",
+    "author": "Supercheese",
+    "factorio_version": "1.1",
+    "dependencies": ["base >= 1.1.0", "? bobwarfare", "! Yuoki"],
+    "package": {"unknown": "key"},
+}
+
+
+class TestModInfo(TestCase):
+    def test_from_json(self):
+        info = ModInfo.from_json(INFO)
+
+        self.assertEqual(info.version_key, (1, 8, 2))
+        self.assertEqual(info.mandatory_dependencies, (("base", SpecifierSet(">=1.1.0")),))
+        self.assertEqual([name for name, _ in info.optional_dependencies], ["bobwarfare"])
+        self.assertEqual([name for name, _ in info.incompatible_dependencies], ["Yuoki"])
+        self.assertEqual(ModInfo.from_json({"name": "a", "version": "1.0"}).dependencies, ("base",))
+
+    def test_shared_values(self):
+        # decoded separately, like info.json of two different zips
+        first, second = (ModInfo.from_json(json.loads(json.dumps(INFO))) for _ in range(2))
+
+        self.assertIs(first.author, second.author)
+        self.assertIs(first.mandatory_dependencies[0], second.mandatory_dependencies[0])
+
+    def test_immutable(self):
+        info = ModInfo.from_json(INFO)
+
+        self.assertFalse(hasattr(info, "__dict__"))
+        with self.assertRaises(AttributeError):
+            info.version = "2.0.0"
+
+    def test_pickle(self):
+        info = ModInfo.from_json(INFO)
+
+        self.assertEqual(pickle.loads(pickle.dumps(info)), info)
+
+
+class TestLocalModInfo(ModsDirTestCase):
+    def test_injected_record(self):
+        write_mod(self.mods_dir, "Squeak_Through", "1.8.2")
+
+        mod = LocalMod("Squeak_Through", ModInfo.from_json(INFO))
+
+        self.assertTrue(mod.loaded)
+        self.assertEqual(mod.title, "Squeak Through")
+        self.assertIsNone(mod.homepage)
+        self.assertFalse(hasattr(mod, "package"))
+
+    def test_record_of_loaded_mod(self):
+        write_mod(self.mods_dir, "Squeak_Through", "1.8.2")
+
+        info = LocalMod("Squeak_Through").info
+
+        self.assertEqual(info.version_key, (1, 8, 2))
+        self.assertEqual(info.mandatory_dependencies[0][0], "base")
@@ -0,0 +1,44 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from f_manager_core.exceptions import BrokenModException
+from f_manager_core.info_cache import InfoCache
+from f_manager_core.mod_scanner import scan_mods
+from tests.test_mod import ModsDirTestCase, write_mod
+
+
+class TestScanMods(ModsDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.mods_dir = Path(self.tmp.name).joinpath("mods")
+        self.mods_dir.mkdir()
+        self.cache = InfoCache(path=Path(self.tmp.name).joinpath("info.sqlite3"))
+        self.addCleanup(self.cache.close)
+
+        write_mod(self.mods_dir, "flib", "0.12.4")
+        write_mod(self.mods_dir, "flib", "0.12.9")
+        write_mod(self.mods_dir, "Squeak_Through", "1.8.2")
+        self.mods_dir.joinpath("broken_1.0.0.zip").write_bytes(b"not a zip")
+
+    def test_scan(self):
+        result = scan_mods(self.mods_dir, workers=2, cache=self.cache)
+
+        self.assertEqual(set(result.mods), {"flib", "Squeak_Through"})
+        self.assertEqual(result.mods["flib"]["version"], "0.12.9")
+        self.assertEqual(list(result.errors), [self.mods_dir.joinpath("broken_1.0.0.zip")])
+        self.assertEqual(len(self.cache), 2)
+
+    def test_cached(self):
+        scan_mods(self.mods_dir, cache=self.cache)
+
+        with patch("f_manager_core.mod_scanner._read", return_value=(None, BrokenModException())) as read:
+            result = scan_mods(self.mods_dir, cache=self.cache)
+
+        self.assertEqual(len(result.mods), 2)
+        read.assert_called_once_with(self.mods_dir.joinpath("broken_1.0.0.zip"))
+
+    def test_processes(self):
+        result = scan_mods(self.mods_dir, workers=2, processes=True, use_cache=False)
+
+        self.assertEqual(result.mods["Squeak_Through"]["name"], "Squeak_Through")
+        self.assertEqual(len(result.errors), 1)
@@ -0,0 +1,84 @@
+import hashlib
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from f_manager_core.factorio.json_object_types import Result
+from f_manager_core.info_cache import Sha1Cache
+from f_manager_core.mod_verify import verify_mods
+from tests.test_mod import ModsDirTestCase, write_mod
+
+
+def remote(name: str, **sha1s) -> Result:
+    return Result(
+        {
+            "name": name,
+            "releases": [
+                {
+                    "download_url": f"/download/{name}",
+                    "file_name": f"{name}_{version}.zip",
+                    "info_json": {"factorio_version": "1.1"},
+                    "released_at": "2023-01-01T00:00:00+00:00",
+                    "version": version,
+                    "sha1": sha1,
+                }
+                for version, sha1 in sha1s.items()
+            ],
+        }
+    )
+
+
+def sha1(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+class TestVerifyMods(ModsDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.mods_dir = Path(self.tmp.name).joinpath("mods")
+        self.mods_dir.mkdir()
+        self.cache = Sha1Cache(path=Path(self.tmp.name).joinpath("sha1.sqlite3"))
+        self.addCleanup(self.cache.close)
+
+        self.good = write_mod(self.mods_dir, "flib", "0.12.9")
+        self.bad = write_mod(self.mods_dir, "Squeak_Through", "1.8.2")
+        self.local = write_mod(self.mods_dir, "my-local-mod", "0.1.0")
+        self.mods_dir.joinpath("mod-list.json").write_text(
+            json.dumps(
+                {
+                    "mods": [
+                        {"name": "base", "enabled": True},
+                        {"name": "flib", "enabled": True},
+                        {"name": "deleted-mod", "enabled": True},
+                        {"name": "disabled-mod", "enabled": False},
+                    ]
+                }
+            )
+        )
+        self.remote_mods = {
+            "flib": remote("flib", **{"0.12.9": sha1(self.good)}),
+            "Squeak_Through": remote("Squeak_Through", **{"1.8.2": "0" * 40}),
+        }
+
+    def verify(self):
+        with patch("f_manager_core.mod_verify.get_mods_by_names", return_value=self.remote_mods):
+            return verify_mods(self.mods_dir, workers=2, cache=self.cache)
+
+    def test_report(self):
+        report = self.verify()
+
+        self.assertFalse(report.ok)
+        self.assertEqual([f.path for f in report.mismatched], [self.bad])
+        self.assertEqual([f.path for f in report.unknown], [self.local])
+        self.assertEqual(report.missing, ["deleted-mod"])
+        self.assertEqual(report.failed, [])
+
+    def test_only_changed_files_are_hashed(self):
+        self.verify()
+        self.remote_mods["Squeak_Through"] = remote("Squeak_Through", **{"1.8.2": sha1(self.bad)})
+
+        with patch("f_manager_core.mod_verify.sha1_file", side_effect=AssertionError):
+            report = self.verify()
+
+        self.assertEqual(report.mismatched, [])
+        self.assertEqual(len(self.cache), 3)
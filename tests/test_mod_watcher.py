@@ -0,0 +1,73 @@
+import errno
+from pathlib import Path
+import sys
+import time
+from unittest import skipUnless
+from unittest.mock import patch
+
+from f_manager_core.info_cache import InfoCache
+from f_manager_core.mod_index import ModsIndex
+from f_manager_core.mod_watcher import ModsWatcher
+from tests.test_mod import ModsDirTestCase, write_mod
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@skipUnless(sys.platform.startswith("linux"), "inotify is only available on Linux")
+class TestModsWatcher(ModsDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.mods_dir = Path(self.tmp.name).joinpath("mods")
+        self.mods_dir.mkdir()
+        write_mod(self.mods_dir, "flib", "0.12.4")
+
+        self.index = ModsIndex(self.mods_dir)
+        self.cache = InfoCache(path=Path(self.tmp.name).joinpath("info.sqlite3"))
+        self.addCleanup(self.cache.close)
+        self.watcher = ModsWatcher(self.mods_dir, index=self.index, cache=self.cache).start()
+        self.addCleanup(self.watcher.stop)
+
+    def test_add_and_remove(self):
+        path = write_mod(self.mods_dir, "Squeak_Through", "1.8.2")
+
+        self.assertTrue(wait_for(lambda: self.cache.get(path) is not None))
+        with patch("f_manager_core.mod_index.os.scandir") as scandir:
+            self.assertIn("Squeak_Through", self.index)
+        scandir.assert_not_called()
+        self.assertEqual(self.cache.get(path)["name"], "Squeak_Through")
+
+        path.unlink()
+
+        self.assertTrue(wait_for(lambda: "Squeak_Through" not in self.index))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_new_version(self):
+        write_mod(self.mods_dir, "flib", "0.12.9")
+
+        self.assertTrue(wait_for(lambda: self.index.path("flib").name == "flib_0.12.9.zip"))
+        self.mods_dir.joinpath("flib_0.12.4.zip").rename(Path(self.tmp.name).joinpath("old.zip"))
+
+        self.assertTrue(wait_for(lambda: list(self.index.versions("flib")) == ["0.12.9"]))
+
+    def test_stop(self):
+        self.watcher.stop()
+
+        self.assertFalse(self.index.watched)
+        self.assertFalse(self.watcher.running)
+
+    def test_read_error(self):
+        with patch("f_manager_core.mod_watcher.os.read", side_effect=OSError(errno.EIO, "I/O error")):
+            write_mod(self.mods_dir, "Squeak_Through", "1.8.2")
+
+            self.assertTrue(wait_for(lambda: not self.watcher.running))
+
+        # the index isn't updated by events anymore, so it checks the directory mtime again
+        self.assertFalse(self.index.watched)
+        self.assertIn("Squeak_Through", self.index)
@@ -0,0 +1,77 @@
+import json
+from pathlib import Path
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+import zipfile
+
+from f_manager_core.exceptions import BrokenModException
+from f_manager_core.mod_zip import read_info_json
+
+INFO = {"name": "Squeak_Through", "version": "1.8.2", "title": "Squeak Through"}
+
+
+class TestReadInfoJson(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name).joinpath("Squeak_Through_1.8.2.zip")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, files: dict, compression=zipfile.ZIP_DEFLATED, comment: bytes = b"") -> None:
+        with zipfile.ZipFile(self.path, "w", compression) as archive:
+            for name, content in files.items():
+                archive.writestr(name, content)
+            archive.comment = comment
+
+    def test_expected_member(self):
+        self.write(
+            {
+                "Squeak_Through_1.8.2/lib/info.json": "{}",
+                **{f"Squeak_Through_1.8.2/graphics/{n}.png": b"" for n in range(1000)},
+                "Squeak_Through_1.8.2/info.json": json.dumps(INFO),
+            },
+            comment=b"archive comment",
+        )
+
+        with patch("f_manager_core.mod_zip.zipfile.ZipFile") as zip_file:
+            self.assertEqual(read_info_json(self.path, "Squeak_Through", "1.8.2"), INFO)
+        zip_file.assert_not_called()
+
+    def test_shallowest_fallback(self):
+        self.write(
+            {"Squeak_Through/lib/deep/info.json": "{}", "Squeak_Through/info.json": json.dumps(INFO)},
+            compression=zipfile.ZIP_STORED,
+        )
+
+        self.assertEqual(read_info_json(self.path, "Squeak_Through", "1.8.2"), INFO)
+        self.assertEqual(read_info_json(self.path), INFO)
+
+    def test_unsupported_compression(self):
+        self.write({"Squeak_Through_1.8.2/info.json": json.dumps(INFO)}, compression=zipfile.ZIP_BZIP2)
+
+        self.assertEqual(read_info_json(self.path, "Squeak_Through", "1.8.2"), INFO)
+
+    def test_broken(self):
+        self.write({"Squeak_Through_1.8.2/data.lua": ""})
+        with self.assertRaises(BrokenModException):
+            read_info_json(self.path, "Squeak_Through", "1.8.2")
+
+        self.path.write_bytes(b"not a zip")
+        with self.assertRaises(BrokenModException):
+            read_info_json(self.path)
+
+        self.path.write_bytes(b"")
+        with self.assertRaises(BrokenModException):
+            read_info_json(self.path)
+
+    def test_corrupted_member(self):
+        self.write({"Squeak_Through_1.8.2/info.json": json.dumps(INFO)}, compression=zipfile.ZIP_STORED)
+        data = bytearray(self.path.read_bytes())
+        position = data.index(b'"Squeak Through"')
+        data[position + 1] = ord("X")
+        self.path.write_bytes(bytes(data))
+
+        with self.assertRaises(BrokenModException):
+            read_info_json(self.path, "Squeak_Through", "1.8.2")
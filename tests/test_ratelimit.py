@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import TestCase
+
+from f_manager_core.factorio.ratelimit import (
+    AdaptiveRateLimiter,
+    TokenBucket,
+    parse_retry_after,
+)
+
+BUDGETS = {
+    "metadata": {"rate": 100.0, "max_rate": 200.0, "capacity": 5.0},
+    "download": {"rate": 10.0, "max_rate": 10.0, "capacity": 1.0},
+}
+
+
+class TestParseRetryAfter(TestCase):
+    def test_seconds(self):
+        self.assertEqual(parse_retry_after("120"), 120.0)
+
+    def test_date(self):
+        date = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        self.assertAlmostEqual(parse_retry_after(format_datetime(date, usegmt=True)), 30, delta=2)
+
+    def test_invalid(self):
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+
+
+class TestTokenBucket(TestCase):
+    def test_burst(self):
+        bucket = TokenBucket(rate=1000.0, capacity=3)
+
+        waits = [bucket.acquire() for _ in range(4)]
+
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        self.assertGreater(waits[3], 0.0)
+
+    def test_pause(self):
+        bucket = TokenBucket(rate=1000.0, capacity=3)
+
+        bucket.pause(0.05)
+
+        self.assertGreaterEqual(bucket.acquire(), 0.05)
+
+
+class TestAdaptiveRateLimiter(TestCase):
+    def test_throttled_once_per_pause(self):
+        limiter = AdaptiveRateLimiter(BUDGETS)
+
+        limiter.on_throttled("metadata", 0.01)
+        limiter.on_throttled("metadata", 0.01)
+
+        self.assertEqual(limiter.rate("metadata"), 50.0)
+        self.assertEqual(limiter.rate("download"), 10.0)
+
+    def test_recovery(self):
+        limiter = AdaptiveRateLimiter(BUDGETS, increase=60.0)
+
+        limiter.on_throttled("metadata", 0.0)
+        for _ in range(3):
+            limiter.on_success("metadata")
+
+        self.assertEqual(limiter.rate("metadata"), 200.0)
+
+    def test_min_rate(self):
+        limiter = AdaptiveRateLimiter(BUDGETS, min_rate=8.0)
+
+        limiter.on_throttled("download", 0.0)
+
+        self.assertEqual(limiter.rate("download"), 8.0)
@@ -0,0 +1,52 @@
+import copy
+from pathlib import Path
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from f_manager_core.factorio.json_object_types import Result
+from f_manager_core.factorio.snapshot import read_snapshot, write_snapshot
+
+RESULT = {
+    "name": "flib",
+    "created_at": "2020-01-01T00:00:00+00:00",
+    "latest_release": {
+        "download_url": "/download/flib",
+        "file_name": "flib_0.12.9.zip",
+        "info_json": {"factorio_version": "1.1"},
+        "released_at": "2023-05-01T10:00:00+00:00",
+        "version": "0.12.9",
+        "sha1": "",
+    },
+}
+
+
+class TestSnapshot(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name).joinpath("catalog.snapshot")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        write_snapshot(self.path, [Result(copy.deepcopy(RESULT))], tag="2023-05-01")
+
+        results = read_snapshot(self.path, tag="2023-05-01")
+
+        self.assertEqual(results[0].name, "flib")
+        self.assertEqual(results[0].latest_release.released_at.year, 2023)
+        self.assertEqual(read_snapshot(self.path)[0].name, "flib")
+
+    def test_stale(self):
+        write_snapshot(self.path, [Result(copy.deepcopy(RESULT))], tag="2023-05-01")
+
+        self.assertIsNone(read_snapshot(self.path, tag="2023-06-01"))
+        with patch("f_manager_core.factorio.snapshot.schema_hash", return_value=b"\0" * 32):
+            self.assertIsNone(read_snapshot(self.path))
+
+    def test_missing_or_broken(self):
+        self.assertIsNone(read_snapshot(self.path))
+
+        self.path.write_bytes(b"not a snapshot")
+        self.assertIsNone(read_snapshot(self.path))
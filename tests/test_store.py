@@ -0,0 +1,76 @@
+import hashlib
+import os
+from pathlib import Path
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from f_manager_core.factorio.store import BlobStore
+from f_manager_core.info_cache import Sha1Cache
+
+
+class TestBlobStore(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.store = BlobStore(root.joinpath("store"))
+        self.mods_dir = root.joinpath("mods")
+        self.mods_dir.mkdir()
+        self.cache = Sha1Cache(root.joinpath("sha1.sqlite3"))
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def add(self, name: str, content: bytes) -> str:
+        sha1 = hashlib.sha1(content).hexdigest()
+        file = Path(self.tmp.name).joinpath(name)
+        file.write_bytes(content)
+        self.store.add(file, sha1)
+        return sha1
+
+    def test_add_and_materialize(self):
+        sha1 = self.add("mod_1.0.0.zip", b"content")
+
+        self.assertIn(sha1, self.store)
+        for method in ("hardlink", "symlink", "copy"):
+            with self.subTest(method=method):
+                destination = self.mods_dir.joinpath(f"{method}_1.0.0.zip")
+                self.assertEqual(self.store.materialize(sha1, destination, [method]), method)
+                self.assertEqual(destination.read_bytes(), b"content")
+
+    def test_materialize_unknown(self):
+        with self.assertRaises(KeyError):
+            self.store.materialize("0" * 40, self.mods_dir.joinpath("mod.zip"))
+
+    def test_gc(self):
+        linked = self.add("linked_1.0.0.zip", b"linked")
+        symlinked = self.add("symlinked_1.0.0.zip", b"symlinked")
+        relative = self.add("relative_1.0.0.zip", b"relative")
+        copied = self.add("copied_1.0.0.zip", b"copied")
+        impostor = self.add("impostor_1.0.0.zip", b"impostor")
+        self.store.materialize(linked, self.mods_dir.joinpath("linked_1.0.0.zip"), ["hardlink"])
+        self.store.materialize(symlinked, self.mods_dir.joinpath("other_name.zip"), ["symlink"])
+        # a copy shares nothing with the stored file, like a reflink
+        self.store.materialize(copied, self.mods_dir.joinpath("copied_1.0.0.zip"), ["copy"])
+        self.mods_dir.joinpath("relative_1.0.0.zip").symlink_to(
+            os.path.relpath(self.store.get(relative), self.mods_dir)
+        )
+        # an unrelated file with the same name and size doesn't keep the stored one alive
+        self.mods_dir.joinpath("impostor_1.0.0.zip").write_bytes(b"IMPOSTOR")
+        self.mods_dir.joinpath("dangling_1.0.0.zip").symlink_to("missing.zip")
+
+        self.assertEqual(self.store.gc([self.mods_dir], cache=self.cache), [impostor])
+        self.assertEqual(set(self.store), {linked, symlinked, relative, copied})
+
+    def test_gc_hashes_once(self):
+        sha1 = self.add("copied_1.0.0.zip", b"copied")
+        self.store.materialize(sha1, self.mods_dir.joinpath("copied_1.0.0.zip"), ["copy"])
+        self.assertEqual(self.store.gc([self.mods_dir], cache=self.cache), [])
+
+        with patch("f_manager_core.factorio.store.sha1_file") as sha1_file:
+            self.assertEqual(self.store.gc([self.mods_dir], cache=self.cache), [])
+
+        sha1_file.assert_not_called()
+        self.mods_dir.joinpath("copied_1.0.0.zip").unlink()
+        self.assertEqual(self.store.gc([self.mods_dir], cache=self.cache), [sha1])
@@ -0,0 +1,136 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+import requests
+from urllib3.exceptions import ProtocolError
+
+from f_manager_core.factorio.streaming import copy_response, iter_json_array, sha1_file
+
+
+def split(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def make_response(body: bytes, content_length=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(body)
+    if content_length is not None:
+        response.headers["Content-Length"] = str(content_length)
+    return response
+
+
+class TestIterJsonArray(TestCase):
+    document = {
+        "pagination": {"count": 3, "links": {"next": None}, "page": 1},
+        "results": [
+            {"name": "Squeak Through", "downloads_count": 12345, "score": 1.5},
+            {"name": "Krastorio2", "title": "Кrastorio 2 ✓", "tags": [{"id": 1}, []]},
+            {"name": "flib", "summary": "escaped \" quote, comma ] and brace }"},
+        ],
+        "trailing": 1234567,
+    }
+
+    def test_any_chunk_size(self):
+        data = json.dumps(self.document, ensure_ascii=False, indent=2).encode()
+
+        for size in (1, 2, 3, 7, 64, len(data)):
+            with self.subTest(size=size):
+                self.assertEqual(
+                    list(iter_json_array(split(data, size))), self.document["results"]
+                )
+
+    def test_results_not_first(self):
+        data = json.dumps({"a": [1, {"results": []}], "results": [1, 22, 333]}).encode()
+
+        self.assertEqual(list(iter_json_array(split(data, 1))), [1, 22, 333])
+
+    def test_numbers_split_anywhere(self):
+        numbers = [1.5, 1e5, -2.5e-3, 10, -7, 0.25, 3e21, 123456.789]
+        data = b'{"skipped": 1.5E+3, "results": [1.5, 1E5, -2.5E-3, 10, -7, 0.25, 3e+21, 123456.789]}'
+
+        # every split point of every number, including right after "." or "e"
+        for cut in range(1, len(data)):
+            with self.subTest(cut=cut):
+                self.assertEqual(list(iter_json_array([data[:cut], data[cut:]])), numbers)
+        for size in range(1, 8):
+            with self.subTest(size=size):
+                self.assertEqual(list(iter_json_array(split(data, size))), numbers)
+
+    def test_empty(self):
+        self.assertEqual(list(iter_json_array([b'{"results": []}'])), [])
+        self.assertEqual(list(iter_json_array([b"{}"])), [])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b'{"results": [1, 2']))
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b"[1, 2]"]))
+
+
+class TestSha1File(TestCase):
+    def test_matches_hashlib(self):
+        data = bytes(range(256)) * 1000
+        with tempfile.NamedTemporaryFile() as file:
+            file.write(data)
+            file.flush()
+
+            self.assertEqual(sha1_file(file.name, buffer_size=4096), hashlib.sha1(data).hexdigest())
+
+
+class TestCopyResponse(TestCase):
+    data = os.urandom(100 * 1024 + 7)
+
+    def test_copy_and_hash(self):
+        hasher = hashlib.sha1()
+        file = io.BytesIO()
+
+        written = copy_response(make_response(self.data), file, hasher=hasher, buffer_size=4096)
+
+        self.assertEqual(written, len(self.data))
+        self.assertEqual(file.getvalue(), self.data)
+        self.assertEqual(hasher.hexdigest(), hashlib.sha1(self.data).hexdigest())
+
+    def test_preallocate(self):
+        with tempfile.TemporaryFile() as file:
+            response = make_response(self.data, content_length=len(self.data))
+
+            written = copy_response(response, file, buffer_size=4096, preallocate_file=True)
+
+            self.assertEqual(written, len(self.data))
+            self.assertEqual(os.fstat(file.fileno()).st_size, len(self.data))
+            file.seek(0)
+            self.assertEqual(file.read(), self.data)
+
+    def test_short_body_truncated(self):
+        with tempfile.TemporaryFile() as file:
+            file.write(b"resumed")
+            response = make_response(self.data, content_length=len(self.data) + 5000)
+
+            written = copy_response(response, file, buffer_size=4096, preallocate_file=True)
+
+            # space reserved for the missing part of the body is given back
+            self.assertEqual(written, len(self.data))
+            self.assertEqual(os.fstat(file.fileno()).st_size, len(b"resumed") + len(self.data))
+            file.seek(0)
+            self.assertEqual(file.read(), b"resumed" + self.data)
+
+    def test_broken_connection(self):
+        class BrokenRaw(io.BytesIO):
+            def readinto(self, buffer):
+                if self.tell() >= 8192:
+                    raise ProtocolError("Connection broken: IncompleteRead")
+                return super().readinto(buffer)
+
+        response = make_response(b"", content_length=len(self.data))
+        response.raw = BrokenRaw(self.data)
+        with tempfile.TemporaryFile() as file:
+            with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+                copy_response(response, file, buffer_size=4096, preallocate_file=True)
+
+            # the preallocated tail isn't left behind
+            self.assertEqual(os.fstat(file.fileno()).st_size, 8192)